@@ -2,6 +2,7 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    Tuple,
     Type,
 )
 
@@ -92,16 +93,55 @@ class BaseCommand(CommandAPI[TCommandPayload]):
     serialization_codec: SerializationCodecAPI[TCommandPayload]
     compression_codec: CompressionCodecAPI = SnappyCodec()
 
-    payload: TCommandPayload
+    _payload: TCommandPayload
+    _encoded_payload: bytes = None
 
     def __init__(self, payload: TCommandPayload) -> None:
-        self.payload = payload
+        self._payload = payload
+
+    @classmethod
+    def from_encoded_payload(cls: Type[TCommand], encoded_payload: bytes) -> TCommand:
+        """
+        Create a command from its serialized (but uncompressed) payload, which is only
+        decoded once the ``payload`` is accessed.
+        """
+        cmd = cls.__new__(cls)
+        cmd._encoded_payload = encoded_payload
+        return cmd
+
+    @property
+    def payload(self) -> TCommandPayload:
+        try:
+            return self._payload
+        except AttributeError:
+            self._payload = self._decode_payload(self._encoded_payload)
+            return self._payload
+
+    @payload.setter
+    def payload(self, value: TCommandPayload) -> None:
+        self._payload = value
+        self._encoded_payload = None
+
+    @property
+    def encoded_payload(self) -> bytes:
+        """
+        The serialized (but uncompressed) payload, as it is sent over the wire.
+        """
+        if self._encoded_payload is None:
+            self._encoded_payload = self.serialization_codec.encode(self.payload)
+        return self._encoded_payload
+
+    def __reduce__(self) -> Tuple[Callable[[bytes], 'BaseCommand[TCommandPayload]'], Tuple[bytes]]:
+        # Commands are pickled whenever they are passed around on the event bus. Shipping the
+        # encoded payload is much cheaper than pickling the decoded one, and the receiving
+        # process only decodes it if it actually looks at it.
+        return (self.__class__.from_encoded_payload, (self.encoded_payload,))
 
     def __repr__(self) -> str:
         return f"{self.__class__}(payload={self.payload})"
 
     def encode(self, cmd_id: int, snappy_support: bool) -> MessageAPI:
-        raw_payload_data = self.serialization_codec.encode(self.payload)
+        raw_payload_data = self.encoded_payload
 
         if snappy_support:
             payload_data = self.compression_codec.compress(raw_payload_data)
@@ -127,11 +167,16 @@ class BaseCommand(CommandAPI[TCommandPayload]):
         else:
             payload_data = message.encoded_payload
 
+        cmd = cls(cls._decode_payload(payload_data))
+        cmd._encoded_payload = payload_data
+        return cmd
+
+    @classmethod
+    def _decode_payload(cls, payload_data: bytes) -> TCommandPayload:
         try:
-            payload = cls.serialization_codec.decode(payload_data)
+            return cls.serialization_codec.decode(payload_data)
         except rlp.exceptions.DeserializationError as err:
             raise rlp.exceptions.DeserializationError(
                 f"DeserializationError for {cls}",
                 err.serial,
             ) from err
-        return cls(payload)
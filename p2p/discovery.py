@@ -85,6 +85,7 @@ from p2p.exceptions import (
 )
 from p2p.kademlia import (
     Address, Node, check_relayed_addr, create_stub_enr, sort_by_distance, KademliaRoutingTable)
+from p2p.logging import SampledLogger
 from p2p._utils import get_logger, aclosing
 from p2p import trio_utils
 
@@ -147,6 +148,8 @@ class DiscoveryService(Service):
                  enr_field_providers: Sequence[ENR_FieldProvider] = tuple(),
                  ) -> None:
         self.logger = get_logger('p2p.discovery.DiscoveryService')
+        # For the logs of every message we receive
+        self.sampled_logger = SampledLogger(self.logger)
         self.privkey = privkey
         self._event_bus = event_bus
         self.enr_response_channels = ExpectedResponseChannels[Tuple[ENRAPI, Hash32]]()
@@ -745,7 +748,7 @@ class DiscoveryService(Service):
         datagram, (ip_address, port) = await self.socket.recvfrom(
             constants.DISCOVERY_DATAGRAM_BUFFER_SIZE)
         address = Address(ip_address, port, port)
-        self.logger.debug2("Received datagram from %s", address)
+        self.sampled_logger.debug2("Received datagram from %s", address)
         # Run the msg handler in the background so that we can move on to the next received
         # message.
         self.manager.run_task(self.handle_msg, address, datagram)
@@ -764,7 +767,7 @@ class DiscoveryService(Service):
             return
 
         node = Node(self.lookup_and_maybe_update_enr(remote_pubkey, address))
-        self.logger.debug2("Received %s from %s with payload: %s", cmd.name, node, payload)
+        self.sampled_logger.debug2("Received %s from %s with payload: %s", cmd.name, node, payload)
         handler = self._get_handler(cmd)
         await handler(node, payload, message_hash)
 
@@ -20,7 +20,7 @@ from p2p.abc import (
     ProtocolAPI,
 )
 from p2p.stats.ema import EMA
-from p2p.stats.percentile import Percentile
+from p2p.stats.percentile import BasePercentile
 from p2p.stats.stddev import StandardDeviation
 
 from .typing import (
@@ -61,7 +61,7 @@ class PerformanceAPI(ABC):
 
     response_quality_ema: EMA
     round_trip_ema: EMA
-    round_trip_99th: Percentile
+    round_trip_99th: BasePercentile
     round_trip_stddev: StandardDeviation
     items_per_second_ema: EMA
 
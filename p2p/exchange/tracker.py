@@ -1,8 +1,9 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import Optional, Type
 
 from p2p.stats.ema import EMA
-from p2p.stats.percentile import Percentile
+from p2p.stats.percentile import BasePercentile
+from p2p.stats.sketch import SketchPercentile
 from p2p.stats.stddev import StandardDeviation
 from p2p._utils import get_logger
 
@@ -12,6 +13,9 @@ from .typing import TRequestCommand, TResult
 
 
 class BasePerformanceTracker(PerformanceTrackerAPI[TRequestCommand, TResult]):
+    # Trackers are updated on every response from every peer, so use a percentile with O(1)
+    # updates by default. Set to :class:`~p2p.stats.percentile.Percentile` for exact values.
+    percentile_class: Type[BasePercentile] = SketchPercentile
 
     def __init__(self) -> None:
         self.logger = get_logger('trinity.protocol.common.trackers.PerformanceTracker')
@@ -28,7 +32,7 @@ class BasePerformanceTracker(PerformanceTrackerAPI[TRequestCommand, TResult]):
 
         # Metrics for the round trip request/response time
         self.round_trip_ema = EMA(initial_value=ROUND_TRIP_TIMEOUT, smoothing_factor=0.05)
-        self.round_trip_99th = Percentile(percentile=0.99, window_size=200)
+        self.round_trip_99th = self.percentile_class(percentile=0.99, window_size=200)
         self.round_trip_stddev = StandardDeviation(window_size=200)
 
         # an EMA of the items per second
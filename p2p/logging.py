@@ -1,5 +1,14 @@
+import logging
+import time
 from typing import (
     Any,
+    Dict,
+    Tuple,
+)
+
+from eth_utils import (
+    DEBUG2_LEVEL_NUM,
+    ExtendedDebugLogger,
 )
 
 from p2p._utils import trim_middle
@@ -8,3 +17,59 @@ from p2p.constants import LONGEST_ALLOWED_LOG_STRING
 
 def loggable(log_object: Any) -> str:
     return trim_middle(str(log_object), LONGEST_ALLOWED_LOG_STRING)
+
+
+class SampledLogger:
+    """
+    Wrap a logger for call sites that may log many times per second, like the handling of
+    every incoming message.
+
+    Each message (format string) is logged at most ``max_per_interval`` times every
+    ``interval`` seconds. The number of records dropped in an interval is added to the first
+    record logged after it. Whether the level is enabled is checked before anything else,
+    so a disabled call costs about as much as on the wrapped logger.
+    """
+
+    def __init__(self,
+                 logger: ExtendedDebugLogger,
+                 max_per_interval: int = 10,
+                 interval: float = 1.0) -> None:
+        self.logger = logger
+        self._max_per_interval = max_per_interval
+        self._interval = interval
+        # message -> (interval start, records logged, records dropped)
+        self._counts: Dict[str, Tuple[float, int, int]] = {}
+
+    def debug2(self, msg: str, *args: Any) -> None:
+        if self.logger.show_debug2:
+            self._log(DEBUG2_LEVEL_NUM, msg, args)
+
+    def debug(self, msg: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, msg, args)
+
+    def info(self, msg: str, *args: Any) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, msg, args)
+
+    def _log(self, level: int, msg: str, args: Tuple[Any, ...]) -> None:
+        now = time.monotonic()
+        try:
+            started_at, logged, dropped = self._counts[msg]
+        except KeyError:
+            started_at, logged, dropped = now, 0, 0
+
+        if now - started_at >= self._interval:
+            if dropped:
+                self.logger.log(level, msg + " (%d similar records dropped)", *args, dropped)
+                self._counts[msg] = (now, 1, 0)
+                return
+            started_at, logged, dropped = now, 0, 0
+
+        if logged < self._max_per_interval:
+            self.logger.log(level, msg, *args)
+            logged += 1
+        else:
+            dropped += 1
+
+        self._counts[msg] = (started_at, logged, dropped)
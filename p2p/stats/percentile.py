@@ -1,13 +1,34 @@
+from abc import ABC, abstractmethod
 import bisect
 import collections
 import math
 from typing import List, Union, Deque
 
 
-class Percentile:
+class BasePercentile(ABC):
+    percentile: float
+    window_size: int
+
+    @property
+    @abstractmethod
+    def value(self) -> float:
+        """
+        The current approximation for the tracked percentile.
+        """
+        ...
+
+    @abstractmethod
+    def update(self, value: Union[int, float]) -> None:
+        ...
+
+
+class Percentile(BasePercentile):
     """
     Track a specific percentile across a window of recent data.
 
+    The window is kept sorted, so every update costs O(window_size). See
+    :class:`~p2p.stats.sketch.SketchPercentile` for an approximation with O(1) updates.
+
     https://en.wikipedia.org/wiki/Percentile
     """
     def __init__(self, percentile: float, window_size: int) -> None:
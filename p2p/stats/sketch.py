@@ -0,0 +1,143 @@
+import math
+from typing import Dict, Optional, Union
+
+from .percentile import BasePercentile
+
+
+# Values below this are counted as zero, as their logarithm can't be bucketed meaningfully
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class DDSketch:
+    """
+    A mergeable sketch of the distribution of a stream of non-negative values, which answers
+    quantile queries with a bounded relative error.
+
+    Values are counted in logarithmically sized buckets, so updates are O(1) and memory only
+    depends on the range of the values, up to ``max_buckets``, beyond which the lowest buckets
+    are collapsed.
+
+    https://arxiv.org/abs/1908.10693
+    """
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Invalid: relative_accuracy must be in the range (0, 1)")
+        if max_buckets < 1:
+            raise ValueError("Invalid: max_buckets must be a positive integer")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+
+        self._buckets: Dict[int, int] = {}
+        # Values that fall below this key are counted in its bucket, once buckets got collapsed
+        self._min_key: Optional[int] = None
+        self._zero_count = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, value: Union[int, float]) -> None:
+        if value < 0:
+            raise ValueError(f"Invalid: DDSketch only tracks non-negative values: got {value}")
+
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+        if value < MIN_INDEXABLE_VALUE:
+            self._zero_count += 1
+            return
+
+        key = math.ceil(math.log(value) / self._log_gamma)
+        if self._min_key is not None and key < self._min_key:
+            key = self._min_key
+        self._buckets[key] = self._buckets.get(key, 0) + 1
+
+        if len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def merge(self, other: 'DDSketch') -> None:
+        """
+        Add all values tracked by ``other`` to this sketch.
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with a different relative accuracy")
+
+        for key, count in other._buckets.items():
+            if self._min_key is not None and key < self._min_key:
+                key = self._min_key
+            self._buckets[key] = self._buckets.get(key, 0) + count
+        self._zero_count += other._zero_count
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+        while len(self._buckets) > self.max_buckets:
+            self._collapse()
+
+    def quantile(self, quantile: float) -> float:
+        if quantile < 0 or quantile > 1:
+            raise ValueError("Invalid: quantile must be in the range [0, 1]")
+        if not self.count:
+            raise ValueError("No data for quantile calculation")
+
+        rank = quantile * (self.count - 1)
+        if rank < self._zero_count:
+            return 0.0
+
+        seen = self._zero_count
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                # The value in the middle of the bucket, relatively to its bounds
+                estimate = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def _collapse(self) -> None:
+        lowest = min(self._buckets)
+        count = self._buckets.pop(lowest)
+        next_lowest = min(self._buckets)
+        self._buckets[next_lowest] += count
+        self._min_key = next_lowest
+
+
+class SketchPercentile(BasePercentile):
+    """
+    Track a specific percentile across a window of recent data, with a bounded relative error.
+
+    Unlike :class:`~p2p.stats.percentile.Percentile`, the window isn't kept sorted. Values are
+    added to a :class:`DDSketch`, which is replaced by a new one once it tracks ``window_size``
+    values, so the percentile is computed over the last ``window_size`` to ``2 * window_size``
+    values.
+    """
+    def __init__(self,
+                 percentile: float,
+                 window_size: int,
+                 relative_accuracy: float = 0.01) -> None:
+        if percentile < 0 or percentile > 1:
+            raise ValueError("Invalid: percentile must be in the range [0, 1]")
+        self.percentile = percentile
+        self.window_size = window_size
+        self.relative_accuracy = relative_accuracy
+        self._previous: Optional[DDSketch] = None
+        self._current = DDSketch(relative_accuracy)
+
+    @property
+    def value(self) -> float:
+        if self._previous is None:
+            return self._current.quantile(self.percentile)
+
+        sketch = DDSketch(self.relative_accuracy)
+        sketch.merge(self._previous)
+        sketch.merge(self._current)
+        return sketch.quantile(self.percentile)
+
+    def update(self, value: Union[int, float]) -> None:
+        if self._current.count >= self.window_size:
+            self._previous = self._current
+            self._current = DDSketch(self.relative_accuracy)
+        self._current.update(value)
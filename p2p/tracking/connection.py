@@ -75,6 +75,12 @@ class BaseConnectionTracker(ABC):
     async def get_blacklisted(self) -> Tuple[NodeID, ...]:
         ...
 
+    def flush(self) -> None:
+        """
+        Persist any blacklist changes that are buffered in memory.
+        """
+        pass
+
 
 class NoopConnectionTracker(BaseConnectionTracker):
     def record_blacklist(self, remote: NodeAPI, timeout_seconds: int, reason: str) -> None:
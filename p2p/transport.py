@@ -47,6 +47,7 @@ from p2p.exceptions import (
     UnreachablePeer,
 )
 from p2p.kademlia import Address, Node
+from p2p.logging import SampledLogger
 from p2p.message import Message
 from p2p.session import Session
 
@@ -64,6 +65,7 @@ def _decode_header_data(data: ByteString) -> Tuple[int, int]:
 
 class Transport(TransportAPI):
     logger = get_extended_debug_logger('p2p.transport.Transport')
+    sampled_logger = SampledLogger(logger)
 
     def __init__(self,
                  remote: NodeAPI,
@@ -233,7 +235,7 @@ class Transport(TransportAPI):
         return self._private_key.public_key
 
     async def read(self, n: int) -> bytes:
-        self.logger.debug2("Waiting for %s bytes from %s", n, self.remote)
+        self.sampled_logger.debug2("Waiting for %s bytes from %s", n, self.remote)
         try:
             return await asyncio.wait_for(self._reader.readexactly(n), timeout=CONN_IDLE_TIMEOUT)
         except (asyncio.IncompleteReadError, ConnectionResetError, BrokenPipeError) as err:
@@ -0,0 +1,130 @@
+import argparse
+import logging
+import multiprocessing
+import os
+import pathlib
+import signal
+import sys
+import tempfile
+import time
+
+from eth.db.backends.level import LevelDB
+from eth.db.header import HeaderDB
+from eth.rlp.headers import BlockHeader
+
+from trinity.db.eth1.header import AsyncHeaderDB
+from trinity.db.manager import (
+    DBManager,
+    DBClient,
+)
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+HEADER_DB_CLASSES = {
+    'py-evm': HeaderDB,
+    'trinity': AsyncHeaderDB,
+}
+
+
+def mk_header_chain(length):
+    genesis = BlockHeader(difficulty=100, block_number=0, gas_limit=3000000, timestamp=0)
+    headers = [genesis]
+    parent = genesis
+    for _ in range(length):
+        header = BlockHeader(
+            difficulty=100,
+            block_number=parent.block_number + 1,
+            parent_hash=parent.hash,
+            gas_limit=3000000,
+            timestamp=parent.timestamp + 1,
+        )
+        headers.append(header)
+        parent = header
+    return headers
+
+
+def run_server(ipc_path):
+    with tempfile.TemporaryDirectory() as db_path:
+        db = LevelDB(db_path=db_path)
+        manager = DBManager(db)
+
+        with manager.run(ipc_path):
+            try:
+                manager.wait_stopped()
+            except KeyboardInterrupt:
+                pass
+
+        ipc_path.unlink()
+
+
+def run_client(ipc_path, header_db_name, num_headers, segment_size):
+    genesis, *headers = mk_header_chain(num_headers)
+
+    db_client = DBClient.connect(ipc_path)
+    headerdb = HEADER_DB_CLASSES[header_db_name](db_client)
+    headerdb.persist_header(genesis)
+
+    start = time.perf_counter()
+    for index in range(0, num_headers, segment_size):
+        headerdb.persist_header_chain(headers[index:index + segment_size])
+    end = time.perf_counter()
+    duration = end - start
+
+    logger.info(
+        "%s: %d headers per second",
+        header_db_name,
+        num_headers / duration,
+    )
+
+
+parser = argparse.ArgumentParser(description='Header Persistence Benchmark')
+parser.add_argument(
+    '--num-headers',
+    type=int,
+    required=False,
+    default=19200,
+    help=(
+        "Number of headers that should be persisted by each header database"
+    ),
+)
+parser.add_argument(
+    '--segment-size',
+    type=int,
+    required=False,
+    default=192,
+    help=(
+        "Number of headers that should be persisted per call to persist_header_chain"
+    ),
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    logger.info(
+        "Running header persistence benchmark:\n - %d headers\n - %d headers per segment\n*****************************\n",  # noqa: E501
+        args.num_headers,
+        args.segment_size,
+    )
+    for header_db_name in HEADER_DB_CLASSES:
+        with tempfile.TemporaryDirectory() as ipc_base_dir:
+            ipc_path = pathlib.Path(ipc_base_dir) / 'db.ipc'
+
+            server = multiprocessing.Process(target=run_server, args=[ipc_path])
+            client = multiprocessing.Process(
+                target=run_client,
+                args=(ipc_path, header_db_name, args.num_headers, args.segment_size),
+            )
+            server.start()
+            client.start()
+            client.join(600)
+
+            os.kill(server.pid, signal.SIGINT)
+            server.join(1)
+    logger.info('\n')
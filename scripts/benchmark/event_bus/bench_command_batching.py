@@ -0,0 +1,120 @@
+import argparse
+import asyncio
+import logging
+import pathlib
+import sys
+import tempfile
+import time
+
+from lahja import (
+    AsyncioEndpoint,
+    ConnectionConfig,
+)
+
+from p2p.tools.factories import SessionFactory
+
+from trinity.constants import (
+    NETWORKING_EVENTBUS_ENDPOINT,
+    TO_NETWORKING_BROADCAST_CONFIG,
+)
+from trinity.protocol.common.events import SendCommandsBatchEvent
+from trinity.protocol.common.peer_pool_event_bus import OutboundCommandBatcher
+from trinity.protocol.eth.commands import NewBlockHashes
+from trinity.protocol.eth.events import SendNewBlockHashesEvent
+from trinity.protocol.eth.payloads import NewBlockHash
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def make_command(number):
+    return NewBlockHashes((NewBlockHash(number.to_bytes(32, 'big'), number),))
+
+
+async def run_benchmark(ipc_path, num_commands, num_peers, batched):
+    networking_config = ConnectionConfig(NETWORKING_EVENTBUS_ENDPOINT, ipc_path)
+    sessions = SessionFactory.create_batch(num_peers)
+
+    async with AsyncioEndpoint.serve(networking_config) as networking:
+        async with AsyncioEndpoint('proxy').run() as proxy:
+            await proxy.connect_to_endpoints(networking_config)
+
+            received = 0
+            num_events = 0
+            all_received = asyncio.Event()
+
+            def on_commands(count):
+                nonlocal received, num_events
+                received += count
+                num_events += 1
+                if received >= num_commands:
+                    all_received.set()
+
+            if batched:
+                networking.subscribe(
+                    SendCommandsBatchEvent,
+                    lambda event: on_commands(len(event.commands)),
+                )
+                event_type = SendCommandsBatchEvent
+            else:
+                networking.subscribe(SendNewBlockHashesEvent, lambda event: on_commands(1))
+                event_type = SendNewBlockHashesEvent
+            await proxy.wait_until_endpoint_subscribed_to(NETWORKING_EVENTBUS_ENDPOINT, event_type)
+
+            commands = [make_command(number) for number in range(num_commands)]
+            batcher = OutboundCommandBatcher(proxy, TO_NETWORKING_BROADCAST_CONFIG)
+
+            start = time.perf_counter()
+            for number, command in enumerate(commands):
+                session = sessions[number % num_peers]
+                if batched:
+                    batcher.send(session, command)
+                else:
+                    proxy.broadcast_nowait(
+                        SendNewBlockHashesEvent(session, command),
+                        TO_NETWORKING_BROADCAST_CONFIG,
+                    )
+                if number % num_peers == num_peers - 1:
+                    # Yield to the event loop, as a broadcast to all peers would
+                    await asyncio.sleep(0)
+            await all_received.wait()
+            duration = time.perf_counter() - start
+
+    logger.info(
+        "%s: %d commands/s, %d events/s (%d events for %d commands)",
+        "Batched" if batched else "Unbatched",
+        num_commands / duration,
+        num_events / duration,
+        num_events,
+        num_commands,
+    )
+
+
+parser = argparse.ArgumentParser(description='Outbound peer command batching benchmark')
+parser.add_argument(
+    '--num-commands',
+    type=int,
+    required=False,
+    default=20000,
+    help="Number of commands sent from the proxy endpoint to the networking endpoint",
+)
+parser.add_argument(
+    '--num-peers',
+    type=int,
+    required=False,
+    default=50,
+    help="Number of peers each round of commands is sent to",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as ipc_base_dir:
+        for batched in (False, True):
+            ipc_path = pathlib.Path(ipc_base_dir) / f'networking-{batched}.ipc'
+            asyncio.run(run_benchmark(ipc_path, args.num_commands, args.num_peers, batched))
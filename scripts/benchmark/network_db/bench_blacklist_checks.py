@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import datetime
+import logging
+import os
+import pathlib
+import random
+import sys
+import tempfile
+import time
+
+from eth_utils import to_hex
+
+from trinity.components.builtin.network_db.connection.tracker import (
+    BlacklistRecord,
+    SQLiteConnectionTracker,
+)
+from trinity.db.orm import get_tracking_database
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+def populate_database(db_path, num_entries):
+    session = get_tracking_database(db_path)
+    now = datetime.datetime.utcnow()
+    node_ids = tuple(os.urandom(32) for _ in range(num_entries))
+    session.bulk_save_objects(
+        BlacklistRecord(
+            node_id=to_hex(node_id),
+            # about a tenth of the records are expired already
+            expires_at=now + datetime.timedelta(seconds=random.randint(-360, 3600)),
+            reason='benchmark',
+            error_count=1,
+        )
+        for node_id in node_ids
+    )
+    session.commit()
+    return node_ids
+
+
+def report(name, num_checks, duration):
+    logger.info(
+        "%s: %.2f us/check (%d checks/s)",
+        name,
+        duration / num_checks * 1e6,
+        num_checks / duration,
+    )
+
+
+async def run_benchmark(db_path, num_entries, num_checks):
+    node_ids = populate_database(db_path, num_entries)
+    # Half of the checked peers are blacklisted, the other half are unknown
+    checked_ids = tuple(
+        random.choice(node_ids) if number % 2 else os.urandom(32)
+        for number in range(num_checks)
+    )
+
+    start = time.perf_counter()
+    tracker = SQLiteConnectionTracker(get_tracking_database(db_path))
+    logger.info(
+        "Loaded %d blacklist records in %.2fs",
+        num_entries,
+        time.perf_counter() - start,
+    )
+
+    start = time.perf_counter()
+    for node_id in checked_ids:
+        tracker.is_blacklisted(node_id)
+    report("In-memory index", num_checks, time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(num_checks):
+        # The request made by the peer pool for every round of candidates
+        await tracker.get_blacklisted()
+    report("In-memory get_blacklisted", num_checks, time.perf_counter() - start)
+
+    session = tracker.session
+    start = time.perf_counter()
+    for node_id in checked_ids:
+        now = datetime.datetime.utcnow()
+        session.query(BlacklistRecord).filter(
+            BlacklistRecord.node_id == to_hex(node_id),
+            BlacklistRecord.expires_at > now,
+        ).first()
+    report("SQLite query", num_checks, time.perf_counter() - start)
+
+    # Querying the whole blacklist is slow, so only do it a few times
+    num_requests = max(1, num_checks // 100)
+    start = time.perf_counter()
+    for _ in range(num_requests):
+        now = datetime.datetime.utcnow()
+        tuple(session.query(BlacklistRecord.node_id).filter(BlacklistRecord.expires_at > now))
+    report("SQLite get_blacklisted", num_requests, time.perf_counter() - start)
+
+
+parser = argparse.ArgumentParser(description='Blacklist check latency benchmark')
+parser.add_argument(
+    '--num-entries',
+    type=int,
+    required=False,
+    default=100000,
+    help="Number of blacklist records in the database",
+)
+parser.add_argument(
+    '--num-checks',
+    type=int,
+    required=False,
+    default=1000,
+    help="Number of peers checked against the blacklist",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as base_dir:
+        db_path = pathlib.Path(base_dir) / 'network.sqlite3'
+        asyncio.run(run_benchmark(db_path, args.num_entries, args.num_checks))
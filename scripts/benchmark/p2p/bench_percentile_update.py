@@ -0,0 +1,78 @@
+import argparse
+import logging
+import random
+import sys
+import time
+
+from p2p.stats.percentile import Percentile
+from p2p.stats.sketch import SketchPercentile
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+PERCENTILE_CLASSES = (Percentile, SketchPercentile)
+
+
+def run_benchmark(percentile_class, window_size, samples_per_second, duration):
+    # Round trip times, in seconds
+    samples = [random.lognormvariate(-2, 1) for _ in range(samples_per_second * duration)]
+    percentile = percentile_class(percentile=0.99, window_size=window_size)
+
+    start = time.perf_counter()
+    for sample in samples:
+        percentile.update(sample)
+    update_duration = time.perf_counter() - start
+
+    start = time.perf_counter()
+    value = percentile.value
+    value_duration = time.perf_counter() - start
+
+    logger.info(
+        "%s(window_size=%d): %.2f us/update, %.2f%% of a core at %d samples/s, "
+        "value %.4f computed in %.1f us",
+        percentile_class.__name__,
+        window_size,
+        update_duration / len(samples) * 1e6,
+        update_duration / duration * 100,
+        samples_per_second,
+        value,
+        value_duration * 1e6,
+    )
+
+
+parser = argparse.ArgumentParser(description='Percentile update benchmark')
+parser.add_argument(
+    '--samples-per-second',
+    type=int,
+    required=False,
+    default=10000,
+    help="Number of samples recorded every second",
+)
+parser.add_argument(
+    '--duration',
+    type=int,
+    required=False,
+    default=10,
+    help="Number of seconds worth of samples to record",
+)
+parser.add_argument(
+    '--window-sizes',
+    type=int,
+    nargs='+',
+    required=False,
+    default=(200, 10000, 100000),
+    help="Window sizes of the tracked percentiles",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    for window_size in args.window_sizes:
+        for percentile_class in PERCENTILE_CLASSES:
+            run_benchmark(percentile_class, window_size, args.samples_per_second, args.duration)
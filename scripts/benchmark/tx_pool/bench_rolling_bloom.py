@@ -0,0 +1,122 @@
+import argparse
+import collections
+import logging
+import os
+import sys
+import time
+
+from trinity._utils.bloom import RollingBloom
+
+logger = logging.getLogger('trinity.scripts.benchmark')
+logger.setLevel(logging.INFO)
+
+handler_stream = logging.StreamHandler(sys.stderr)
+handler_stream.setLevel(logging.INFO)
+
+logger.addHandler(handler_stream)
+
+
+# The configuration used by the TxPool
+GENERATION_SIZE = 100000
+MAX_GENERATIONS = 144
+
+
+class LegacyRollingBloom:
+    """
+    The previous implementation, which keeps one ``bloom_filter.BloomFilter`` per generation.
+    """
+    def __init__(self, generation_size, max_generations):
+        from bloom_filter import BloomFilter
+        self._bloom_class = BloomFilter
+        self._max_bloom_elements = generation_size
+        self._max_history = max_generations - 1
+        self._history = collections.deque()
+        self._active = BloomFilter(max_elements=generation_size)
+        self._items_in_active = 0
+
+    def add(self, key):
+        if self._items_in_active >= self._max_bloom_elements:
+            self._history.appendleft(self._active)
+            self._active = self._bloom_class(max_elements=self._max_bloom_elements)
+            self._items_in_active = 0
+            while len(self._history) > self._max_history:
+                self._history.pop()
+
+        self._active.add(key)
+        self._items_in_active += 1
+
+    def __contains__(self, key):
+        if key in self._active:
+            return True
+        return any(key in bloom for bloom in self._history)
+
+
+def make_key():
+    # Like the TxPool entries: session id, transaction hash and salt
+    return b':'.join((os.urandom(16), os.urandom(32), os.urandom(16)))
+
+
+def run_benchmark(name, bloom_class, num_generations, num_lookups):
+    bloom = bloom_class(GENERATION_SIZE, MAX_GENERATIONS)
+
+    keys = [make_key() for _ in range(GENERATION_SIZE * num_generations)]
+    start = time.perf_counter()
+    for key in keys:
+        bloom.add(key)
+    add_duration = time.perf_counter() - start
+
+    present_keys = keys[-num_lookups:]
+    start = time.perf_counter()
+    for key in present_keys:
+        key in bloom
+    present_duration = time.perf_counter() - start
+
+    absent_keys = [make_key() for _ in range(num_lookups)]
+    start = time.perf_counter()
+    false_positives = sum(key in bloom for key in absent_keys)
+    absent_duration = time.perf_counter() - start
+
+    logger.info(
+        "%s with %d generations: add %d/s, contains (present) %d/s, "
+        "contains (absent) %d/s, %.1f%% false positives",
+        name,
+        num_generations,
+        len(keys) / add_duration,
+        num_lookups / present_duration,
+        num_lookups / absent_duration,
+        false_positives / num_lookups * 100,
+    )
+
+
+parser = argparse.ArgumentParser(description='RollingBloom benchmark')
+parser.add_argument(
+    '--num-generations',
+    type=int,
+    required=False,
+    default=10,
+    help=(
+        "Number of generations of 100000 items added before looking up items, "
+        f"up to {MAX_GENERATIONS}"
+    ),
+)
+parser.add_argument(
+    '--num-lookups',
+    type=int,
+    required=False,
+    default=10000,
+    help="Number of present and of absent items looked up",
+)
+
+
+if __name__ == '__main__':
+    args = parser.parse_args()
+    run_benchmark("RollingBloom", RollingBloom, args.num_generations, args.num_lookups)
+    try:
+        run_benchmark(
+            "LegacyRollingBloom",
+            LegacyRollingBloom,
+            args.num_generations,
+            args.num_lookups,
+        )
+    except ImportError:
+        logger.info("Install bloom-filter==1.3 to compare with the previous implementation")
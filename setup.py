@@ -34,7 +34,6 @@ deps = {
         "asks>=2.4.8,<3",
         "argcomplete>=1.12.2,<2",
         "asyncio-run-in-process==0.1.0a10",
-        "bloom-filter==1.3",
         "cachetools>=3.1.0,<4.0.0",
         "coincurve>=10.0.0,<11.0.0",
         "eth-utils>=1.9.3,<2",
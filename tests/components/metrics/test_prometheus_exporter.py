@@ -0,0 +1,237 @@
+import contextlib
+from pathlib import Path
+import tempfile
+import uuid
+
+from async_service import background_trio_service
+from lahja import ConnectionConfig
+from lahja.trio.endpoint import TrioEndpoint
+import pytest
+import trio
+
+from pyformance.meters import Counter
+
+from trinity.components.builtin.metrics import prometheus
+from trinity.components.builtin.metrics.events import (
+    CollectMetricsRequest,
+    CollectMetricsResponse,
+)
+from trinity.components.builtin.metrics.prometheus import (
+    PrometheusExporter,
+    get_metric_name,
+    render_metrics,
+)
+from trinity.components.builtin.metrics.registry import HostMetricsRegistry
+
+
+@pytest.mark.parametrize(
+    'key,field,expected',
+    (
+        (
+            'trinity.p2p/sync/pivot_rate.meter',
+            'm1_rate',
+            'trinity_p2p_sync_pivot_rate_meter_m1_rate',
+        ),
+        ('peer_count', 'value', 'peer_count_value'),
+        ('1st-peer', 'count', '_1st_peer_count'),
+    ),
+)
+def test_get_metric_name(key, field, expected):
+    assert get_metric_name(key, field) == expected
+
+
+def test_render_metrics_of_many_processes():
+    syncer_registry = HostMetricsRegistry('node-a')
+    syncer_registry.counter('blocks').inc(3)
+    syncer_registry.gauge('peers').set_value(5)
+    json_rpc_registry = HostMetricsRegistry('node-a')
+    json_rpc_registry.add('blocks', Counter())
+
+    rendered = render_metrics({
+        'syncer': syncer_registry.dump_metrics(),
+        'json-rpc': json_rpc_registry.dump_metrics(),
+    }).decode()
+
+    assert '# TYPE blocks_count gauge' in rendered
+    assert 'blocks_count{host="node-a",process="syncer"} 3.0' in rendered
+    assert 'blocks_count{host="node-a",process="json-rpc"} 0.0' in rendered
+    assert 'peers_value{host="node-a",process="syncer"} 5.0' in rendered
+    # the host is a label, not a metric
+    assert 'blocks_host' not in rendered
+    assert rendered.endswith('# EOF\n')
+
+
+@contextlib.asynccontextmanager
+async def run_exporter(ipc_dir, port, cache_seconds=60, respond=True):
+    """
+    Run a PrometheusExporter on its own endpoint, with another endpoint that counts the
+    CollectMetricsRequest it gets, and only answers them if ``respond`` is set.
+    """
+    exporter_config = ConnectionConfig.from_name(str(uuid.uuid4()), base_path=ipc_dir)
+    async with TrioEndpoint.serve(exporter_config) as exporter_endpoint:
+        async with TrioEndpoint(str(uuid.uuid4())).run() as other_endpoint:
+            await other_endpoint.connect_to_endpoints(exporter_config)
+            other_registry = HostMetricsRegistry('node-a')
+            requests = other_registry.counter('requests')
+
+            async def handle_collect_metrics_requests():
+                async for request in other_endpoint.stream(CollectMetricsRequest):
+                    requests.inc()
+                    if respond:
+                        await other_endpoint.broadcast(
+                            CollectMetricsResponse(other_registry.dump_metrics()),
+                            request.broadcast_config(),
+                        )
+
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(handle_collect_metrics_requests)
+                await exporter_endpoint.wait_until_any_endpoint_subscribed_to(
+                    CollectMetricsRequest)
+
+                exporter_registry = HostMetricsRegistry('node-a')
+                exporter_registry.gauge('peers').set_value(5)
+                exporter = PrometheusExporter(
+                    exporter_endpoint,
+                    exporter_registry,
+                    '127.0.0.1',
+                    port,
+                    cache_seconds,
+                )
+                async with background_trio_service(exporter):
+                    yield exporter_endpoint.name, other_endpoint.name, requests
+
+                nursery.cancel_scope.cancel()
+
+
+async def open_connection(port):
+    # The exporter may not be listening yet
+    while True:
+        try:
+            return await trio.open_tcp_stream('127.0.0.1', port)
+        except OSError:
+            await trio.sleep(0.01)
+
+
+async def receive_response(stream):
+    response = b''
+    while True:
+        data = await stream.receive_some()
+        if not data:
+            break
+        response += data
+    head, body = response.split(b'\r\n\r\n', 1)
+    return head.split(b'\r\n')[0].decode(), body.decode()
+
+
+async def scrape(port, path='/metrics'):
+    with trio.fail_after(5):
+        stream = await open_connection(port)
+        async with stream:
+            await stream.send_all(f'GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n'.encode())
+            return await receive_response(stream)
+
+
+def run_with_exporter(test_fn, port, **kwargs):
+    async def main(ipc_dir):
+        async with run_exporter(ipc_dir, port, **kwargs) as exporter:
+            return await test_fn(*exporter)
+
+    # Use a short directory, as a UNIX socket path can't be longer than ~100 characters
+    with tempfile.TemporaryDirectory() as ipc_dir:
+        return trio.run(main, Path(ipc_dir))
+
+
+def test_exporter_serves_cached_metrics_of_all_processes(unused_tcp_port):
+    async def scrape_twice(exporter_name, other_name, requests):
+        responses = []
+
+        async def scrape_into_responses():
+            responses.append(await scrape(unused_tcp_port))
+
+        # Concurrent scrapes wait for a single collection
+        async with trio.open_nursery() as nursery:
+            for _ in range(3):
+                nursery.start_soon(scrape_into_responses)
+        # Later scrapes are served the cached render
+        await scrape_into_responses()
+
+        return exporter_name, other_name, requests.get_count(), responses
+
+    exporter_name, other_name, num_requests, responses = run_with_exporter(
+        scrape_twice,
+        unused_tcp_port,
+    )
+
+    assert num_requests == 1
+    status, body = responses[0]
+    assert status == 'HTTP/1.1 200 OK'
+    assert f'peers_value{{host="node-a",process="{exporter_name}"}} 5.0' in body
+    assert f'requests_count{{host="node-a",process="{other_name}"}} 1.0' in body
+    assert body.endswith('# EOF\n')
+    assert all(response == responses[0] for response in responses)
+
+
+def test_exporter_renders_again_once_cache_expires(unused_tcp_port):
+    async def scrape_twice(exporter_name, other_name, requests):
+        first = await scrape(unused_tcp_port)
+        second = await scrape(unused_tcp_port)
+        return other_name, requests.get_count(), first, second
+
+    other_name, num_requests, first, second = run_with_exporter(
+        scrape_twice,
+        unused_tcp_port,
+        cache_seconds=0,
+    )
+
+    assert num_requests == 2
+    assert f'requests_count{{host="node-a",process="{other_name}"}} 1.0' in first[1]
+    assert f'requests_count{{host="node-a",process="{other_name}"}} 2.0' in second[1]
+
+
+def test_exporter_serves_metrics_without_unresponsive_processes(unused_tcp_port, monkeypatch):
+    monkeypatch.setattr(prometheus, 'COLLECT_TIMEOUT', 0.1)
+
+    async def scrape_once(exporter_name, other_name, requests):
+        return exporter_name, other_name, await scrape(unused_tcp_port)
+
+    exporter_name, other_name, (status, body) = run_with_exporter(
+        scrape_once,
+        unused_tcp_port,
+        respond=False,
+    )
+
+    assert status == 'HTTP/1.1 200 OK'
+    assert f'process="{exporter_name}"' in body
+    assert f'process="{other_name}"' not in body
+
+
+@pytest.mark.parametrize('path', ('/', '/metricsx', '/metrics/'))
+def test_exporter_serves_only_metrics_path(unused_tcp_port, path):
+    async def scrape_once(exporter_name, other_name, requests):
+        return requests.get_count(), await scrape(unused_tcp_port, path)
+
+    num_requests, (status, body) = run_with_exporter(scrape_once, unused_tcp_port)
+
+    assert num_requests == 0
+    assert status == 'HTTP/1.1 404 Not Found'
+    assert body == 'Not Found\n'
+
+
+def test_exporter_is_not_held_up_by_slow_clients(unused_tcp_port, monkeypatch):
+    monkeypatch.setattr(prometheus, 'HTTP_REQUEST_TIMEOUT', 0.5)
+
+    async def scrape_with_slow_client(exporter_name, other_name, requests):
+        with trio.fail_after(5):
+            slow_stream = await open_connection(unused_tcp_port)
+            async with slow_stream:
+                # A client that never finishes its request doesn't delay other scrapes
+                status, _ = await scrape(unused_tcp_port)
+                assert status == 'HTTP/1.1 200 OK'
+                await slow_stream.send_all(b'GET /metr')
+
+                # and is eventually answered, without a valid request
+                return await receive_response(slow_stream)
+
+    status, _ = run_with_exporter(scrape_with_slow_client, unused_tcp_port)
+
+    assert status == 'HTTP/1.1 404 Not Found'
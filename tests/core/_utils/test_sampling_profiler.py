@@ -0,0 +1,44 @@
+import threading
+
+from trinity._utils.profiling import SamplingProfiler
+
+
+def busy_function(stop):
+    while not stop.is_set():
+        stop.wait(0.001)
+
+
+def test_sampling_profiler_writes_collapsed_stacks(tmp_path):
+    stop = threading.Event()
+    thread = threading.Thread(target=busy_function, args=(stop,), name='busy-thread')
+    thread.start()
+
+    profiler = SamplingProfiler(tmp_path, 'test', interval=0.001, flush_interval=60)
+    try:
+        for _ in range(5):
+            profiler.sample()
+    finally:
+        stop.set()
+        thread.join()
+
+    profiler.flush()
+    output_files = tuple(tmp_path.glob('test-*.collapsed'))
+    assert len(output_files) == 1
+
+    lines = output_files[0].read_text().splitlines()
+    busy_lines = [line for line in lines if line.startswith('busy-thread;')]
+    assert busy_lines
+    stack, count = busy_lines[0].rsplit(' ', 1)
+    assert 'busy_function' in stack
+    assert sum(int(line.rsplit(' ', 1)[1]) for line in busy_lines) == 5
+
+
+def test_sampling_profiler_flushes_on_stop(tmp_path):
+    profiler = SamplingProfiler(tmp_path, 'test', interval=0.001, flush_interval=60)
+    profiler.start()
+    assert profiler.is_running
+    threading.Event().wait(0.05)
+    profiler.stop()
+
+    assert not profiler.is_running
+    assert tuple(tmp_path.glob('test-*.collapsed'))
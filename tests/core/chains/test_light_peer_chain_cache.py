@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from trinity.sync.light.batching import PeerRequestBatcher
+from trinity.sync.light.cache import (
+    ByteSizedLRU,
+    coalesce_and_cache,
+)
+
+
+def test_byte_sized_lru_evicts_least_recently_used():
+    cache = ByteSizedLRU(10, get_size=len)
+    cache['a'] = b'1234'
+    cache['b'] = b'1234'
+    # touch 'a', so that 'b' is the least recently used
+    assert cache['a'] == b'1234'
+
+    cache['c'] = b'1234'
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.total_bytes == 8
+
+
+def test_byte_sized_lru_skips_values_bigger_than_capacity():
+    cache = ByteSizedLRU(10, get_size=len)
+    cache['a'] = b'1234'
+    cache['huge'] = b'x' * 11
+
+    assert 'huge' not in cache
+    assert 'a' in cache
+
+
+class CountingRequester:
+    def __init__(self):
+        self._response_cache = ByteSizedLRU(1024, get_size=len)
+        self._in_flight_requests = {}
+        self.calls = []
+
+    @coalesce_and_cache
+    async def coro_get(self, key):
+        self.calls.append(key)
+        await asyncio.sleep(0.01)
+        if key == b'bad':
+            raise ValueError(key)
+        return key * 2
+
+
+@pytest.mark.asyncio
+async def test_coalesce_and_cache_merges_concurrent_requests():
+    requester = CountingRequester()
+
+    results = await asyncio.gather(*(requester.coro_get(b'a') for _ in range(5)))
+    assert results == [b'aa'] * 5
+    assert requester.calls == [b'a']
+
+    # served from the cache
+    assert await requester.coro_get(b'a') == b'aa'
+    assert requester.calls == [b'a']
+    assert requester._in_flight_requests == {}
+
+
+@pytest.mark.asyncio
+async def test_coalesce_and_cache_does_not_cache_exceptions():
+    requester = CountingRequester()
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await requester.coro_get(b'bad')
+
+    assert requester.calls == [b'bad', b'bad']
+
+
+@pytest.mark.asyncio
+async def test_peer_request_batcher_sends_concurrent_requests_together():
+    sent_batches = []
+
+    async def send_batch(peer, requests):
+        sent_batches.append((peer, requests))
+        return tuple(request * 2 for request in requests)
+
+    batcher = PeerRequestBatcher(send_batch, max_batch_size=2)
+    results = await asyncio.gather(
+        batcher.request('peer', 'block', 1),
+        batcher.request('peer', 'block', 2),
+        batcher.request('peer', 'block', 3),
+        batcher.request('peer', 'other-block', 4),
+    )
+
+    assert results == [2, 4, 6, 8]
+    assert sorted(sent_batches) == [
+        ('peer', (1, 2)),
+        ('peer', (3,)),
+        ('peer', (4,)),
+    ]
@@ -0,0 +1,196 @@
+import threading
+
+from async_service import background_trio_service
+from eth.consensus.noproof import NoProofConsensus
+from eth.consensus.pow import PowConsensus
+from eth.rlp.headers import BlockHeader
+from eth_utils import ValidationError
+from pyformance import MetricsRegistry
+import pytest
+import trio
+
+from p2p.tools.factories import SessionFactory
+
+from trinity.components.builtin.new_block import component
+from trinity.components.builtin.new_block.component import NewBlockService
+from trinity.protocol.eth.payloads import BlockFields, NewBlockPayload
+
+
+def mk_header(block_number, nonce=b'\x00' * 8):
+    return BlockHeader(difficulty=1, block_number=block_number, gas_limit=3141592, nonce=nonce)
+
+
+class FakeVM:
+    consensus_class = NoProofConsensus
+
+
+class FakePowVM:
+    consensus_class = PowConsensus
+
+
+class FakeChain:
+    """
+    A chain that counts the seals it validates, which takes a moment, and only rejects the
+    ones in ``invalid_hashes``.
+    """
+    def __init__(self, vm_class=FakeVM, invalid_hashes=()):
+        self._vm_class = vm_class
+        self._invalid_hashes = invalid_hashes
+        self._lock = threading.Lock()
+        self.validated_hashes = []
+
+    def get_vm_class(self, header):
+        return self._vm_class
+
+    def validate_seal(self, header):
+        with self._lock:
+            self.validated_hashes.append(header.hash)
+        # Give concurrent validations of the same header a chance to start
+        threading.Event().wait(0.05)
+        if header.hash in self._invalid_hashes:
+            raise ValidationError(f"Invalid seal on {header}")
+
+
+class FakeProxyETHAPI:
+    def __init__(self):
+        self.sent_new_blocks = []
+
+    def send_new_block(self, block_fields, total_difficulty):
+        self.sent_new_blocks.append(block_fields)
+
+
+class FakeProxyPeer:
+    def __init__(self, session):
+        self.session = session
+        self.eth_api = FakeProxyETHAPI()
+
+
+class FakeProxyPeerPool:
+    def __init__(self, *peers):
+        self.connected_peers = {peer.session: peer for peer in peers}
+
+    async def ensure_proxy_peer(self, session):
+        return self.connected_peers[session]
+
+    async def get_peers(self):
+        return tuple(self.connected_peers.values())
+
+
+class FakeWitnessDB:
+    def get_witness_hashes(self, block_hash):
+        # Pretend the witness is known already, so it isn't fetched from the peer
+        return ()
+
+
+class StubbedNewBlockService(NewBlockService):
+    def __init__(self, chain, peer_pool=None):
+        super().__init__(None, peer_pool, MetricsRegistry(), None)
+        self._chain = chain
+        self._witness_db = FakeWitnessDB()
+
+    async def run(self):
+        try:
+            await self.manager.wait_finished()
+        finally:
+            self._seal_validation_executor.shutdown(wait=False)
+
+
+async def validate_concurrently(service, header, count):
+    results = []
+
+    async def validate():
+        try:
+            await service._validate_seal(header)
+        except ValidationError as exc:
+            results.append(exc)
+        else:
+            results.append(None)
+
+    async with trio.open_nursery() as nursery:
+        for _ in range(count):
+            nursery.start_soon(validate)
+
+    return results
+
+
+@pytest.mark.parametrize('is_valid', (True, False))
+def test_concurrent_seal_validations_are_coalesced(is_valid):
+    header = mk_header(1)
+    chain = FakeChain(invalid_hashes=() if is_valid else (header.hash,))
+    service = StubbedNewBlockService(chain)
+
+    async def main():
+        results = await validate_concurrently(service, header, 3)
+        assert not service._pending_seal_validations
+        # The result is cached for later messages about the same block
+        results.extend(await validate_concurrently(service, header, 1))
+        return results
+
+    results = trio.run(main)
+
+    assert chain.validated_hashes == [header.hash]
+    assert len(results) == 4
+    if is_valid:
+        assert results == [None] * 4
+    else:
+        assert all(isinstance(result, ValidationError) for result in results)
+
+
+def test_seal_validation_results_are_evicted(monkeypatch):
+    monkeypatch.setattr(component, 'SEAL_VALIDATION_CACHE_SIZE', 2)
+    headers = tuple(mk_header(block_number) for block_number in range(1, 4))
+    chain = FakeChain()
+    service = StubbedNewBlockService(chain)
+
+    async def main():
+        for header in headers + headers[-1:] + headers[:1]:
+            await service._validate_seal(header)
+
+    trio.run(main)
+
+    # The first header was evicted by the third one, so it was validated again
+    assert chain.validated_hashes == [header.hash for header in headers + headers[:1]]
+
+
+def test_pow_seals_are_validated_in_worker_processes():
+    header = mk_header(1, nonce=b'\x01' * 8)
+    chain = FakeChain(vm_class=FakePowVM)
+    service = StubbedNewBlockService(chain)
+
+    async def main():
+        with trio.fail_after(60):
+            return await validate_concurrently(service, header, 2)
+
+    try:
+        results = trio.run(main)
+    finally:
+        service._seal_validation_executor.shutdown()
+
+    assert chain.validated_hashes == []
+    assert len(results) == 2
+    assert all(isinstance(result, ValidationError) for result in results)
+    assert "mix hash mismatch" in str(results[0])
+
+
+def test_new_block_latencies_are_recorded():
+    sender, *others = (FakeProxyPeer(SessionFactory()) for _ in range(5))
+    chain = FakeChain()
+    service = StubbedNewBlockService(chain, FakeProxyPeerPool(sender, *others))
+    block = BlockFields(mk_header(1), (), ())
+
+    async def main():
+        async with background_trio_service(service):
+            await service._handle_new_block(sender.session, NewBlockPayload(block, 1))
+            # The same block from another peer is neither validated nor relayed again
+            await service._handle_new_block(others[0].session, NewBlockPayload(block, 1))
+
+    trio.run(main)
+
+    assert service._validated_latency.get_count() == 1
+    assert service._relayed_latency.get_count() == 1
+    assert service._relayed_latency.get_max() >= service._validated_latency.get_max()
+    # Relayed to sqrt(5) of the peers, but never back to the sender
+    relayed_to = tuple(peer for peer in others if peer.eth_api.sent_new_blocks)
+    assert len(relayed_to) == 2
+    assert sender.eth_api.sent_new_blocks == []
+    assert chain.validated_hashes == [block.header.hash]
@@ -0,0 +1,54 @@
+import time
+
+from p2p.tools.factories import SessionFactory
+
+from trinity.components.builtin.new_block.tracker import PeerBlockTracker
+
+
+class PeerStub:
+    def __init__(self, session):
+        self.session = session
+
+
+def test_peer_block_tracker_filters_peers_that_saw_block():
+    tracker = PeerBlockTracker()
+    seen_peer, unseen_peer = PeerStub(SessionFactory()), PeerStub(SessionFactory())
+    block_hash = b'\x01' * 32
+
+    assert block_hash not in tracker
+    assert tracker.filter_unseen((seen_peer, unseen_peer), block_hash) == (seen_peer, unseen_peer)
+
+    tracker.add(block_hash, seen_peer.session)
+    tracker.add(block_hash, seen_peer.session)
+
+    assert block_hash in tracker
+    assert tracker.has_seen(block_hash, seen_peer.session)
+    assert not tracker.has_seen(block_hash, unseen_peer.session)
+    assert tracker.filter_unseen((seen_peer, unseen_peer), block_hash) == (unseen_peer,)
+
+
+def test_peer_block_tracker_evicts_oldest_blocks_over_capacity():
+    tracker = PeerBlockTracker(max_blocks=2)
+    session = SessionFactory()
+
+    for block_hash in (b'\x01' * 32, b'\x02' * 32, b'\x03' * 32):
+        tracker.add(block_hash, session)
+
+    assert len(tracker) == 2
+    assert b'\x01' * 32 not in tracker
+    assert b'\x03' * 32 in tracker
+
+
+def test_peer_block_tracker_expires_old_blocks(monkeypatch):
+    tracker = PeerBlockTracker(ttl=10)
+    session = SessionFactory()
+    block_hash = b'\x01' * 32
+    now = time.monotonic()
+
+    monkeypatch.setattr(time, 'monotonic', lambda: now)
+    tracker.add(block_hash, session)
+    assert block_hash in tracker
+
+    monkeypatch.setattr(time, 'monotonic', lambda: now + 11)
+    assert block_hash not in tracker
+    assert not tracker.has_seen(block_hash, session)
@@ -0,0 +1,96 @@
+from eth.db.atomic import AtomicDB
+from eth.db.trie import make_trie_root_and_nodes
+from eth.rlp.receipts import Receipt
+import pytest
+
+from trinity.db.eth1.chain import AsyncChainDB
+
+
+NUM_BLOCKS = 6
+
+RECIPIENT = b'\x0f' * 20
+
+
+@pytest.fixture
+def chain(chain_without_block_validation, funded_address_private_key):
+    chain = chain_without_block_validation
+    nonce = 0
+    for block_number in range(1, NUM_BLOCKS + 1):
+        # Blocks have a varying number of transactions, including none
+        for _ in range(block_number % 3):
+            transaction = chain.create_unsigned_transaction(
+                nonce=nonce,
+                gas_price=1,
+                gas=21000,
+                to=RECIPIENT,
+                value=block_number,
+                data=b'',
+            ).as_signed_transaction(funded_address_private_key)
+            chain.apply_transaction(transaction)
+            nonce += 1
+        chain.mine_block()
+    return chain
+
+
+def get_blocks(chain):
+    return tuple(
+        chain.get_canonical_block_by_number(block_number)
+        for block_number in range(1, NUM_BLOCKS + 1)
+    )
+
+
+def mk_chaindb(chain, blocks):
+    """
+    Create a chain database with only the genesis of the given chain, and the transactions and
+    receipts of the given blocks, written out ahead of time like during a fast sync.
+    """
+    chaindb = AsyncChainDB(AtomicDB())
+    chaindb.persist_header(chain.chaindb.get_canonical_block_header_by_number(0))
+    for block in blocks:
+        _, transaction_trie_data = make_trie_root_and_nodes(block.transactions)
+        receipts = chain.chaindb.get_receipts(block.header, Receipt)
+        _, receipt_trie_data = make_trie_root_and_nodes(receipts)
+        chaindb.persist_trie_data_dict(transaction_trie_data)
+        chaindb.persist_trie_data_dict(receipt_trie_data)
+    return chaindb
+
+
+def summarize_chain(chaindb, blocks):
+    block_details = []
+    for block in blocks:
+        header = chaindb.get_canonical_block_header_by_number(block.number)
+        transactions = chaindb.get_block_transactions(header, block.get_transaction_class())
+        receipts = chaindb.get_receipts(header, Receipt)
+        transaction_indexes = tuple(
+            chaindb.get_transaction_index(transaction.hash) for transaction in transactions
+        )
+        block_details.append((header, transactions, receipts, transaction_indexes))
+    return chaindb.get_canonical_head(), tuple(block_details)
+
+
+@pytest.mark.parametrize('batch_size', (1, 2, 4, NUM_BLOCKS))
+@pytest.mark.asyncio
+async def test_persist_blocks_matches_persisting_one_at_a_time(chain, batch_size):
+    blocks = get_blocks(chain)
+
+    one_at_a_time_db = mk_chaindb(chain, blocks)
+    for block in blocks:
+        one_at_a_time_db.persist_block(block)
+
+    batched_db = mk_chaindb(chain, blocks)
+    batched_coro_db = mk_chaindb(chain, blocks)
+    for start in range(0, NUM_BLOCKS, batch_size):
+        batch = blocks[start:start + batch_size]
+        batched_db.persist_blocks(batch)
+        await batched_coro_db.coro_persist_blocks(batch)
+
+    expected = summarize_chain(one_at_a_time_db, blocks)
+    head, block_details = expected
+    assert head == blocks[-1].header
+    assert tuple(details[1] for details in block_details) == tuple(
+        block.transactions for block in blocks
+    )
+    assert sum(len(details[2]) for details in block_details) > 0
+
+    assert summarize_chain(batched_db, blocks) == expected
+    assert summarize_chain(batched_coro_db, blocks) == expected
@@ -0,0 +1,98 @@
+from eth.db.atomic import AtomicDB
+from eth.db.backends.memory import MemoryDB
+from eth.db.header import HeaderDB
+from eth.rlp.headers import BlockHeader
+from eth_utils import ValidationError
+import pytest
+
+from trinity.db.eth1.header import AsyncHeaderDB
+
+
+def mk_header_chain(parent, length):
+    headers = []
+    for _ in range(length):
+        header = BlockHeader(
+            difficulty=100,
+            block_number=parent.block_number + 1,
+            parent_hash=parent.hash,
+            gas_limit=3000000,
+            timestamp=parent.timestamp + 1,
+        )
+        headers.append(header)
+        parent = header
+    return tuple(headers)
+
+
+@pytest.fixture
+def genesis():
+    return BlockHeader(difficulty=100, block_number=0, gas_limit=3000000, timestamp=0)
+
+
+@pytest.fixture
+def base_db():
+    return MemoryDB()
+
+
+@pytest.fixture
+def async_base_db():
+    return MemoryDB()
+
+
+@pytest.fixture
+def headerdb(base_db, genesis):
+    headerdb = HeaderDB(AtomicDB(base_db))
+    headerdb.persist_header(genesis)
+    return headerdb
+
+
+@pytest.fixture
+def async_headerdb(async_base_db, genesis):
+    async_headerdb = AsyncHeaderDB(AtomicDB(async_base_db))
+    async_headerdb.persist_header(genesis)
+    return async_headerdb
+
+
+@pytest.mark.parametrize('segment_sizes', ((1,), (192,), (10, 20, 30)))
+def test_canonical_extension_matches_header_db(
+        genesis,
+        segment_sizes,
+        headerdb,
+        async_headerdb,
+        base_db,
+        async_base_db):
+
+    parent = genesis
+    for segment_size in segment_sizes:
+        headers = mk_header_chain(parent, segment_size)
+        expected = headerdb.persist_header_chain(headers)
+        actual = async_headerdb.persist_header_chain(headers)
+        assert actual == expected
+        assert actual == (headers, ())
+        parent = headers[-1]
+
+    assert async_base_db.kv_store == base_db.kv_store
+
+
+def test_non_contiguous_canonical_extension(genesis, async_headerdb):
+    headers = mk_header_chain(genesis, 3)
+
+    with pytest.raises(ValidationError):
+        async_headerdb.persist_header_chain((headers[0], headers[2]))
+
+    assert async_headerdb.get_canonical_head() == genesis
+
+
+def test_fork_falls_back_to_header_db(
+        genesis,
+        headerdb,
+        async_headerdb,
+        base_db,
+        async_base_db):
+    canonical = mk_header_chain(genesis, 3)
+    fork = mk_header_chain(canonical[0], 4)
+    for headers in (canonical, fork):
+        expected = headerdb.persist_header_chain(headers)
+        assert async_headerdb.persist_header_chain(headers) == expected
+
+    assert async_headerdb.get_canonical_head() == fork[-1]
+    assert async_base_db.kv_store == base_db.kv_store
@@ -0,0 +1,154 @@
+from eth.db.atomic import AtomicDB
+from eth.rlp.headers import BlockHeader
+from eth_bloom import BloomFilter
+from eth_utils import ValidationError
+import pytest
+
+from trinity.db.eth1.bloom_bits import (
+    BLOOM_BITS_SECTION_SIZE,
+    BloomBitsDB,
+    bloom_matches,
+)
+from trinity.rpc.modules._logs import find_candidate_blocks
+
+
+ADDRESS_A = b'\x0a' * 20
+ADDRESS_B = b'\x0b' * 20
+TOPIC = b'\x01' * 32
+
+# block number -> values in the block's logs bloom
+BLOOM_VALUES = {
+    3: (ADDRESS_A, TOPIC),
+    100: (ADDRESS_B,),
+    4095: (ADDRESS_A,),
+    4096: (ADDRESS_A, TOPIC),
+    5000: (ADDRESS_B, TOPIC),
+}
+
+
+class FakeChain:
+    def __init__(self, headers):
+        self.headers = headers
+
+    def get_canonical_block_hash(self, block_number):
+        return self.headers[block_number].hash
+
+    def get_canonical_block_header_by_number(self, block_number):
+        return self.headers[block_number]
+
+
+def mk_headers(count):
+    return [
+        BlockHeader(
+            difficulty=100,
+            block_number=block_number,
+            gas_limit=3000000,
+            timestamp=block_number,
+            bloom=int(BloomFilter.from_iterable(BLOOM_VALUES.get(block_number, ()))),
+        )
+        for block_number in range(count)
+    ]
+
+
+@pytest.fixture(scope='module')
+def headers():
+    return mk_headers(2 * BLOOM_BITS_SECTION_SIZE)
+
+
+@pytest.fixture
+def bloom_bits_db(headers):
+    db = BloomBitsDB(AtomicDB())
+    db.persist_section(0, headers[:BLOOM_BITS_SECTION_SIZE])
+    return db
+
+
+def test_bloom_matches_header_bloom(headers):
+    assert bloom_matches(headers[3].bloom, ((ADDRESS_A,), (TOPIC,)))
+    assert bloom_matches(headers[3].bloom, ((ADDRESS_A, ADDRESS_B), ()))
+    assert not bloom_matches(headers[3].bloom, ((ADDRESS_B,),))
+    assert bloom_matches(headers[3].bloom, ((), ()))
+
+
+def test_persist_section_indexes_blooms(bloom_bits_db, headers):
+    assert bloom_bits_db.get_indexed_section_count() == 1
+    assert bloom_bits_db.is_section_indexed(0, headers[BLOOM_BITS_SECTION_SIZE - 1].hash)
+    assert not bloom_bits_db.is_section_indexed(1, headers[-1].hash)
+
+    assert bloom_bits_db.get_matching_blocks(0, ((ADDRESS_A,),)) == (1 << 3) | (1 << 4095)
+    assert bloom_bits_db.get_matching_blocks(0, ((ADDRESS_A,), (TOPIC,))) == 1 << 3
+    assert bloom_bits_db.get_matching_blocks(0, ((ADDRESS_A, ADDRESS_B),)) == (
+        (1 << 3) | (1 << 100) | (1 << 4095)
+    )
+    assert bloom_bits_db.get_matching_blocks(0, ((b'\xff' * 20,),)) == 0
+
+
+def test_persist_section_must_be_contiguous(bloom_bits_db, headers):
+    with pytest.raises(ValueError):
+        bloom_bits_db.persist_section(2, headers[:BLOOM_BITS_SECTION_SIZE])
+
+
+@pytest.mark.parametrize(
+    'from_block, to_block, criteria, expected',
+    (
+        (0, 8191, ((ADDRESS_A,),), (3, 4095, 4096)),
+        (4, 8191, ((ADDRESS_A,),), (4095, 4096)),
+        (0, 4095, ((ADDRESS_B,), (TOPIC,)), ()),
+        (0, 8191, ((ADDRESS_B,), (TOPIC,)), (5000,)),
+        (90, 110, (), tuple(range(90, 111))),
+    ),
+)
+def test_find_candidate_blocks(bloom_bits_db, headers, from_block, to_block, criteria, expected):
+    chain = FakeChain(headers)
+
+    # The first section is served from the index, the second one from the headers
+    assert find_candidate_blocks(chain, bloom_bits_db, from_block, to_block, criteria) == expected
+    assert find_candidate_blocks(chain, None, from_block, to_block, criteria) == expected
+
+
+def test_find_candidate_blocks_only_limits_unindexed_blocks(bloom_bits_db, headers):
+    chain = FakeChain(headers)
+    last_block = 2 * BLOOM_BITS_SECTION_SIZE - 1
+    criteria = ((ADDRESS_A,),)
+
+    # Only the second section has to be scanned one header at a time
+    assert find_candidate_blocks(
+        chain,
+        bloom_bits_db,
+        0,
+        last_block,
+        criteria,
+        max_unindexed_blocks=BLOOM_BITS_SECTION_SIZE,
+    ) == (3, 4095, 4096)
+
+    with pytest.raises(ValidationError):
+        find_candidate_blocks(
+            chain,
+            bloom_bits_db,
+            0,
+            last_block,
+            criteria,
+            max_unindexed_blocks=BLOOM_BITS_SECTION_SIZE - 1,
+        )
+    with pytest.raises(ValidationError):
+        find_candidate_blocks(
+            chain,
+            None,
+            0,
+            last_block,
+            criteria,
+            max_unindexed_blocks=BLOOM_BITS_SECTION_SIZE,
+        )
+
+
+def test_find_candidate_blocks_ignores_stale_sections(bloom_bits_db, headers):
+    reorged_headers = list(headers)
+    reorged_headers[4095] = reorged_headers[4095].copy(timestamp=0)
+    chain = FakeChain(reorged_headers)
+
+    assert not bloom_bits_db.is_section_indexed(0, reorged_headers[4095].hash)
+    assert find_candidate_blocks(chain, bloom_bits_db, 0, 4095, ((ADDRESS_A,),)) == (3, 4095)
+
+    bloom_bits_db.rewind(0)
+    assert bloom_bits_db.get_indexed_section_count() == 0
+    bloom_bits_db.persist_section(0, reorged_headers[:BLOOM_BITS_SECTION_SIZE])
+    assert bloom_bits_db.is_section_indexed(0, reorged_headers[4095].hash)
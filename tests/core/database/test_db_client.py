@@ -10,6 +10,7 @@ from eth.tools.db.base import DatabaseAPITestSuite
 from trinity.db.manager import (
     DBManager,
     DBClient,
+    exists_many,
 )
 
 
@@ -56,3 +57,25 @@ class TestDBClientDatabaseAPI(DatabaseAPITestSuite):
 
 class TestDBClientAtomicBatchAPI(AtomicDatabaseBatchAPITestSuite):
     pass
+
+
+def test_db_client_exists_many(db_client, base_db):
+    base_db[b'key-a'] = b'value-a'
+    base_db[b'key-c'] = b''
+
+    assert db_client.exists_many(()) == ()
+    assert db_client.exists_many((b'key-a', b'key-b', b'key-c', b'')) == (
+        True,
+        False,
+        True,
+        False,
+    )
+
+
+@pytest.mark.parametrize('use_client', (True, False))
+def test_exists_many_matches_single_lookups(db_client, base_db, use_client):
+    base_db[b'present'] = b'value'
+    keys = (b'missing', b'present', b'present', b'also-missing')
+    db = db_client if use_client else base_db
+
+    assert exists_many(db, keys) == tuple(key in base_db for key in keys)
@@ -3,7 +3,9 @@ from pathlib import Path
 import uuid
 
 import pytest
+from sqlalchemy import inspect
 
+from trinity.components.builtin.network_db.eth1_peer_db.tracker import Remote
 from trinity.db.orm import (
     SchemaVersion,
     Base,
@@ -162,3 +164,26 @@ async def test_db_can_have_different_concurrent_sessions(db_path):
     )
     schema_version = _get_session(db_path).query(SchemaVersion).one()
     print(schema_version.version)
+
+
+def _get_index_names(engine, table_name):
+    return {index['name'] for index in inspect(engine).get_indexes(table_name)}
+
+
+def test_get_tracking_db_creates_missing_indexes(db_path):
+    engine = get_tracking_database(db_path).get_bind()
+    last_connected_index, = (
+        index for index in Remote.__table__.indexes
+        if tuple(index.columns) == (Remote.__table__.c.last_connected_at,)
+    )
+    # Like a database created before the index was added to the schema
+    last_connected_index.drop(engine)
+    assert last_connected_index.name not in _get_index_names(engine, Remote.__tablename__)
+
+    session = get_tracking_database(db_path)
+
+    assert _check_schema_version(session) is True
+    assert last_connected_index.name in _get_index_names(
+        session.get_bind(),
+        Remote.__tablename__,
+    )
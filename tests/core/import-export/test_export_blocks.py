@@ -0,0 +1,100 @@
+from argparse import Namespace
+import logging
+import time
+
+import pytest
+import rlp
+
+from trinity.components.builtin.import_export import component
+from trinity.components.builtin.import_export.component import ExportBlockComponent
+
+
+NUM_MINED_BLOCKS = 12
+
+
+@pytest.fixture
+def chain(chain_without_block_validation, monkeypatch):
+    for _ in range(NUM_MINED_BLOCKS):
+        chain_without_block_validation.mine_block()
+    monkeypatch.setattr(
+        component,
+        'get_chain',
+        lambda trinity_config: chain_without_block_validation,
+    )
+    return chain_without_block_validation
+
+
+def export_args(file_path, block_number=None, from_block=None, to_block=None, reader_threads=4):
+    return Namespace(
+        file_path=file_path,
+        block_number=block_number,
+        from_block=from_block,
+        to_block=to_block,
+        reader_threads=reader_threads,
+        append=False,
+        overwrite=False,
+    )
+
+
+def encode_canonical_blocks(chain, block_numbers):
+    return b''.join(
+        rlp.encode(chain.get_canonical_block_by_number(block_number))
+        for block_number in block_numbers
+    )
+
+
+@pytest.mark.parametrize('reader_threads', (1, 3, 8))
+def test_export_range_in_order(chain, tmp_path, monkeypatch, reader_threads):
+    expected = encode_canonical_blocks(chain, range(2, 11))
+    get_block = chain.get_canonical_block_by_number
+
+    def get_block_slowly(block_number):
+        # Earlier blocks take longer to read, so reads complete out of order
+        time.sleep((NUM_MINED_BLOCKS - block_number) * 0.002)
+        return get_block(block_number)
+
+    monkeypatch.setattr(chain, 'get_canonical_block_by_number', get_block_slowly)
+    file_path = tmp_path / 'blocks.rlp'
+    args = export_args(file_path, from_block=2, to_block=10, reader_threads=reader_threads)
+
+    ExportBlockComponent.run_export(args, None)
+
+    assert file_path.read_bytes() == expected
+
+
+def test_export_range_up_to_head_by_default(chain, tmp_path):
+    file_path = tmp_path / 'blocks.rlp'
+    args = export_args(file_path, from_block=5, reader_threads=2)
+
+    ExportBlockComponent.run_export(args, None)
+
+    head_number = chain.get_canonical_head().block_number
+    assert head_number == NUM_MINED_BLOCKS
+    assert file_path.read_bytes() == encode_canonical_blocks(chain, range(5, head_number + 1))
+
+
+def test_export_single_block(chain, tmp_path):
+    file_path = tmp_path / 'blocks.rlp'
+
+    ExportBlockComponent.run_export(export_args(file_path, block_number=3), None)
+
+    assert file_path.read_bytes() == encode_canonical_blocks(chain, (3,))
+
+
+@pytest.mark.parametrize(
+    'from_block, to_block',
+    (
+        (1, None),
+        (None, 5),
+        (1, 5),
+    ),
+)
+def test_export_rejects_block_number_with_range(chain, tmp_path, caplog, from_block, to_block):
+    file_path = tmp_path / 'blocks.rlp'
+    args = export_args(file_path, block_number=3, from_block=from_block, to_block=to_block)
+
+    with caplog.at_level(logging.ERROR):
+        ExportBlockComponent.run_export(args, None)
+
+    assert not file_path.exists()
+    assert "Specify either a block number or a range of blocks, not both" in caplog.text
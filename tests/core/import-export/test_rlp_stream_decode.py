@@ -0,0 +1,80 @@
+import io
+
+import pytest
+import rlp
+from rlp.exceptions import DecodingError
+
+from trinity.components.builtin.import_export.component import (
+    open_block_file,
+    prefetched,
+)
+from trinity.components.builtin.import_export.rlp_decode import (
+    iter_decode_stream,
+    read_rlp_item,
+)
+
+
+ITEMS = (
+    b'\x01',
+    b'short string',
+    b'a long string' * 10,
+    [b'a', [b'nested', b'list']],
+    [b'a long list' * 10, [b'b' * 1024]],
+)
+
+
+@pytest.mark.parametrize('item', ITEMS)
+def test_read_rlp_item(item):
+    encoded = rlp.encode(item)
+    stream = io.BytesIO(encoded + rlp.encode(b'next'))
+    assert read_rlp_item(stream) == encoded
+    assert read_rlp_item(stream) == rlp.encode(b'next')
+    assert read_rlp_item(stream) == b''
+
+
+def test_read_truncated_rlp_item():
+    encoded = rlp.encode([b'a long list' * 10])
+    with pytest.raises(DecodingError):
+        read_rlp_item(io.BytesIO(encoded[:-1]))
+
+
+def test_iter_decode_stream_can_resume():
+    encoded_items = [rlp.encode(item) for item in ITEMS]
+    stream = io.BytesIO(b''.join(encoded_items))
+
+    decoded = tuple(iter_decode_stream(stream))
+    assert tuple(item for _, item in decoded) == tuple(rlp.decode(item) for item in encoded_items)
+
+    resume_offset = decoded[2][0]
+    assert resume_offset == sum(len(item) for item in encoded_items[:3])
+
+    stream.seek(resume_offset)
+    resumed = tuple(item for _, item in iter_decode_stream(stream))
+    assert resumed == tuple(item for _, item in decoded[3:])
+
+
+def test_prefetched():
+    assert tuple(prefetched(iter(range(100)), 3)) == tuple(range(100))
+
+
+def test_prefetched_raises_errors():
+    def failing_items():
+        yield 1
+        raise DecodingError('bad block', b'')
+
+    items = prefetched(failing_items(), 3)
+    assert next(items) == 1
+    with pytest.raises(DecodingError):
+        next(items)
+
+
+@pytest.mark.parametrize('file_name', ('blocks.rlp', 'blocks.rlp.gz'))
+def test_block_file_round_trip(tmp_path, file_name):
+    file_path = tmp_path / file_name
+    with open_block_file(file_path, 'wb') as block_file:
+        for item in ITEMS:
+            block_file.write(rlp.encode(item))
+
+    with open_block_file(file_path, 'rb') as block_file:
+        decoded = tuple(item for _, item in iter_decode_stream(block_file))
+    assert decoded == tuple(rlp.decode(rlp.encode(item)) for item in ITEMS)
@@ -0,0 +1,163 @@
+import json
+
+from eth.db.atomic import AtomicDB
+from eth.tools.builder.chain import (
+    build,
+    disable_pow_check,
+    genesis,
+    latest_mainnet_at,
+)
+from eth_keys import keys
+from eth_utils import (
+    decode_hex,
+    encode_hex,
+    to_wei,
+)
+import pytest
+
+from trinity.config import TrinityConfig
+from trinity.rpc import RPCServer
+from trinity.rpc.modules import eth, initialize_eth1_modules
+from trinity.tools.chain import AsyncMiningChain
+
+
+SENDER = keys.PrivateKey(
+    decode_hex('0x45a915e4d060149eb4365960e6a7a45f334393093061116b197e3240065ff2d8')
+)
+
+# Runtime bytecode that emits a log without data, with the first 32 bytes of the call data as
+# its only topic: PUSH1 0 CALLDATALOAD PUSH1 0 PUSH1 0 LOG1 STOP
+LOGGER_CODE = decode_hex('0x600035600060 00a100'.replace(' ', ''))
+
+LOGGER_A = b'\xaa' * 20
+LOGGER_B = b'\xbb' * 20
+
+TOPIC_1 = b'\x11' * 32
+TOPIC_2 = b'\x22' * 32
+
+# The logs emitted by the transactions of each block, as (contract, topic)
+BLOCK_LOGS = (
+    ((LOGGER_A, TOPIC_1),),
+    ((LOGGER_B, TOPIC_1),),
+    ((LOGGER_A, TOPIC_2),),
+    (),
+    ((LOGGER_B, TOPIC_2), (LOGGER_A, TOPIC_1)),
+)
+
+
+@pytest.fixture
+def chain():
+    genesis_state = {
+        SENDER.public_key.to_canonical_address(): {
+            'balance': to_wei(1, 'ether'),
+            'nonce': 0,
+            'code': b'',
+            'storage': {},
+        },
+    }
+    for contract in (LOGGER_A, LOGGER_B):
+        genesis_state[contract] = {'balance': 0, 'nonce': 0, 'code': LOGGER_CODE, 'storage': {}}
+
+    chain = build(
+        AsyncMiningChain,
+        latest_mainnet_at(0),
+        disable_pow_check(),
+        genesis(db=AtomicDB(), params={'gas_limit': 3141592}, state=genesis_state),
+    )
+
+    nonce = 0
+    for logs in BLOCK_LOGS:
+        for contract, topic in logs:
+            transaction = chain.create_unsigned_transaction(
+                nonce=nonce,
+                gas_price=1,
+                gas=100000,
+                to=contract,
+                value=0,
+                data=topic,
+            ).as_signed_transaction(SENDER)
+            chain.apply_transaction(transaction)
+            nonce += 1
+        chain.mine_block()
+    return chain
+
+
+async def get_logs(event_bus, chain, log_filter):
+    trinity_config = TrinityConfig(app_identifier="eth1", network_id=1)
+    rpc = RPCServer(initialize_eth1_modules(chain, event_bus, trinity_config), chain, event_bus)
+    request = {'jsonrpc': '2.0', 'id': 3, 'method': 'eth_getLogs', 'params': [log_filter]}
+    response = json.loads(await rpc.execute(request))
+    return response.get('result'), response.get('error')
+
+
+def summarize(logs):
+    return tuple(
+        (
+            int(log['blockNumber'], 16),
+            int(log['transactionIndex'], 16),
+            int(log['logIndex'], 16),
+            log['address'],
+            tuple(log['topics']),
+        )
+        for log in logs
+    )
+
+
+@pytest.mark.parametrize(
+    'log_filter, expected',
+    (
+        (
+            {'fromBlock': '0x1', 'toBlock': '0x5', 'address': encode_hex(LOGGER_A)},
+            (
+                (1, 0, 0, encode_hex(LOGGER_A), (encode_hex(TOPIC_1),)),
+                (3, 0, 0, encode_hex(LOGGER_A), (encode_hex(TOPIC_2),)),
+                (5, 1, 1, encode_hex(LOGGER_A), (encode_hex(TOPIC_1),)),
+            ),
+        ),
+        (
+            {'fromBlock': '0x1', 'toBlock': 'latest', 'topics': [encode_hex(TOPIC_2)]},
+            (
+                (3, 0, 0, encode_hex(LOGGER_A), (encode_hex(TOPIC_2),)),
+                (5, 0, 0, encode_hex(LOGGER_B), (encode_hex(TOPIC_2),)),
+            ),
+        ),
+        (
+            {
+                'fromBlock': '0x2',
+                'toBlock': '0x5',
+                'address': [encode_hex(LOGGER_A), encode_hex(LOGGER_B)],
+                'topics': [encode_hex(TOPIC_1)],
+            },
+            (
+                (2, 0, 0, encode_hex(LOGGER_B), (encode_hex(TOPIC_1),)),
+                (5, 1, 1, encode_hex(LOGGER_A), (encode_hex(TOPIC_1),)),
+            ),
+        ),
+        (
+            {'fromBlock': '0x2', 'toBlock': '0x4', 'address': encode_hex(LOGGER_A),
+             'topics': [encode_hex(TOPIC_1)]},
+            (),
+        ),
+    ),
+)
+@pytest.mark.asyncio
+async def test_get_logs_over_block_range(event_bus, chain, log_filter, expected):
+    logs, error = await get_logs(event_bus, chain, log_filter)
+    assert error is None
+    assert summarize(logs) == expected
+
+
+@pytest.mark.asyncio
+async def test_get_logs_caps_unindexed_block_range(event_bus, chain, monkeypatch):
+    monkeypatch.setattr(eth, 'MAX_UNINDEXED_LOGS_BLOCKS', 3)
+
+    logs, error = await get_logs(event_bus, chain, {'fromBlock': '0x3', 'toBlock': '0x5'})
+    assert error is None
+    assert len(logs) == 3
+
+    logs, error = await get_logs(event_bus, chain, {'fromBlock': '0x2', 'toBlock': '0x5'})
+    assert logs is None
+    assert error == (
+        "Cannot scan 4 blocks that are not indexed for logs, the limit is 3: use a smaller "
+        "range of recent blocks"
+    )
@@ -101,7 +101,7 @@ async def get_ipc_response(
     await writer.drain()
     result_bytes = b''
     while not can_decode_json(result_bytes):
-        result_bytes += await asyncio.tasks.wait_for(reader.readuntil(b'}'), 0.25)
+        result_bytes += await asyncio.tasks.wait_for(reader.readuntil(b'}'), 2)
 
     writer.close()
     return json.loads(result_bytes.decode())
@@ -0,0 +1,105 @@
+import pytest
+
+from trinity.rpc.cache import (
+    RPCResponseCache,
+    cacheable,
+)
+
+
+class FakeHeader:
+    def __init__(self, block_number):
+        self.block_number = block_number
+        self.hash = block_number.to_bytes(32, 'big')
+
+
+class FakeChain:
+    def __init__(self, head_number):
+        self.head = FakeHeader(head_number)
+
+    def get_canonical_head(self):
+        return self.head
+
+
+class FakeModule:
+    def __init__(self):
+        self.calls = []
+
+    @cacheable(which_block_arg_name='at_block')
+    async def getBalance(self, address, at_block):
+        self.calls.append(('getBalance', address, at_block))
+        return hex(len(self.calls))
+
+    @cacheable(result_block_number_key='blockNumber')
+    async def getTransactionReceipt(self, transaction_hash):
+        self.calls.append(('getTransactionReceipt', transaction_hash))
+        return {'blockNumber': '0x10'}
+
+    async def blockNumber(self):
+        self.calls.append(('blockNumber',))
+        return hex(len(self.calls))
+
+
+async def get(cache, module, method_name, *params):
+    method = getattr(module, method_name)
+    return await cache.get_or_execute(
+        f'eth_{method_name}',
+        method,
+        params,
+        lambda: method(*params),
+    )
+
+
+@pytest.mark.asyncio
+async def test_cache_keeps_final_results_across_head_changes():
+    chain = FakeChain(head_number=100)
+    cache = RPCResponseCache(chain, confirmations=64)
+    module = FakeModule()
+
+    result = await get(cache, module, 'getBalance', '0xAB', '0x10')
+    # parameters are normalized, so differently cased hex strings share a result
+    assert await get(cache, module, 'getBalance', '0xab', '0x10') == result
+
+    chain.head = FakeHeader(101)
+    assert await get(cache, module, 'getBalance', '0xab', '0x10') == result
+    assert len(module.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_drops_unfinalized_results_on_head_change():
+    chain = FakeChain(head_number=100)
+    cache = RPCResponseCache(chain, confirmations=64)
+    module = FakeModule()
+
+    latest = await get(cache, module, 'getBalance', '0xab', 'latest')
+    recent = await get(cache, module, 'getBalance', '0xab', '0x60')
+    assert await get(cache, module, 'getBalance', '0xab', 'latest') == latest
+    assert await get(cache, module, 'getBalance', '0xab', '0x60') == recent
+    assert len(module.calls) == 2
+
+    chain.head = FakeHeader(101)
+    await get(cache, module, 'getBalance', '0xab', 'latest')
+    await get(cache, module, 'getBalance', '0xab', '0x60')
+    assert len(module.calls) == 4
+
+
+@pytest.mark.asyncio
+async def test_cache_uses_block_number_of_result():
+    chain = FakeChain(head_number=0x20)
+    cache = RPCResponseCache(chain, confirmations=64)
+    module = FakeModule()
+
+    await get(cache, module, 'getTransactionReceipt', '0x01')
+    chain.head = FakeHeader(0x10 + 64)
+    # not final when cached, so it's looked up again
+    await get(cache, module, 'getTransactionReceipt', '0x01')
+    chain.head = FakeHeader(0x10 + 65)
+    await get(cache, module, 'getTransactionReceipt', '0x01')
+    assert len(module.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_ignores_unmarked_methods():
+    cache = RPCResponseCache(FakeChain(head_number=100))
+    module = FakeModule()
+
+    assert await get(cache, module, 'blockNumber') != await get(cache, module, 'blockNumber')
@@ -60,6 +60,17 @@ def id_from_rpc_request(param):
         return repr(param)
 
 
+def drop_cached_results(ipc_server):
+    """
+    Drop the results that the RPC server cached during the sanity check, so that the next
+    request has to read the state from the database again.
+    """
+    rpc = ipc_server.rpc
+    rpc._response_cache.reset(rpc.chain)
+    # Also drops the state values cached by the eth module
+    rpc.modules['eth'].on_chain_replacement(rpc.chain)
+
+
 def can_decode_json(potential):
     try:
         json.loads(potential.decode())
@@ -206,8 +217,8 @@ def fake_beam_syncer(chain, event_bus):
 )
 @pytest.mark.asyncio
 async def test_getBalance_during_beam_sync(
-        chain, ipc_request, funded_address, funded_address_initial_balance, fake_beam_syncer,
-        at_block):
+        chain, ipc_request, ipc_server, funded_address, funded_address_initial_balance,
+        fake_beam_syncer, at_block):
     """
     Sanity check, if we call eth_getBalance we get back the expected response.
     """
@@ -219,6 +230,7 @@ async def test_getBalance_during_beam_sync(
 
     state_root_hash = chain.get_canonical_head().state_root
     state_root = chain.chaindb.db.pop(state_root_hash)
+    drop_cached_results(ipc_server)
 
     # now that the hash is missing we should receive an error
     response = await ipc_request('eth_getBalance', [funded_address.hex(), at_block])
@@ -237,7 +249,7 @@ async def test_getBalance_during_beam_sync(
 )
 @pytest.mark.asyncio
 async def test_getTransactionCount_during_beam_sync(
-        chain, ipc_request, funded_address, fake_beam_syncer,
+        chain, ipc_request, ipc_server, funded_address, fake_beam_syncer,
         at_block):
     """
     Sanity check, if we call eth_getTransactionCount we get back the expected response.
@@ -250,6 +262,7 @@ async def test_getTransactionCount_during_beam_sync(
 
     state_root_hash = chain.get_canonical_head().state_root
     state_root = chain.chaindb.db.pop(state_root_hash)
+    drop_cached_results(ipc_server)
 
     # now that the hash is missing we should receive an error
     response = await ipc_request('eth_getTransactionCount', [funded_address.hex(), at_block])
@@ -273,8 +286,8 @@ async def contract_code_hash(genesis_state, simple_contract_address):
 )
 @pytest.mark.asyncio
 async def test_getCode_during_beam_sync(
-        chain, ipc_request, simple_contract_address, contract_code_hash, fake_beam_syncer,
-        at_block):
+        chain, ipc_request, ipc_server, simple_contract_address, contract_code_hash,
+        fake_beam_syncer, at_block):
 
     # sanity check, by default it works
     response = await ipc_request('eth_getCode', [simple_contract_address.hex(), at_block])
@@ -282,6 +295,7 @@ async def test_getCode_during_beam_sync(
     assert keccak(decode_hex(response['result'])) == contract_code_hash
 
     missing_bytecode = chain.chaindb.db.pop(contract_code_hash)
+    drop_cached_results(ipc_server)
 
     # now that the hash is missing we should receive an error
     response = await ipc_request('eth_getCode', [simple_contract_address.hex(), at_block])
@@ -307,7 +321,8 @@ def storage_root(chain, simple_contract_address):
 )
 @pytest.mark.asyncio
 async def test_getStorageAt_during_beam_sync(
-        ipc_request, simple_contract_address, storage_root, chain, fake_beam_syncer, at_block):
+        ipc_request, ipc_server, simple_contract_address, storage_root, chain, fake_beam_syncer,
+        at_block):
 
     params = [simple_contract_address.hex(), 1, at_block]
 
@@ -318,6 +333,7 @@ async def test_getStorageAt_during_beam_sync(
     assert response['result'] == '0x0000000000000000000000000000000000000000000000000000000000000001'  # noqa: E501
 
     missing_node = chain.chaindb.db.pop(storage_root)
+    drop_cached_results(ipc_server)
 
     # now that the hash is missing we should receive an error
     response = await ipc_request('eth_getStorageAt', params)
@@ -348,7 +364,8 @@ def transaction(simple_contract_address):
 )
 @pytest.mark.asyncio
 async def test_eth_call(
-        ipc_request, contract_code_hash, chain, transaction, fake_beam_syncer, at_block):
+        ipc_request, ipc_server, contract_code_hash, chain, transaction, fake_beam_syncer,
+        at_block):
 
     # sanity check, by default it works
     response = await ipc_request('eth_call', [transaction, at_block])
@@ -356,6 +373,7 @@ async def test_eth_call(
     assert response['result'].endswith('002a')
 
     bytecode = chain.chaindb.db.pop(contract_code_hash)
+    drop_cached_results(ipc_server)
 
     # now that the hash is missing we should receive an error
     response = await ipc_request('eth_call', [transaction, at_block])
@@ -401,7 +419,8 @@ async def test_eth_call_multiple_missing_nodes(
 )
 @pytest.mark.asyncio
 async def test_eth_estimateGas(
-        ipc_request, contract_code_hash, chain, transaction, fake_beam_syncer, at_block):
+        ipc_request, ipc_server, contract_code_hash, chain, transaction, fake_beam_syncer,
+        at_block):
 
     # sanity check, by default it works
     response = await ipc_request('eth_estimateGas', [transaction, at_block])
@@ -409,6 +428,7 @@ async def test_eth_estimateGas(
     assert response['result'] == '0x82a8'
 
     bytecode = chain.chaindb.db.pop(contract_code_hash)
+    drop_cached_results(ipc_server)
 
     # now that the hash is missing we should receive an error
     response = await ipc_request('eth_estimateGas', [transaction, at_block])
@@ -0,0 +1,44 @@
+import asyncio
+import threading
+
+from pyformance import MetricsRegistry
+import pytest
+
+from trinity.rpc.workers import RPCWorkerPool
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_runs_methods_off_the_event_loop():
+    registry = MetricsRegistry()
+    worker_pool = RPCWorkerPool(max_workers=1, metrics_registry=registry)
+    release = threading.Event()
+
+    def slow_call():
+        release.wait(timeout=5)
+        return threading.current_thread().name
+
+    call_task = asyncio.ensure_future(worker_pool.run('eth_call', slow_call))
+    # The event loop, and other methods, are not blocked by the slow call
+    estimate_thread = await worker_pool.run('eth_estimateGas', threading.current_thread)
+    assert estimate_thread.name.startswith('rpc-eth_estimateGas')
+    assert registry.counter('trinity.rpc/eth_call/pending.counter').get_count() == 1
+
+    release.set()
+    assert (await call_task).startswith('rpc-eth_call')
+    assert registry.counter('trinity.rpc/eth_call/pending.counter').get_count() == 0
+    assert registry.histogram('trinity.rpc/eth_call/worker_latency.histogram').get_count() == 1
+
+    worker_pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_propagates_exceptions():
+    worker_pool = RPCWorkerPool()
+
+    def failing_call():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        await worker_pool.run('eth_call', failing_call)
+
+    worker_pool.shutdown()
@@ -0,0 +1,60 @@
+import pytest
+
+from trinity.rpc.state_cache import RecentStateCache
+
+
+class FakeHeader:
+    def __init__(self, block_number, state_root=None):
+        self.block_number = block_number
+        if state_root is None:
+            state_root = block_number.to_bytes(32, 'big')
+        self.state_root = state_root
+
+
+class Loader:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self):
+        self.count += 1
+        return self.count
+
+
+def test_state_cache_caches_by_state_root():
+    cache = RecentStateCache(window=4)
+    load = Loader()
+
+    assert cache.get(FakeHeader(10), 'balance', load) == 1
+    assert cache.get(FakeHeader(10), 'balance', load) == 1
+    assert cache.get(FakeHeader(10), 'nonce', load) == 2
+    # a block without transactions has the same state root as its parent
+    assert cache.get(FakeHeader(11, state_root=FakeHeader(10).state_root), 'balance', load) == 1
+    assert cache.get(FakeHeader(12), 'balance', load) == 3
+
+
+def test_state_cache_evicts_states_out_of_window():
+    cache = RecentStateCache(window=4)
+    load = Loader()
+
+    cache.get(FakeHeader(10), 'balance', load)
+    cache.get(FakeHeader(13), 'balance', load)
+    assert len(cache) == 2
+
+    cache.get(FakeHeader(14), 'balance', load)
+    assert len(cache) == 2
+
+    # too old to be cached
+    cache.get(FakeHeader(10), 'balance', load)
+    assert cache.get(FakeHeader(10), 'balance', load) == 5
+    assert len(cache) == 2
+
+
+def test_state_cache_does_not_cache_exceptions():
+    cache = RecentStateCache()
+
+    def failing_load():
+        raise KeyError('missing trie node')
+
+    with pytest.raises(KeyError):
+        cache.get(FakeHeader(1), 'balance', failing_load)
+    assert cache.get(FakeHeader(1), 'balance', lambda: 7) == 7
@@ -1,3 +1,5 @@
+import datetime
+import heapq
 from pathlib import Path
 
 import pytest
@@ -10,6 +12,7 @@ from p2p.tools.factories import (
 )
 
 from trinity.components.builtin.network_db.connection.tracker import (
+    BlacklistRecord,
     SQLiteConnectionTracker,
     MemoryConnectionTracker,
 )
@@ -66,6 +69,7 @@ async def test_sql_does_persist(tmpdir):
     connection_tracker_a.record_failure(node, HandshakeFailure())
     blacklisted_ids = await connection_tracker_a.get_blacklisted()
     assert node.id in blacklisted_ids
+    connection_tracker_a.flush()
     del connection_tracker_a
 
     # open a second instance
@@ -86,3 +90,39 @@ async def test_get_blacklisted():
     blacklisted_ids = await connection_tracker.get_blacklisted()
 
     assert blacklisted_ids == tuple([node1.id])
+
+
+@pytest.mark.asyncio
+async def test_blacklist_changes_are_written_behind():
+    node = NodeFactory()
+    connection_tracker = MemoryConnectionTracker()
+
+    connection_tracker.record_failure(node, HandshakeFailure())
+    connection_tracker.record_failure(node, HandshakeFailure())
+    assert connection_tracker.is_blacklisted(node.id)
+    assert connection_tracker.session.query(BlacklistRecord).count() == 0
+
+    connection_tracker.flush()
+    record = connection_tracker.session.query(BlacklistRecord).one()
+    assert record.error_count == 2
+
+
+@pytest.mark.asyncio
+async def test_blacklisted_peers_expire():
+    node1, node2 = NodeFactory(), NodeFactory()
+    connection_tracker = MemoryConnectionTracker()
+
+    connection_tracker.record_blacklist(node1, timeout_seconds=10, reason='')
+    connection_tracker.record_blacklist(node2, timeout_seconds=10, reason='')
+    assert sorted(await connection_tracker.get_blacklisted()) == sorted([node1.id, node2.id])
+
+    # pretend the blacklist record of node1 expired
+    expired_at = datetime.datetime.utcnow() - datetime.timedelta(seconds=1)
+    connection_tracker._entries[node1.id] = connection_tracker._entries[node1.id]._replace(
+        expires_at=expired_at,
+    )
+    heapq.heappush(connection_tracker._expiries, (expired_at, node1.id))
+
+    assert await connection_tracker.get_blacklisted() == (node2.id,)
+    assert not connection_tracker.is_blacklisted(node1.id)
+    assert connection_tracker.is_blacklisted(node2.id)
@@ -3,6 +3,7 @@ import pytest
 
 from async_service import background_asyncio_service
 
+from p2p.exceptions import PeerConnectionLost
 from p2p.tools.factories import SessionFactory
 
 from trinity.constants import TO_NETWORKING_BROADCAST_CONFIG
@@ -11,6 +12,7 @@ from trinity.protocol.common.events import (
     PeerJoinedEvent,
     PeerLeftEvent,
 )
+from trinity.protocol.common import peer_pool_event_bus
 from trinity.tools.event_bus import mock_request_response
 
 from trinity.protocol.eth.peer import ETHProxyPeerPool
@@ -103,3 +105,126 @@ async def test_removes_peers(event_bus):
             peers = await proxy_peer_pool.get_peers()
             assert len(peers) == 1
             assert peers[0].session == TEST_NODES[1]
+
+
+@pytest.mark.asyncio
+async def test_fetches_peers_only_once(event_bus):
+    do_mock = mock_request_response(
+        GetConnectedPeersRequest,
+        GetConnectedPeersResponseFactory.from_sessions(tuple()),
+        event_bus,
+    )
+
+    async with do_mock:
+        proxy_peer_pool = ETHProxyPeerPool(event_bus, TO_NETWORKING_BROADCAST_CONFIG)
+        async with background_asyncio_service(proxy_peer_pool):
+            assert len(await proxy_peer_pool.get_peers()) == 0
+
+            # The mock only answers a single request, so this would time out if the pool asked
+            # for the connected peers again.
+            peers = await asyncio.wait_for(proxy_peer_pool.get_peers(), timeout=0.5)
+            assert len(peers) == 0
+
+            await event_bus.broadcast(PeerJoinedEvent(TEST_NODES[0]))
+            # Give the peer a moment to pickup the peer
+            await asyncio.sleep(0.01)
+
+            peers = await asyncio.wait_for(proxy_peer_pool.get_peers(), timeout=0.5)
+            assert tuple(peer.session for peer in peers) == (TEST_NODES[0],)
+
+
+@pytest.mark.asyncio
+async def test_ignores_peers_that_left_during_initial_fetch(event_bus):
+    response = GetConnectedPeersResponseFactory.from_sessions(TEST_NODES[:2])
+
+    async def respond_after_peer_left():
+        async for request in event_bus.stream(GetConnectedPeersRequest):
+            # The first peer leaves after the actual pool got the request, but before the
+            # response makes it to the proxy pool.
+            await event_bus.broadcast(PeerLeftEvent(TEST_NODES[0]))
+            await asyncio.sleep(0.01)
+            await event_bus.broadcast(response, request.broadcast_config())
+            break
+
+    responder = asyncio.ensure_future(respond_after_peer_left())
+    await event_bus.wait_until_any_endpoint_subscribed_to(GetConnectedPeersRequest)
+
+    proxy_peer_pool = ETHProxyPeerPool(event_bus, TO_NETWORKING_BROADCAST_CONFIG)
+    async with background_asyncio_service(proxy_peer_pool):
+        peers = await asyncio.wait_for(proxy_peer_pool.get_peers(), timeout=1)
+        assert tuple(peer.session for peer in peers) == (TEST_NODES[1],)
+
+        # Once the initial set of peers is known, departures are tracked from it again.
+        await event_bus.broadcast(PeerLeftEvent(TEST_NODES[1]))
+        await asyncio.sleep(0.01)
+        assert len(await proxy_peer_pool.get_peers()) == 0
+
+    await responder
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_initial_fetch(event_bus):
+    response = GetConnectedPeersResponseFactory.from_sessions(TEST_NODES[:2])
+    requests = []
+
+    async def respond_slowly():
+        async for request in event_bus.stream(GetConnectedPeersRequest):
+            requests.append(request)
+            await asyncio.sleep(0.01)
+            await event_bus.broadcast(response, request.broadcast_config())
+
+    responder = asyncio.ensure_future(respond_slowly())
+    await event_bus.wait_until_any_endpoint_subscribed_to(GetConnectedPeersRequest)
+
+    try:
+        proxy_peer_pool = ETHProxyPeerPool(event_bus, TO_NETWORKING_BROADCAST_CONFIG)
+        async with background_asyncio_service(proxy_peer_pool):
+            all_peers = await asyncio.wait_for(
+                asyncio.gather(*(proxy_peer_pool.get_peers() for _ in range(3))),
+                timeout=1,
+            )
+    finally:
+        responder.cancel()
+
+    assert len(requests) == 1
+    for peers in all_peers:
+        assert tuple(peer.session for peer in peers) == TEST_NODES[:2]
+
+
+@pytest.mark.asyncio
+async def test_does_not_resurrect_peers_that_left(event_bus):
+    do_mock = mock_request_response(
+        GetConnectedPeersRequest,
+        GetConnectedPeersResponseFactory.from_sessions(TEST_NODES[:2]),
+        event_bus,
+    )
+
+    async with do_mock:
+        proxy_peer_pool = ETHProxyPeerPool(event_bus, TO_NETWORKING_BROADCAST_CONFIG)
+        async with background_asyncio_service(proxy_peer_pool):
+            assert len(await proxy_peer_pool.get_peers()) == 2
+
+            await event_bus.broadcast(PeerLeftEvent(TEST_NODES[0]))
+            await asyncio.sleep(0.01)
+
+            # A message from the peer that is handled after it left
+            with pytest.raises(PeerConnectionLost):
+                await proxy_peer_pool.ensure_proxy_peer(TEST_NODES[0])
+
+            peers = await proxy_peer_pool.get_peers()
+            assert tuple(peer.session for peer in peers) == (TEST_NODES[1],)
+
+
+@pytest.mark.asyncio
+async def test_remembers_only_recently_departed_sessions(event_bus, monkeypatch):
+    monkeypatch.setattr(peer_pool_event_bus, 'DEPARTED_SESSIONS_CACHE_SIZE', 2)
+
+    proxy_peer_pool = ETHProxyPeerPool(event_bus, TO_NETWORKING_BROADCAST_CONFIG)
+    async with background_asyncio_service(proxy_peer_pool):
+        await event_bus.wait_until_any_endpoint_subscribed_to(PeerLeftEvent)
+        # Peers leave before get_peers() is ever called
+        for session in TEST_NODES:
+            await event_bus.broadcast(PeerLeftEvent(session))
+        await asyncio.sleep(0.01)
+
+        assert set(proxy_peer_pool._departed_sessions.keys()) == set(TEST_NODES[2:])
@@ -0,0 +1,176 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import gc
+
+from eth.rlp.headers import BlockHeader
+from eth.vm.forks.byzantium.blocks import ByzantiumBlock
+from eth.vm.forks.frontier import transactions as frontier_transactions
+from eth_keys import keys
+from eth_utils import ValidationError
+import pytest
+
+from trinity.sync.common.chain import SimpleBlockImporter
+from trinity.sync.common.constants import MAX_PENDING_SENDER_RECOVERIES
+
+
+class ImportRecordingChain:
+    def __init__(self):
+        self.imported_blocks = []
+
+    async def coro_import_block(self, block, perform_validation=True):
+        self.imported_blocks.append(block)
+
+
+def _mk_block(private_key, num_transactions, block_number=1, extra_data=b''):
+    transaction_class = ByzantiumBlock.get_transaction_class()
+    transactions = [
+        transaction_class.create_unsigned_transaction(
+            nonce=nonce,
+            gas_price=1,
+            gas=21000,
+            to=b'\x01' * 20,
+            value=1,
+            data=b'',
+        ).as_signed_transaction(private_key)
+        for nonce in range(num_transactions)
+    ]
+    header = BlockHeader(
+        difficulty=1,
+        block_number=block_number,
+        gas_limit=3000000,
+        extra_data=extra_data,
+    )
+    return ByzantiumBlock(header, transactions)
+
+
+@pytest.mark.asyncio
+async def test_importer_attaches_pre_recovered_senders():
+    private_key = keys.PrivateKey(b'\x01' * 32)
+    block = _mk_block(private_key, 3)
+    chain = ImportRecordingChain()
+
+    with ThreadPoolExecutor() as executor:
+        importer = SimpleBlockImporter(chain, executor)
+        await importer.preview_transactions(block.header, block.transactions, b'\x00' * 32)
+        await importer.import_block(block)
+
+    assert chain.imported_blocks == [block]
+    for transaction in block.transactions:
+        # sender was populated before import, without recovering it on this object
+        assert transaction.__dict__['sender'] == private_key.public_key.to_canonical_address()
+
+
+@pytest.mark.asyncio
+async def test_importer_skips_signature_checks_done_by_the_executor(monkeypatch):
+    block = _mk_block(keys.PrivateKey(b'\x01' * 32), 3)
+    chain = ImportRecordingChain()
+
+    with ThreadPoolExecutor() as executor:
+        importer = SimpleBlockImporter(chain, executor)
+        await importer.preview_transactions(block.header, block.transactions, b'\x00' * 32)
+        await importer.import_block(block)
+
+    def check_signature_again(transaction):
+        raise AssertionError(f"Signature of {transaction} was checked again")
+
+    monkeypatch.setattr(
+        frontier_transactions,
+        'validate_transaction_signature',
+        check_signature_again,
+    )
+    for transaction in block.transactions:
+        # what the VM does when applying the transaction during import
+        transaction.validate()
+
+
+@pytest.mark.asyncio
+async def test_importer_leaves_invalid_signatures_to_import():
+    block = _mk_unrecoverable_block(block_number=1)
+    chain = ImportRecordingChain()
+
+    with ThreadPoolExecutor() as executor:
+        importer = SimpleBlockImporter(chain, executor)
+        await importer.preview_transactions(block.header, block.transactions, b'\x00' * 32)
+        await importer.import_block(block)
+
+    assert chain.imported_blocks == [block]
+    transaction = block.transactions[0]
+    assert 'sender' not in transaction.__dict__
+    with pytest.raises(ValidationError):
+        transaction.validate()
+
+
+@pytest.mark.asyncio
+async def test_importer_without_executor_leaves_senders_to_import():
+    block = _mk_block(keys.PrivateKey(b'\x01' * 32), 1)
+    chain = ImportRecordingChain()
+
+    importer = SimpleBlockImporter(chain)
+    await importer.preview_transactions(block.header, block.transactions, b'\x00' * 32)
+    await importer.import_block(block)
+
+    assert chain.imported_blocks == [block]
+    assert 'sender' not in block.transactions[0].__dict__
+
+
+def _mk_unrecoverable_block(block_number):
+    block = _mk_block(keys.PrivateKey(b'\x01' * 32), 1, block_number)
+    invalid_transaction = block.transactions[0].copy(r=0, s=0)
+    return block.copy(transactions=[invalid_transaction])
+
+
+@pytest.mark.asyncio
+async def test_importer_discards_recoveries_of_blocks_that_are_not_imported(event_loop):
+    private_key = keys.PrivateKey(b'\x01' * 32)
+    # A block from another peer at the same height, which never gets imported
+    sibling = _mk_block(private_key, 1, block_number=1, extra_data=b'sibling')
+    # A block whose senders can't be recovered, which isn't imported either
+    unrecoverable = _mk_unrecoverable_block(block_number=2)
+    imported = _mk_block(private_key, 1, block_number=2)
+    upcoming = _mk_block(private_key, 1, block_number=3)
+
+    unhandled_exceptions = []
+    event_loop.set_exception_handler(lambda loop, context: unhandled_exceptions.append(context))
+    try:
+        with ThreadPoolExecutor() as executor:
+            importer = SimpleBlockImporter(ImportRecordingChain(), executor)
+            for block in (sibling, unrecoverable, imported, upcoming):
+                await importer.preview_transactions(
+                    block.header,
+                    block.transactions,
+                    b'\x00' * 32,
+                )
+
+            _, failed_recovery = importer._pending_senders[unrecoverable.hash]
+            await asyncio.wait((failed_recovery,))
+
+            await importer.import_block(imported)
+
+            # Only the recovery of the upcoming block is left
+            assert tuple(importer._pending_senders) == (upcoming.hash,)
+
+        del failed_recovery
+        gc.collect()
+    finally:
+        event_loop.set_exception_handler(None)
+
+    assert unhandled_exceptions == []
+
+
+@pytest.mark.asyncio
+async def test_importer_bounds_pending_recoveries():
+    private_key = keys.PrivateKey(b'\x01' * 32)
+    blocks = tuple(
+        _mk_block(private_key, 1, block_number)
+        for block_number in range(1, MAX_PENDING_SENDER_RECOVERIES + 2)
+    )
+
+    with ThreadPoolExecutor() as executor:
+        importer = SimpleBlockImporter(ImportRecordingChain(), executor)
+        for block in blocks:
+            await importer.preview_transactions(block.header, block.transactions, b'\x00' * 32)
+
+        # The recovery of the oldest previewed block was dropped
+        assert len(importer._pending_senders) == MAX_PENDING_SENDER_RECOVERIES
+        assert blocks[0].hash not in importer._pending_senders
+        assert blocks[-1].hash in importer._pending_senders
@@ -0,0 +1,79 @@
+import time
+
+from trinity.protocol.les.commands import GetBlockBodies, GetReceipts
+from trinity.protocol.les.flow_control import FlowControlBuffer
+from trinity.protocol.les.payloads import StatusPayload
+
+
+def _mk_status(bl=None, mcr=None, mrr=None):
+    return StatusPayload(
+        version=2,
+        network_id=1,
+        head_td=1,
+        head_hash=b'\x00' * 32,
+        head_number=0,
+        genesis_hash=b'\x00' * 32,
+        serve_headers=True,
+        serve_chain_since=None,
+        serve_state_since=None,
+        serve_recent_state=None,
+        serve_recent_chain=None,
+        tx_relay=False,
+        flow_control_bl=bl,
+        flow_control_mcr=mcr,
+        flow_control_mrr=mrr,
+        announce_type=None,
+    )
+
+
+def _freeze_time(monkeypatch, now):
+    monkeypatch.setattr(time, 'monotonic', lambda: now)
+
+
+def test_flow_control_buffer_charges_and_recharges(monkeypatch):
+    _freeze_time(monkeypatch, 100)
+    buffer = FlowControlBuffer.from_status(_mk_status(
+        bl=1000,
+        mcr=((GetBlockBodies.protocol_command_id, 100, 50),),
+        mrr=10,
+    ))
+
+    cost = buffer.get_request_cost(GetBlockBodies, 4)
+    assert cost == 300
+    # no announced cost means the request is free
+    assert buffer.get_request_cost(GetReceipts, 4) == 0
+
+    buffer.spend(cost)
+    buffer.spend(cost)
+    buffer.spend(cost)
+    assert buffer.estimated_buffer == 100
+    assert not buffer.can_afford(cost)
+    # recharging 200 units at 10 per millisecond takes 20ms
+    assert buffer.seconds_until_affordable(cost) == 0.02
+
+    _freeze_time(monkeypatch, 100.03)
+    assert buffer.can_afford(cost)
+
+    # never recharges above the limit
+    _freeze_time(monkeypatch, 200)
+    assert buffer.estimated_buffer == 1000
+
+
+def test_flow_control_buffer_resyncs_with_server_value(monkeypatch):
+    _freeze_time(monkeypatch, 100)
+    buffer = FlowControlBuffer.from_status(_mk_status(bl=1000, mcr=(), mrr=10))
+
+    buffer.update(50)
+    assert buffer.estimated_buffer == 50
+
+    buffer.update(5000)
+    assert buffer.estimated_buffer == 1000
+
+
+def test_flow_control_buffer_without_parameters_is_unlimited():
+    buffer = FlowControlBuffer.from_status(_mk_status())
+
+    assert not buffer.is_limited
+    assert buffer.can_afford(10 ** 9)
+    assert buffer.seconds_until_affordable(10 ** 9) == 0
+    assert buffer.get_spare_ratio(10 ** 9) == 1.0
@@ -0,0 +1,153 @@
+import asyncio
+from pathlib import Path
+import tempfile
+import uuid
+
+from async_service import background_trio_service
+from lahja import (
+    BroadcastConfig,
+    ConnectionConfig,
+)
+from lahja.trio.endpoint import TrioEndpoint
+import pytest
+import trio
+
+from p2p.exceptions import PeerConnectionLost
+from p2p.p2p_proto import Ping
+from p2p.tools.factories import SessionFactory
+
+from trinity.constants import TO_NETWORKING_BROADCAST_CONFIG
+from trinity.protocol.common.events import SendCommandsBatchEvent
+from trinity.protocol.common.peer_pool_event_bus import (
+    DefaultPeerPoolEventServer,
+    OutboundCommandBatcher,
+)
+from trinity.protocol.eth.commands import NewBlockHashes
+from trinity.protocol.eth.payloads import NewBlockHash
+from trinity.protocol.eth.peer import ETHProxyPeerPool
+
+
+@pytest.mark.asyncio
+async def test_batcher_coalesces_commands(event_bus):
+    batches = asyncio.Queue()
+    event_bus.subscribe(SendCommandsBatchEvent, lambda event: batches.put_nowait(event.commands))
+    await event_bus.wait_until_any_endpoint_subscribed_to(SendCommandsBatchEvent)
+
+    batcher = OutboundCommandBatcher(event_bus, TO_NETWORKING_BROADCAST_CONFIG, max_batch_size=3)
+    sessions = SessionFactory.create_batch(4)
+    for session in sessions:
+        batcher.send(session, Ping(None))
+
+    # The first three commands are sent right away as the batch is full, the last one once
+    # the current iteration of the event loop is over.
+    full_batch = await asyncio.wait_for(batches.get(), timeout=1)
+    assert tuple(session for session, _ in full_batch) == tuple(sessions[:3])
+
+    last_batch = await asyncio.wait_for(batches.get(), timeout=1)
+    assert tuple(session for session, _ in last_batch) == (sessions[3],)
+    assert isinstance(last_batch[0][1], Ping)
+
+
+@pytest.mark.asyncio
+async def test_batcher_flushes_after_max_delay(event_bus):
+    batches = asyncio.Queue()
+    event_bus.subscribe(SendCommandsBatchEvent, lambda event: batches.put_nowait(event.commands))
+    await event_bus.wait_until_any_endpoint_subscribed_to(SendCommandsBatchEvent)
+
+    batcher = OutboundCommandBatcher(event_bus, TO_NETWORKING_BROADCAST_CONFIG, max_delay=0.05)
+    session = SessionFactory()
+    batcher.send(session, Ping(None))
+    await asyncio.sleep(0)
+    batcher.send(session, Ping(None))
+
+    assert batches.empty()
+    batch = await asyncio.wait_for(batches.get(), timeout=1)
+    assert len(batch) == 2
+
+
+def test_proxy_peer_sends_commands_under_trio():
+    # Trio components, like the NewBlockComponent, have no running asyncio loop to schedule the
+    # flush of a batch on, so their commands must not be held back waiting for one.
+    session = SessionFactory()
+    new_block_hash = NewBlockHash(b'\x01' * 32, 1)
+
+    async def send_through_proxy_peer(ipc_dir):
+        server_config = ConnectionConfig.from_name(str(uuid.uuid4()), base_path=ipc_dir)
+        async with TrioEndpoint.serve(server_config) as server:
+            async with TrioEndpoint(str(uuid.uuid4())).run() as client:
+                await client.connect_to_endpoints(server_config)
+
+                send_channel, receive_channel = trio.open_memory_channel(1)
+                server.subscribe(
+                    SendCommandsBatchEvent,
+                    lambda event: send_channel.send_nowait(event.commands),
+                )
+                await client.wait_until_any_endpoint_subscribed_to(SendCommandsBatchEvent)
+
+                proxy_peer_pool = ETHProxyPeerPool(
+                    client,
+                    BroadcastConfig(filter_endpoint=server_config.name),
+                )
+                async with background_trio_service(proxy_peer_pool):
+                    proxy_peer = await proxy_peer_pool.ensure_proxy_peer(session)
+                    proxy_peer.eth_api.send_new_block_hashes((new_block_hash,))
+
+                    with trio.fail_after(1):
+                        return await receive_channel.receive()
+
+    # Use a short directory, as a UNIX socket path can't be longer than ~100 characters
+    with tempfile.TemporaryDirectory() as ipc_dir:
+        batch = trio.run(send_through_proxy_peer, Path(ipc_dir))
+
+    assert len(batch) == 1
+    sent_session, command = batch[0]
+    assert sent_session == session
+    assert isinstance(command, NewBlockHashes)
+    assert command.payload == (new_block_hash,)
+
+
+class FakeSubProto:
+    def __init__(self, error=None):
+        self._error = error
+        self.sent = []
+
+    def send(self, command):
+        if self._error is not None:
+            raise self._error
+        self.sent.append(command)
+
+
+class FakePeer:
+    is_alive = True
+
+    def __init__(self, session, error=None):
+        self.session = session
+        self.sub_proto = FakeSubProto(error)
+
+
+class FakePeerPool:
+    def __init__(self, *peers):
+        self.connected_nodes = {peer.session: peer for peer in peers}
+
+
+@pytest.mark.asyncio
+async def test_server_sends_rest_of_batch_after_failed_command(event_bus):
+    healthy_peer = FakePeer(SessionFactory())
+    closed_peer = FakePeer(SessionFactory(), PeerConnectionLost("transport is closing"))
+    broken_peer = FakePeer(SessionFactory(), RuntimeError("unexpected failure"))
+    departed_session = SessionFactory()
+    server = DefaultPeerPoolEventServer(
+        event_bus,
+        FakePeerPool(healthy_peer, closed_peer, broken_peer),
+    )
+
+    commands = (
+        (closed_peer.session, Ping(None)),
+        (healthy_peer.session, Ping(None)),
+        (broken_peer.session, Ping(None)),
+        (departed_session, Ping(None)),
+        (healthy_peer.session, Ping(None)),
+    )
+    await server.handle_send_commands_batch(SendCommandsBatchEvent(commands))
+
+    assert len(healthy_peer.sub_proto.sent) == 2
@@ -11,7 +11,9 @@ from trinity.components.builtin.network_db.connection.tracker import (
     SQLiteConnectionTracker,
 )
 from trinity.components.builtin.network_db.eth1_peer_db.tracker import (
+    CANDIDATE_PAGE_SIZE,
     MemoryEth1PeerTracker,
+    Remote,
 )
 from trinity.protocol.common.peer import skip_candidate_if_on_list
 
@@ -146,6 +148,7 @@ async def do_tracker_peer_query_test(tracker_params,
     for remote, delta_seconds in blacklist_records:
         expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=delta_seconds)
         blacklist_tracker._create_record(remote, expires_at, 'test')
+    blacklist_tracker.flush()
 
     should_skip = functools.partial(skip_candidate_if_on_list, connected_remotes or set())
     candidates = tuple(
@@ -356,3 +359,54 @@ async def test_getting_peer_candidates_excludes_already_connected():
         ),
         connected_remotes=(remote_a.id,),
     )
+
+
+def test_track_peer_connection_is_buffered_until_flushed(remote):
+    tracker = MemoryEth1PeerTracker()
+    tracker.track_peer_connection(remote, *TRACK_ARGS)
+    assert tracker.session.query(Remote).count() == 0
+
+    tracker.flush()
+    assert tracker.session.query(Remote).count() == 1
+
+
+def test_buffered_connections_are_merged(remote):
+    tracker = MemoryEth1PeerTracker()
+    now = datetime.datetime.utcnow()
+    tracker.track_peer_connection(remote, True, now, *SIMPLE_META)
+    tracker.track_peer_connection(remote, False, None, ZERO_ONE_HASH, 'les', 60, 2)
+
+    record = tracker._get_remote(remote.id)
+    assert record.is_outbound is True
+    assert record.last_connected_at == now
+    assert record.genesis_hash == ZERO_ONE_HASH_HEX
+    assert record.protocol == 'les'
+
+
+@pytest.mark.asyncio
+async def test_getting_peer_candidates_across_pages():
+    tracker = MemoryEth1PeerTracker()
+    now = datetime.datetime.utcnow()
+    remotes = tuple(NodeFactory() for _ in range(CANDIDATE_PAGE_SIZE * 2))
+    for age, remote in enumerate(remotes):
+        last_connected_at = now - datetime.timedelta(seconds=age)
+        tracker.track_peer_connection(remote, True, last_connected_at, *SIMPLE_META)
+
+    # skip the whole first page of the most recently connected remotes
+    should_skip = functools.partial(
+        skip_candidate_if_on_list,
+        {remote.id for remote in remotes[:CANDIDATE_PAGE_SIZE]},
+    )
+    candidates = await tracker.get_peer_candidates(max_candidates=3, should_skip_fn=should_skip)
+    assert candidates == remotes[CANDIDATE_PAGE_SIZE:CANDIDATE_PAGE_SIZE + 3]
+
+
+@pytest.mark.asyncio
+async def test_getting_peer_candidates_caches_parsed_nodes(remote):
+    tracker = MemoryEth1PeerTracker()
+    tracker.track_peer_connection(remote, *TRACK_ARGS)
+
+    first = await tracker.get_peer_candidates(max_candidates=1, should_skip_fn=lambda _: False)
+    second = await tracker.get_peer_candidates(max_candidates=1, should_skip_fn=lambda _: False)
+    assert first == (remote,)
+    assert second[0] is first[0]
@@ -0,0 +1,227 @@
+import asyncio
+
+from async_service import background_asyncio_service
+from eth_typing import BlockNumber
+import pytest
+
+from p2p.exceptions import ConnectionBusy
+
+from trinity.protocol.eth.constants import MAX_HEADERS_FETCH
+from trinity.sync.common.constants import MAX_SKELETON_STRIDES_IN_FLIGHT
+from trinity.sync.common.headers import SkeletonSyncer
+
+
+SKIP_LENGTH = SkeletonSyncer._skip_length
+
+# How far apart the starts of consecutive strides are, when the skeleton peer serves full strides
+STRIDE_LENGTH = MAX_HEADERS_FETCH * (SKIP_LENGTH + 1) - 1
+
+# The launch header, from which the skeleton is built
+LAUNCH_BLOCK_NUMBER = 0
+
+NUM_FULL_STRIDES = 6
+
+FIRST_STRIDE_START = LAUNCH_BLOCK_NUMBER + SKIP_LENGTH
+
+# The full strides, and the ones that may be requested ahead of time past them, which come back
+# empty
+STRIDE_STARTS = tuple(
+    FIRST_STRIDE_START + stride * STRIDE_LENGTH
+    for stride in range(NUM_FULL_STRIDES + MAX_SKELETON_STRIDES_IN_FLIGHT)
+)
+FULL_STRIDE_STARTS = STRIDE_STARTS[:NUM_FULL_STRIDES]
+
+# The peers have all headers up to (but not including) the start of the stride that follows
+# the last full stride
+HEAD_BLOCK_NUMBER = STRIDE_STARTS[NUM_FULL_STRIDES] - 1
+
+
+class FakeHeader:
+    def __init__(self, block_number, fork=b''):
+        self.block_number = block_number
+        self.hash = fork + block_number.to_bytes(32, 'big')
+        self.parent_hash = fork + (block_number - 1).to_bytes(32, 'big', signed=True)
+
+    def __repr__(self):
+        return f'FakeHeader(#{self.block_number})'
+
+
+class FakeChain:
+    async def coro_validate_chain(self, parent, chain, seal_check_random_sample_rate=1):
+        pass
+
+
+class FakePeer:
+    """
+    A peer that serves headers up to HEAD_BLOCK_NUMBER, and records the skeleton parents it
+    was asked for.
+
+    Like a real peer, it serves one header request at a time, and raises ConnectionBusy if a
+    request waits too long for the previous ones.
+    """
+    max_headers_fetch = MAX_HEADERS_FETCH
+    is_alive = True
+
+    def __init__(self, name, fork=b'', lock_timeout=10):
+        self.name = name
+        self.chain_api = self
+        self._fork = fork
+        self._lock = asyncio.Lock()
+        self._lock_timeout = lock_timeout
+        self.requests = []
+        self.cancelled_requests = []
+
+    def __repr__(self):
+        return f'FakePeer({self.name})'
+
+    @property
+    def parent_requests(self):
+        return tuple(
+            start for start, skip in self.requests
+            if skip == SKIP_LENGTH and start in STRIDE_STARTS
+        )
+
+    async def get_block_headers(self, start_at, max_headers, skip, reverse):
+        try:
+            await asyncio.wait_for(self._lock.acquire(), timeout=self._lock_timeout)
+        except asyncio.TimeoutError:
+            raise ConnectionBusy(f"Timed out waiting for the request lock of {self}")
+
+        try:
+            self.requests.append((start_at, skip))
+            await self._respond(start_at, skip)
+        except asyncio.CancelledError:
+            self.cancelled_requests.append((start_at, skip))
+            raise
+        finally:
+            self._lock.release()
+
+        block_numbers = range(start_at, HEAD_BLOCK_NUMBER + 1, skip + 1)[:max_headers]
+        return tuple(FakeHeader(BlockNumber(number), self._fork) for number in block_numbers)
+
+    async def _respond(self, start_at, skip):
+        await asyncio.sleep(0.001)
+
+
+class StallingPeer(FakePeer):
+    async def _respond(self, start_at, skip):
+        raise asyncio.TimeoutError
+
+
+class FakePeerPool:
+    def __init__(self, *peers):
+        self.connected_nodes = {peer.name: peer for peer in peers}
+
+
+class LaunchedSkeletonSyncer(SkeletonSyncer):
+    async def _find_launch_headers(self, peer):
+        return (FakeHeader(BlockNumber(LAUNCH_BLOCK_NUMBER)),)
+
+
+async def sync_skeleton(peer, peer_pool=None):
+    syncer = LaunchedSkeletonSyncer(FakeChain(), None, peer, peer_pool=peer_pool)
+    emitted_headers = []
+
+    async def consume_segments():
+        async for segment in syncer.skeleton_segments():
+            emitted_headers.extend(segment)
+
+    async with background_asyncio_service(syncer) as manager:
+        consumer = asyncio.ensure_future(consume_segments())
+        await asyncio.wait_for(manager.wait_finished(), timeout=10)
+        consumer.cancel()
+
+    emitted_numbers = [header.block_number for header in emitted_headers]
+    assert emitted_numbers[0] == LAUNCH_BLOCK_NUMBER
+    assert emitted_numbers[-1] == HEAD_BLOCK_NUMBER
+    assert emitted_numbers == sorted(emitted_numbers)
+    # all headers are from the chain of the skeleton peer
+    assert all(header.hash == FakeHeader(header.block_number).hash for header in emitted_headers)
+
+    return syncer
+
+
+@pytest.mark.asyncio
+async def test_skeleton_strides_line_up_with_full_responses():
+    peer = FakePeer('skeleton')
+
+    await sync_skeleton(peer)
+
+    # Every stride lines up with the previous one, and without any other peer to serve them,
+    # strides are requested one at a time.
+    assert peer.parent_requests == STRIDE_STARTS[:NUM_FULL_STRIDES + 1]
+    children_requests = tuple(
+        start for start, skip in peer.requests
+        if skip == SKIP_LENGTH and start not in STRIDE_STARTS
+    )
+    assert children_requests == tuple(start + 1 for start in FULL_STRIDE_STARTS)
+    assert peer.cancelled_requests == []
+
+
+@pytest.mark.asyncio
+async def test_skeleton_strides_are_spread_across_witnesses():
+    peer = FakePeer('skeleton')
+    witnesses = tuple(FakePeer(f'witness-{index}') for index in range(3))
+
+    syncer = await sync_skeleton(peer, FakePeerPool(peer, *witnesses))
+
+    # The parents of all full strides were served by witnesses, concurrently, and the skeleton
+    # peer only served their children.
+    witnessed_strides = sorted(
+        start for witness in witnesses for start in witness.parent_requests
+        if start in FULL_STRIDE_STARTS
+    )
+    assert witnessed_strides == list(FULL_STRIDE_STARTS)
+    assert not any(start in FULL_STRIDE_STARTS for start in peer.parent_requests)
+    assert sum(1 for witness in witnesses if witness.parent_requests) > 1
+    assert all(
+        (start + 1, SKIP_LENGTH) in peer.requests
+        for start in FULL_STRIDE_STARTS
+    )
+    # Only the strides past the head may be cancelled, once the skeleton is complete
+    for witness in (peer, ) + witnesses:
+        assert not any(start <= HEAD_BLOCK_NUMBER for start, _ in witness.cancelled_requests)
+    assert not syncer._busy_witnesses
+
+
+async def _hold_request_lock(peer, seconds):
+    async with peer._lock:
+        await asyncio.sleep(seconds)
+
+
+@pytest.mark.asyncio
+async def test_busy_witness_is_stalled_and_skeleton_peer_takes_over():
+    peer = FakePeer('skeleton')
+    # A witness that is busy serving another syncer, like the HeaderMeatSyncer
+    witness = FakePeer('busy-witness', lock_timeout=0.01)
+    holder = asyncio.ensure_future(_hold_request_lock(witness, 5))
+    await asyncio.sleep(0)
+
+    try:
+        syncer = await sync_skeleton(peer, FakePeerPool(peer, witness))
+    finally:
+        holder.cancel()
+
+    assert witness.requests == []
+    assert witness in syncer._stalled_witnesses
+    assert peer.parent_requests == STRIDE_STARTS[:NUM_FULL_STRIDES + 1]
+
+
+@pytest.mark.parametrize(
+    'make_witness',
+    (
+        lambda: StallingPeer('stalling-witness'),
+        lambda: FakePeer('forked-witness', fork=b'fork'),
+    ),
+    ids=('stalling', 'forked'),
+)
+@pytest.mark.asyncio
+async def test_failing_witness_is_stalled_and_skeleton_peer_takes_over(make_witness):
+    peer = FakePeer('skeleton')
+    witness = make_witness()
+
+    syncer = await sync_skeleton(peer, FakePeerPool(peer, witness))
+
+    assert witness.parent_requests == (FIRST_STRIDE_START, )
+    assert witness in syncer._stalled_witnesses
+    assert peer.parent_requests == STRIDE_STARTS[:NUM_FULL_STRIDES + 1]
@@ -2,11 +2,12 @@ import tempfile
 import logging
 from multiprocessing import Process
 from pathlib import Path
+from queue import Queue
 import uuid
 
 import pytest
 
-from trinity._utils.logging import IPCListener, IPCHandler
+from trinity._utils.logging import BatchedLogShipper, IPCListener, IPCHandler
 
 
 @pytest.fixture
@@ -59,3 +60,26 @@ def test_queued_logging(ipc_path):
     assert 'error log' in error_log.message
     assert 'info log' in info_log.message
     assert 'debug log' in debug_log.message
+
+
+def test_batched_log_shipper_sends_queued_records_together():
+    class HandlerForTest:
+        def __init__(self):
+            self.batches = []
+
+        def emit_batch(self, records):
+            self.batches.append(tuple(record.msg for record in records))
+
+    def mk_record(msg):
+        return logging.LogRecord('test', logging.INFO, __file__, 1, msg, None, None)
+
+    log_queue = Queue()
+    handler = HandlerForTest()
+    shipper = BatchedLogShipper(log_queue, handler, max_batch_size=2)
+    for msg in ('a', 'b', 'c'):
+        log_queue.put(mk_record(msg))
+
+    shipper.start()
+    shipper.stop()
+
+    assert handler.batches == [('a', 'b'), ('c',)]
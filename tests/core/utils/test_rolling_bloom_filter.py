@@ -30,3 +30,34 @@ def test_rolling_bloom_maintains_history():
     for value in bloom_values[10:]:
         assert value in bloom
     assert b'\xff' in bloom
+
+
+def test_rolling_bloom_forgets_oldest_generation():
+    bloom = RollingBloom(generation_size=10, max_generations=3)
+
+    generations = tuple(
+        tuple(bytes((generation, i)) for i in range(10))
+        for generation in range(4)
+    )
+    for values in generations[:3]:
+        for value in values:
+            bloom.add(value)
+    assert all(value in bloom for values in generations[:3] for value in values)
+
+    # starting the fourth generation clears the first one
+    for value in generations[3]:
+        bloom.add(value)
+
+    # allow for some false positives
+    assert sum(value in bloom for value in generations[0]) <= 3
+    assert all(value in bloom for values in generations[1:] for value in values)
+
+
+def test_rolling_bloom_false_positive_rate():
+    bloom = RollingBloom(generation_size=1000, max_generations=2, error_rate=0.01)
+    for i in range(2000):
+        bloom.add(i.to_bytes(4, 'big') + b'in')
+
+    false_positives = sum(i.to_bytes(4, 'big') + b'out' in bloom for i in range(10000))
+    # two full generations with a false positive rate of 1% each
+    assert false_positives < 10000 * 0.04
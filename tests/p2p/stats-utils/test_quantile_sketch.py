@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from p2p.stats.percentile import Percentile
+from p2p.stats.sketch import (
+    DDSketch,
+    SketchPercentile,
+)
+
+
+def exact_quantile(values, quantile):
+    return sorted(values)[int(quantile * (len(values) - 1))]
+
+
+@pytest.mark.parametrize('quantile', (0, 0.1, 0.5, 0.9, 0.99, 1))
+def test_ddsketch_relative_accuracy(quantile):
+    values = [random.lognormvariate(0, 2) for _ in range(5000)]
+    sketch = DDSketch(relative_accuracy=0.01)
+    for value in values:
+        sketch.update(value)
+
+    expected = exact_quantile(values, quantile)
+    assert abs(sketch.quantile(quantile) - expected) <= expected * 0.01
+
+
+def test_ddsketch_counts_zeros():
+    sketch = DDSketch()
+    for value in (0, 0, 0, 1):
+        sketch.update(value)
+
+    assert sketch.quantile(0.5) == 0
+    assert abs(sketch.quantile(1) - 1) <= 0.01
+
+
+def test_ddsketch_rejects_negative_values():
+    with pytest.raises(ValueError):
+        DDSketch().update(-1)
+
+
+def test_ddsketch_without_data():
+    with pytest.raises(ValueError):
+        DDSketch().quantile(0.5)
+
+
+def test_ddsketch_merge():
+    values_a = [random.uniform(0.01, 10) for _ in range(1000)]
+    values_b = [random.uniform(10, 1000) for _ in range(1000)]
+    sketch_a, sketch_b, sketch_all = DDSketch(), DDSketch(), DDSketch()
+    for value in values_a:
+        sketch_a.update(value)
+        sketch_all.update(value)
+    for value in values_b:
+        sketch_b.update(value)
+        sketch_all.update(value)
+
+    sketch_a.merge(sketch_b)
+    assert sketch_a.count == 2000
+    for quantile in (0.1, 0.5, 0.99):
+        assert sketch_a.quantile(quantile) == sketch_all.quantile(quantile)
+
+
+def test_ddsketch_memory_is_bounded():
+    sketch = DDSketch(relative_accuracy=0.01, max_buckets=64)
+    for exponent in range(-100, 100):
+        sketch.update(10 ** (exponent / 10))
+
+    assert len(sketch._buckets) <= 64
+    # the highest quantiles are still accurate
+    assert abs(sketch.quantile(1) - 10 ** 9.9) <= 10 ** 9.9 * 0.01
+
+
+@pytest.mark.parametrize(
+    'data,percentile,window_size,expected',
+    (
+        (range(1, 7), 0.2, 6, 2),
+        (range(1, 12), 0.4, 11, 5),
+        (range(1, 101), 0.99, 200, 99),
+    ),
+)
+def test_sketch_percentile(data, percentile, window_size, expected):
+    sketch_percentile = SketchPercentile(percentile=percentile, window_size=window_size)
+    for value in data:
+        sketch_percentile.update(value)
+
+    assert abs(sketch_percentile.value - expected) <= expected * 0.01
+
+
+def test_sketch_percentile_forgets_old_values():
+    sketch_percentile = SketchPercentile(percentile=0.99, window_size=10)
+    exact_percentile = Percentile(percentile=0.99, window_size=10)
+    for value in [1000] * 10 + [1] * 20:
+        sketch_percentile.update(value)
+        exact_percentile.update(value)
+
+    assert sketch_percentile.value == exact_percentile.value == 1
@@ -0,0 +1,25 @@
+import pickle
+
+from p2p.disconnect import DisconnectReason
+from p2p.p2p_proto import Disconnect
+
+
+def test_command_is_pickled_with_encoded_payload():
+    cmd = Disconnect(DisconnectReason.TOO_MANY_PEERS)
+    result = pickle.loads(pickle.dumps(cmd))
+
+    assert isinstance(result, Disconnect)
+    # The payload is only decoded when it is accessed
+    assert not hasattr(result, '_payload')
+    assert result.encoded_payload == cmd.encoded_payload
+    assert result.payload == DisconnectReason.TOO_MANY_PEERS
+
+
+def test_decoded_command_is_forwarded_without_reencoding():
+    message = Disconnect(DisconnectReason.TOO_MANY_PEERS).encode(0x01, snappy_support=False)
+    cmd = Disconnect.decode(message, snappy_support=False)
+    assert cmd.encoded_payload == message.encoded_payload
+
+    forwarded = pickle.loads(pickle.dumps(cmd))
+    assert forwarded.encode(0x01, snappy_support=False) == message
+    assert not hasattr(forwarded, '_payload')
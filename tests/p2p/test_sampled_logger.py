@@ -0,0 +1,57 @@
+import logging
+import time
+
+from p2p.logging import SampledLogger
+from p2p._utils import get_logger
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _mk_logger(name, level):
+    logger = get_logger(name)
+    logger.setLevel(level)
+    logger.propagate = False
+    handler = RecordingHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def test_sampled_logger_drops_records_over_the_limit(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr(time, 'monotonic', lambda: now)
+    logger, handler = _mk_logger('p2p.testing.sampled', logging.DEBUG)
+    sampled_logger = SampledLogger(logger, max_per_interval=2, interval=1)
+
+    for i in range(5):
+        sampled_logger.debug("message %d", i)
+    sampled_logger.debug("other message")
+    assert [record.getMessage() for record in handler.records] == [
+        "message 0",
+        "message 1",
+        "other message",
+    ]
+
+    now = 101.0
+    sampled_logger.debug("message %d", 5)
+    assert handler.records[-1].getMessage() == "message 5 (3 similar records dropped)"
+    sampled_logger.debug("message %d", 6)
+    assert handler.records[-1].getMessage() == "message 6"
+
+
+def test_sampled_logger_skips_disabled_levels():
+    logger, handler = _mk_logger('p2p.testing.sampled_info', logging.INFO)
+    sampled_logger = SampledLogger(logger)
+
+    sampled_logger.debug("not logged")
+    sampled_logger.debug2("not logged either")
+    sampled_logger.info("logged")
+
+    assert [record.getMessage() for record in handler.records] == ["logged"]
+    assert sampled_logger._counts.keys() == {"logged"}
@@ -1,40 +1,76 @@
-import collections
-from typing import Deque
-
-from bloom_filter import (
-    BloomFilter
-)
+import hashlib
+import math
+from typing import Tuple
 
 
 class RollingBloom:
-    def __init__(self, generation_size: int, max_generations: int) -> None:
+    """
+    A bloom filter which remembers the items added during the last ``max_generations``
+    generations of ``generation_size`` items each.
+
+    All generations share a single bit array, in which every bit index of the filter has a row
+    with one bit per generation. The bit indexes of an item are computed once, and the item is
+    a member if any generation has all of them set, which is a single AND over their rows
+    regardless of the number of generations. Starting a new generation clears the bits of the
+    oldest one.
+    """
+    def __init__(self,
+                 generation_size: int,
+                 max_generations: int,
+                 error_rate: float = 0.1) -> None:
         if generation_size < 1:
             raise ValueError(f"generation_size must be a positive integer: got {generation_size}")
         if max_generations < 2:
             raise ValueError(f"max_generations must be 2 or more: got {max_generations}")
+        if not 0 < error_rate < 1:
+            raise ValueError(f"error_rate must be between 0 and 1: got {error_rate}")
         self._max_bloom_elements = generation_size
-        self._max_history = max_generations - 1
-        self._history: Deque[BloomFilter] = collections.deque()
-        self._active = BloomFilter(max_elements=self._max_bloom_elements)
+        self._max_generations = max_generations
+
+        # Sized for ``error_rate`` false positives within a single full generation
+        self._num_bits = math.ceil(-generation_size * math.log(error_rate) / math.log(2) ** 2)
+        self._num_hashes = max(1, round(self._num_bits / generation_size * math.log(2)))
+
+        self._row_size = math.ceil(max_generations / 8)
+        self._bits = bytearray(self._num_bits * self._row_size)
+        self._active_generation = 0
         self._items_in_active = 0
 
     def add(self, key: bytes) -> None:
-        # before adding the value check if the active bloom filter is full.  If
-        # so, push it into the history and make a new one.
+        # before adding the value check if the active generation is full.  If
+        # so, start a new one in place of the oldest generation.
         if self._items_in_active >= self._max_bloom_elements:
-            self._history.appendleft(self._active)
-            self._active = BloomFilter(max_elements=self._max_bloom_elements)
+            self._active_generation = (self._active_generation + 1) % self._max_generations
+            self._clear_generation(self._active_generation)
             self._items_in_active = 0
 
-            # discard any old history that is older than the number of
-            # generations we should be retaining.
-            while len(self._history) > self._max_history:
-                self._history.pop()
-
-        self._active.add(key)
+        byte_offset, bit = divmod(self._active_generation, 8)
+        mask = 1 << bit
+        for index in self._get_indexes(key):
+            self._bits[index * self._row_size + byte_offset] |= mask
         self._items_in_active += 1
 
     def __contains__(self, key: bytes) -> bool:
-        if key in self._active:
-            return True
-        return any(key in bloom for bloom in self._history)
+        generations = -1
+        for index in self._get_indexes(key):
+            start = index * self._row_size
+            generations &= int.from_bytes(self._bits[start:start + self._row_size], 'little')
+            if not generations:
+                return False
+        return True
+
+    def _get_indexes(self, key: bytes) -> Tuple[int, ...]:
+        # Derive all indexes from two 64 bit hashes (Kirsch-Mitzenmacher)
+        digest = hashlib.blake2b(key, digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little')
+        return tuple(
+            (first + i * second) % self._num_bits
+            for i in range(self._num_hashes)
+        )
+
+    def _clear_generation(self, generation: int) -> None:
+        byte_offset, bit = divmod(generation, 8)
+        clear_bit = bytes(value & ~(1 << bit) for value in range(256))
+        rows = slice(byte_offset, None, self._row_size)
+        self._bits[rows] = self._bits[rows].translate(clear_bit)
@@ -1,7 +1,7 @@
 from typing import Iterator
 import contextlib
 
-from eth.abc import ChainAPI
+from eth.abc import AtomicDatabaseAPI, ChainAPI
 from eth.db.chain import ChainDB
 
 from lahja import EndpointAPI
@@ -22,22 +22,29 @@ from trinity.db.manager import DBClient
 @contextlib.contextmanager
 def get_eth1_chain_with_remote_db(boot_info: BootInfo,
                                   event_bus: EndpointAPI) -> Iterator[ChainAPI]:
+    base_db = DBClient.connect(boot_info.trinity_config.database_ipc_path)
+    with base_db:
+        yield get_eth1_chain_with_db(boot_info, event_bus, base_db)
+
+
+def get_eth1_chain_with_db(boot_info: BootInfo,
+                           event_bus: EndpointAPI,
+                           base_db: AtomicDatabaseAPI) -> ChainAPI:
+    """
+    Build the configured eth1 chain on top of an already connected database. The caller
+    is responsible for closing the database connection.
+    """
     app_config = boot_info.trinity_config.get_app_config(Eth1AppConfig)
     chain_config = app_config.get_chain_config()
 
-    chain: ChainAPI
-    base_db = DBClient.connect(boot_info.trinity_config.database_ipc_path)
-    with base_db:
-        if boot_info.args.sync_mode == SYNC_LIGHT:
-            header_db = AsyncHeaderDB(base_db)
-            chain = chain_config.light_chain_class(
-                header_db,
-                peer_chain=EventBusLightPeerChain(event_bus)
-            )
-        else:
-            chain = chain_config.full_chain_class(base_db)
-
-        yield chain
+    if boot_info.args.sync_mode == SYNC_LIGHT:
+        header_db = AsyncHeaderDB(base_db)
+        return chain_config.light_chain_class(
+            header_db,
+            peer_chain=EventBusLightPeerChain(event_bus)
+        )
+    else:
+        return chain_config.full_chain_class(base_db)
 
 
 @contextlib.contextmanager
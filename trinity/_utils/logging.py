@@ -6,19 +6,24 @@ from logging import (
 )
 from logging.handlers import (
     QueueHandler,
-    QueueListener,
     RotatingFileHandler,
 )
 import os
 from pathlib import Path
 import pickle
-from queue import Queue
+from queue import (
+    Empty,
+    Queue,
+)
 import socket
 import sys
+import threading
 from types import TracebackType
 from typing import (
     Dict,
     Iterator,
+    List,
+    Sequence,
     Type,
     TypeVar,
 )
@@ -36,6 +41,9 @@ from trinity.boot_info import BootInfo
 LOG_BACKUP_COUNT = 20
 LOG_MAX_MB = 5
 
+# Maximum number of log records sent to the main process in a single message
+LOG_BATCH_MAX_RECORDS = 500
+
 
 THandler = TypeVar("THandler", bound="IPCHandler")
 
@@ -92,12 +100,71 @@ class IPCHandler(logging.Handler):
         return new_record
 
     def emit(self, record: logging.LogRecord) -> None:
+        self.emit_batch((record,))
+
+    def emit_batch(self, records: Sequence[logging.LogRecord]) -> None:
+        """
+        Send all the records (at or above the level of this handler) in a single message.
+        """
+        records = tuple(record for record in records if record.levelno >= self.level)
+        if not records:
+            return
         try:
-            msg_data = pickle.dumps(self.prepare(record))
+            msg_data = pickle.dumps(tuple(self.prepare(record) for record in records))
             msg_length_data = len(msg_data).to_bytes(4, 'big')
             self._socket.sendall(msg_length_data + msg_data)
         except Exception:
-            self.handleError(record)
+            for record in records:
+                self.handleError(record)
+
+
+class BatchedLogShipper:
+    """
+    Pass the log records put into a queue on to an :class:`IPCHandler`, from a thread.
+
+    All the records that are in the queue when the thread gets to it are sent in a single
+    message, so a process that logs a lot doesn't pay for one socket write per record.
+    """
+    _sentinel = None
+
+    def __init__(self,
+                 queue: 'Queue[logging.LogRecord]',
+                 handler: IPCHandler,
+                 max_batch_size: int = LOG_BATCH_MAX_RECORDS) -> None:
+        self.queue = queue
+        self.handler = handler
+        self._max_batch_size = max_batch_size
+        self._thread: threading.Thread = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._ship, name='log-shipper', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.queue.put_nowait(self._sentinel)
+        self._thread.join()
+        self._thread = None
+
+    def _ship(self) -> None:
+        is_stopping = False
+        while not is_stopping:
+            batch: List[logging.LogRecord] = []
+            # Wait for the first record, then take whatever else is already queued
+            record = self.queue.get()
+            while True:
+                if record is self._sentinel:
+                    is_stopping = True
+                    break
+                batch.append(record)
+                if len(batch) >= self._max_batch_size:
+                    break
+                try:
+                    record = self.queue.get_nowait()
+                except Empty:
+                    break
+
+            if batch:
+                self.handler.emit_batch(batch)
 
 
 class IPCListener(IPCSocketServer):
@@ -129,11 +196,12 @@ class IPCListener(IPCSocketServer):
                 self.logger.exception("Error reading serialized log record data")
                 break
 
-            record = pickle.loads(record_bytes)
+            records = pickle.loads(record_bytes)
 
-            for handler in self.handlers:
-                if record.levelno >= handler.level:
-                    handler.handle(record)
+            for record in records:
+                for handler in self.handlers:
+                    if record.levelno >= handler.level:
+                        handler.handle(record)
 
 
 class TrinityLogFormatter(logging.Formatter):
@@ -231,13 +299,9 @@ def child_process_logging(boot_info: BootInfo) -> Iterator[None]:
     # Push all logs into a queue, because sometimes pushing into the socket is
     #   slow and we don't want to block the event loop. Inspired by:
     # https://docs.python.org/3.8/howto/logging-cookbook.html#dealing-with-handlers-that-block
-    log_queue: Queue[str] = Queue(-1)
+    log_queue: Queue[logging.LogRecord] = Queue(-1)
     queue_handler = QueueHandler(log_queue)
-    queue_listener = QueueListener(
-        log_queue,
-        ipc_handler,
-        respect_handler_level=True,
-    )
+    log_shipper = BatchedLogShipper(log_queue, ipc_handler)
 
     logger.addHandler(queue_handler)
 
@@ -247,12 +311,12 @@ def child_process_logging(boot_info: BootInfo) -> Iterator[None]:
         os.getpid(),
     )
     with ipc_handler:
-        queue_listener.start()
+        log_shipper.start()
         try:
             yield
         finally:
             logger.removeHandler(queue_handler)
-            queue_listener.stop()
+            log_shipper.stop()
 
 
 def _set_environ_if_missing(name: str, val: str) -> None:
@@ -1,12 +1,30 @@
+import collections
 import contextlib
 import cProfile
 import functools
+from pathlib import Path
+import sys
+import threading
+import time
+from types import FrameType
 from typing import (
     Any,
     Callable,
+    Counter,
+    Dict,
     Iterator,
+    List,
 )
 
+from trinity._utils.logging import get_logger
+
+
+# Seconds between two samples of the stacks of all threads
+SAMPLING_PROFILER_INTERVAL = 0.01
+
+# Seconds between two writes of the collected samples to disk
+SAMPLING_PROFILER_FLUSH_INTERVAL = 60
+
 
 @contextlib.contextmanager
 def profiler(filename: str) -> Iterator[None]:
@@ -31,3 +49,110 @@ def setup_cprofiler(filename: str) -> Callable[..., Any]:
                 return fn(*args, **kwargs)
         return inner
     return outer
+
+
+def collapse_stack(frame: FrameType, thread_name: str) -> str:
+    """
+    Return the stack ending in the given frame in the collapsed format used by flamegraph
+    tools: semicolon separated frames, outermost first.
+    """
+    frames: List[str] = []
+    while frame is not None:
+        code = frame.f_code
+        frames.append(f'{code.co_name} ({code.co_filename}:{code.co_firstlineno})')
+        frame = frame.f_back
+    frames.append(thread_name)
+    return ';'.join(reversed(frames))
+
+
+class SamplingProfiler:
+    """
+    Sample the stacks of all threads of the current process from a background thread, and
+    periodically write them to ``<output_dir>/<name>-<timestamp>.collapsed`` files, in the
+    format expected by ``flamegraph.pl`` and compatible tools.
+
+    Unlike :func:`profiler`, the profiled code isn't instrumented, so the overhead is low
+    enough to leave this running on a live node.
+    """
+    logger = get_logger('trinity._utils.profiling.SamplingProfiler')
+
+    def __init__(self,
+                 output_dir: Path,
+                 name: str,
+                 interval: float = SAMPLING_PROFILER_INTERVAL,
+                 flush_interval: float = SAMPLING_PROFILER_FLUSH_INTERVAL) -> None:
+        self._output_dir = output_dir
+        self._name = name
+        self._interval = interval
+        self._flush_interval = flush_interval
+        self._samples: Counter[str] = collections.Counter()
+        self._flush_count = 0
+        self._stopped = threading.Event()
+        self._thread: threading.Thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        if self.is_running:
+            raise Exception(f"{self} is already running")
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f'sampling-profiler-{self._name}',
+            daemon=True,
+        )
+        self._thread.start()
+        self.logger.info("Started sampling profiler, writing to %s", self._output_dir)
+
+    def stop(self) -> None:
+        """
+        Stop sampling, and write out the samples collected since the last flush.
+        """
+        if not self.is_running:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self.flush()
+        self.logger.info("Stopped sampling profiler")
+
+    def sample(self) -> None:
+        own_ident = threading.get_ident()
+        thread_names: Dict[int, str] = {
+            thread.ident: thread.name for thread in threading.enumerate()
+        }
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            thread_name = thread_names.get(ident, str(ident))
+            self._samples[collapse_stack(frame, thread_name)] += 1
+
+    def flush(self) -> None:
+        if not self._samples:
+            return
+        samples, self._samples = self._samples, collections.Counter()
+
+        self._flush_count += 1
+        timestamp = time.strftime('%Y%m%d-%H%M%S')
+        path = self._output_dir / f'{self._name}-{timestamp}-{self._flush_count}.collapsed'
+        self._output_dir.mkdir(parents=True, exist_ok=True)
+        with path.open('w') as output_file:
+            for stack, count in samples.items():
+                output_file.write(f'{stack} {count}\n')
+        self.logger.debug("Wrote %d distinct stacks to %s", len(samples), path)
+
+    def _run(self) -> None:
+        next_flush_at = time.monotonic() + self._flush_interval
+        while not self._stopped.wait(self._interval):
+            self.sample()
+            if time.monotonic() >= next_flush_at:
+                try:
+                    self.flush()
+                except OSError as err:
+                    self.logger.warning("Failed to write sampling profiler output: %s", err)
+                next_flush_at = time.monotonic() + self._flush_interval
+
+    def __str__(self) -> str:
+        return f'SamplingProfiler<{self._name}>'
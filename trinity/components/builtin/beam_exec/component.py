@@ -44,7 +44,7 @@ class BeamChainExecutionComponent(AsyncioIsolatedComponent):
 
         if self._boot_info.args.enable_metrics:
             metrics_service = metrics_service_from_args(
-                self._boot_info.args, AsyncioMetricsService)
+                self._boot_info.args, AsyncioMetricsService, event_bus)
         else:
             # Use a NoopMetricsService so that no code branches need to be taken if metrics
             # are disabled
@@ -3,14 +3,33 @@ from argparse import (
     Namespace,
     _SubParsersAction,
 )
+import collections
+from concurrent.futures import (
+    Future,
+    ThreadPoolExecutor,
+)
+import gzip
 import logging
 import pathlib
+import queue
+import threading
+from typing import (
+    Any,
+    BinaryIO,
+    Deque,
+    Generator,
+    Iterator,
+    TypeVar,
+    cast,
+)
 
 import rlp
+from rlp.exceptions import DecodingError
 
 from eth_utils import ValidationError
 
 from eth.abc import ChainAPI
+from eth_typing import BlockNumber
 from eth.db.atomic import AtomicDB
 from eth.db.backends.level import LevelDB
 from eth.exceptions import HeaderNotFound
@@ -26,7 +45,86 @@ from trinity.initialization import (
     ensure_eth1_dirs,
     initialize_database,
 )
-from .rlp_decode import decode_all
+from trinity._utils.timer import Timer
+from .rlp_decode import iter_decode_stream
+
+
+TItem = TypeVar('TItem')
+
+# Size of the read buffer of the file blocks are imported from
+IMPORT_BUFFER_SIZE = 1024 * 1024
+
+# Maximum number of blocks that are decoded ahead of the one being imported
+IMPORT_PREFETCH_SIZE = 64
+
+# Number of imported blocks between two writes of the checkpoint used by ``--resume``
+IMPORT_CHECKPOINT_INTERVAL = 1000
+
+# Number of threads reading blocks from the database during an export
+EXPORT_READER_THREADS = 4
+
+# Seconds between two progress reports
+PROGRESS_INTERVAL = 10
+
+
+def prefetched(items: Iterator[TItem],
+               max_prefetched: int) -> Generator[TItem, None, None]:
+    """
+    Iterate over ``items`` in a worker thread, which runs at most ``max_prefetched`` items
+    ahead of the caller. Exceptions raised by ``items`` are re-raised to the caller.
+    """
+    item_queue: 'queue.Queue[Any]' = queue.Queue(max_prefetched)
+    stopped = threading.Event()
+    done = object()
+
+    def _put(item: Any) -> None:
+        while not stopped.is_set():
+            try:
+                item_queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            else:
+                return
+
+    def _produce() -> None:
+        try:
+            for item in items:
+                if stopped.is_set():
+                    return
+                _put(item)
+        except Exception as exc:
+            _put(exc)
+        else:
+            _put(done)
+
+    worker = threading.Thread(target=_produce, name='prefetch', daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = item_queue.get()
+            if item is done:
+                return
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        stopped.set()
+        worker.join()
+
+
+def open_block_file(file_path: pathlib.Path, mode: str) -> BinaryIO:
+    """
+    Open a file of RLP encoded blocks, which is gzip compressed if its name ends in ``.gz``.
+    """
+    if file_path.suffix == '.gz':
+        return cast(BinaryIO, gzip.open(file_path, mode))
+    else:
+        return cast(BinaryIO, open(file_path, mode, buffering=IMPORT_BUFFER_SIZE))
+
+
+def get_checkpoint_path(file_path: pathlib.Path) -> pathlib.Path:
+    return file_path.with_name(file_path.name + '.checkpoint')
 
 
 def get_chain(trinity_config: TrinityConfig) -> ChainAPI:
@@ -45,7 +143,10 @@ def get_chain(trinity_config: TrinityConfig) -> ChainAPI:
 
 class ImportBlockComponent(Application):
     """
-    Import blocks an RLP encoded file.
+    Import blocks from an RLP encoded file.
+
+    The file is read one block at a time, with the next blocks being decoded in a worker thread
+    while the current one is imported, so files of any size are imported in bounded memory.
     """
     logger = logging.getLogger('trinity.components.BlockImport')
 
@@ -62,37 +163,98 @@ class ImportBlockComponent(Application):
         import_parser.add_argument(
             'file_path',
             type=pathlib.Path,
-            help='Specify the file to import from'
+            help='Specify the file to import from (gzip compressed if it ends in .gz)'
+        )
+
+        import_parser.add_argument(
+            '--resume',
+            action='store_true',
+            help=(
+                "Resume an interrupted import from the last checkpoint written next to the "
+                "imported file"
+            ),
+        )
+
+        import_parser.add_argument(
+            '--checkpoint-interval',
+            type=int,
+            default=IMPORT_CHECKPOINT_INTERVAL,
+            help=(
+                "Number of blocks imported between two checkpoints, or 0 to not write any "
+                f"(default: {IMPORT_CHECKPOINT_INTERVAL})"
+            ),
         )
 
         import_parser.set_defaults(func=cls.run_import)
 
     @classmethod
     def run_import(cls, args: Namespace, trinity_config: TrinityConfig) -> None:
-        with open(args.file_path, 'rb') as import_file:
-            # This won't handle large files.
-            # TODO: Make this stream based: https://github.com/ethereum/trinity/issues/1282
-            file_bytes = import_file.read()
-
-        blocks = decode_all(file_bytes, sedes=FrontierBlock)
-
-        cls.logger.info("Importing %s blocks", len(blocks))
+        checkpoint_path = get_checkpoint_path(args.file_path)
+        if args.resume and checkpoint_path.exists():
+            start_offset = int(checkpoint_path.read_text())
+        else:
+            start_offset = 0
 
         chain = get_chain(trinity_config)
 
-        for block in blocks:
-            try:
-                chain.import_block(block)
-            except (EVMMissingData, ValidationError) as exc:
-                cls.logger.error(exc)
-                cls.logger.error("Import failed")
+        with open_block_file(args.file_path, 'rb') as import_file:
+            if start_offset:
+                cls.logger.info("Resuming import of %s at byte %d", args.file_path, start_offset)
+                import_file.seek(start_offset)
             else:
-                cls.logger.info("Successfully imported %s", block)
+                cls.logger.info("Importing blocks from %s", args.file_path)
+
+            blocks = prefetched(
+                iter_decode_stream(import_file, sedes=FrontierBlock),
+                IMPORT_PREFETCH_SIZE,
+            )
+            import_timer = Timer()
+            progress_timer = Timer()
+            imported_count = 0
+            checkpoint_offset = start_offset
+            try:
+                for next_offset, block in blocks:
+                    try:
+                        chain.import_block(block)
+                    except (EVMMissingData, ValidationError) as exc:
+                        cls.logger.error(exc)
+                        cls.logger.error("Import failed at %s", block)
+                        return
+
+                    cls.logger.debug("Successfully imported %s", block)
+                    imported_count += 1
+                    checkpoint_offset = next_offset
+                    if args.checkpoint_interval and imported_count % args.checkpoint_interval == 0:
+                        checkpoint_path.write_text(str(checkpoint_offset))
+
+                    if progress_timer.elapsed >= PROGRESS_INTERVAL:
+                        progress_timer.start()
+                        cls.logger.info(
+                            "Imported %d blocks, up to %s (%.1f blocks/s)",
+                            imported_count,
+                            block,
+                            imported_count / import_timer.elapsed,
+                        )
+            except DecodingError as exc:
+                cls.logger.error("Failed to decode block at byte %d: %s", checkpoint_offset, exc)
+                return
+            finally:
+                blocks.close()
+                if args.checkpoint_interval and checkpoint_offset != start_offset:
+                    checkpoint_path.write_text(str(checkpoint_offset))
+
+        cls.logger.info(
+            "Successfully imported %d blocks (%.1f blocks/s)",
+            imported_count,
+            imported_count / import_timer.elapsed,
+        )
+        if checkpoint_path.exists():
+            checkpoint_path.unlink()
 
 
 class ExportBlockComponent(Application):
     """
-    Export blocks to an RLP encoded file.
+    Export a block, or a range of canonical blocks, to an RLP encoded file.
     """
     logger = logging.getLogger('trinity.components.BlockExport')
 
@@ -109,41 +271,82 @@ class ExportBlockComponent(Application):
         export_parser.add_argument(
             'file_path',
             type=pathlib.Path,
-            help='Specify the file to export to'
+            help='Specify the file to export to (gzip compressed if it ends in .gz)'
         )
 
         export_parser.add_argument(
             'block_number',
             type=int,
+            nargs='?',
             help='Specify the block number to be exported'
         )
 
+        export_parser.add_argument(
+            '--from',
+            dest='from_block',
+            type=int,
+            help='Specify the first block number of a range of blocks to be exported'
+        )
+
+        export_parser.add_argument(
+            '--to',
+            dest='to_block',
+            type=int,
+            help=(
+                'Specify the last block number of a range of blocks to be exported '
+                '(default: the canonical head)'
+            ),
+        )
+
+        export_parser.add_argument(
+            '--reader-threads',
+            type=int,
+            default=EXPORT_READER_THREADS,
+            help=(
+                "Number of threads reading blocks from the database "
+                f"(default: {EXPORT_READER_THREADS})"
+            ),
+        )
+
         export_parser.add_argument(
             "--append",
             action="store_true",
-            help="Disable peer discovery",
+            help="Append to the file if it already exists",
         )
 
         export_parser.add_argument(
             "--overwrite",
             action="store_true",
-            help="Disable peer discovery",
+            help="Overwrite the file if it already exists",
         )
 
         export_parser.set_defaults(func=cls.run_export)
 
     @classmethod
     def run_export(cls, args: Namespace, trinity_config: TrinityConfig) -> None:
-        chain = get_chain(trinity_config)
-        try:
-            block = chain.get_canonical_block_by_number(args.block_number)
-        except HeaderNotFound:
-            cls.logger.error("Block number %s does not exist in the database", args.block_number)
+        if args.block_number is not None:
+            if args.from_block is not None or args.to_block is not None:
+                cls.logger.error("Specify either a block number or a range of blocks, not both")
+                return
+            from_block = to_block = args.block_number
+        elif args.from_block is not None:
+            from_block = args.from_block
+            to_block = args.to_block
+        else:
+            cls.logger.error("Specify a block number or a range of blocks to be exported")
             return
 
-        cls.logger.info("Exporting %s", block)
+        chain = get_chain(trinity_config)
+        head_number = chain.get_canonical_head().block_number
+        if to_block is None:
+            to_block = head_number
 
-        block_bytes = rlp.encode(block)
+        if from_block > to_block:
+            cls.logger.error("Invalid range of blocks: #%d - #%d", from_block, to_block)
+            return
+        elif to_block > head_number:
+            cls.logger.error("Block number %s does not exist in the database", to_block)
+            return
 
         if args.file_path.exists() and not (args.append or args.overwrite):
             cls.logger.error(
@@ -158,9 +361,49 @@ class ExportBlockComponent(Application):
 
         write_mode = 'w+b' if not args.append else 'a+b'
 
-        cls.logger.info("Writing %s bytes to %s", len(block_bytes), args.file_path)
-
-        with open(args.file_path, write_mode) as export_file:
-            export_file.write(block_bytes)
-
-        cls.logger.info("Successfully exported %s", block)
+        cls.logger.info("Exporting blocks #%d - #%d to %s", from_block, to_block, args.file_path)
+
+        def read_block(block_number: BlockNumber) -> bytes:
+            return rlp.encode(chain.get_canonical_block_by_number(block_number))
+
+        export_timer = Timer()
+        progress_timer = Timer()
+        exported_count = 0
+        with open_block_file(args.file_path, write_mode) as export_file:
+            with ThreadPoolExecutor(args.reader_threads, 'export-reader') as executor:
+                # Blocks are read in parallel, but written in order, with a bounded number of
+                # them held in memory.
+                pending: Deque[Future[bytes]] = collections.deque()
+                next_block = from_block
+                while pending or next_block <= to_block:
+                    while next_block <= to_block and len(pending) < args.reader_threads * 4:
+                        pending.append(executor.submit(read_block, BlockNumber(next_block)))
+                        next_block += 1
+
+                    block_number = from_block + exported_count
+                    try:
+                        block_bytes = pending.popleft().result()
+                    except HeaderNotFound:
+                        cls.logger.error(
+                            "Block number %s does not exist in the database", block_number)
+                        for future in pending:
+                            future.cancel()
+                        return
+
+                    export_file.write(block_bytes)
+                    exported_count += 1
+
+                    if progress_timer.elapsed >= PROGRESS_INTERVAL:
+                        progress_timer.start()
+                        cls.logger.info(
+                            "Exported %d blocks, up to #%d (%.1f blocks/s)",
+                            exported_count,
+                            block_number,
+                            exported_count / export_timer.elapsed,
+                        )
+
+        cls.logger.info(
+            "Successfully exported %d blocks (%.1f blocks/s)",
+            exported_count,
+            exported_count / export_timer.elapsed,
+        )
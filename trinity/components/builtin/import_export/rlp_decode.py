@@ -1,6 +1,9 @@
 from typing import (
     Any,
+    BinaryIO,
     Iterable,
+    Iterator,
+    Tuple,
 )
 from eth_utils import (
     is_bytes,
@@ -53,3 +56,57 @@ def decode_all(rlp: bytes,
             yield obj
         else:
             yield item
+
+
+def _read_exactly(stream: BinaryIO, length: int) -> bytes:
+    data = stream.read(length)
+    if len(data) != length:
+        raise DecodingError('RLP string too short', data)
+    return data
+
+
+def read_rlp_item(stream: BinaryIO) -> bytes:
+    """
+    Read the encoding of the next RLP item from the given stream, without decoding it. Return
+    an empty bytestring if the stream is already at its end.
+
+    :raises: :exc:`rlp.DecodingError` if the stream ends in the middle of the item
+    """
+    prefix = stream.read(1)
+    if not prefix:
+        return b''
+
+    first_byte = prefix[0]
+    if first_byte < 0x80:
+        return prefix
+    elif first_byte < 0xb8:
+        return prefix + _read_exactly(stream, first_byte - 0x80)
+    elif first_byte < 0xc0:
+        length_prefix = _read_exactly(stream, first_byte - 0xb7)
+    elif first_byte < 0xf8:
+        return prefix + _read_exactly(stream, first_byte - 0xc0)
+    else:
+        length_prefix = _read_exactly(stream, first_byte - 0xf7)
+
+    length = int.from_bytes(length_prefix, 'big')
+    return prefix + length_prefix + _read_exactly(stream, length)
+
+
+def iter_decode_stream(stream: BinaryIO,
+                       sedes: rlp.Serializable = None,
+                       **kwargs: Any) -> Iterator[Tuple[int, Any]]:
+    """
+    Decode the RLP encoded objects in the given stream one at a time, so that only a single
+    one of them is held in memory. Each one is yielded together with the stream offset at
+    which the next object starts, so that decoding can later resume from there.
+
+    :param sedes: an object implementing a function ``deserialize(code)`` which will be applied
+                  after decoding, or ``None`` if no deserialization should be performed
+    :param **kwargs: additional keyword arguments that will be passed to :func:`rlp.decode`
+    :raises: :exc:`rlp.DecodingError` if the stream ends in the middle of an object
+    """
+    while True:
+        encoded = read_rlp_item(stream)
+        if not encoded:
+            return
+        yield stream.tell(), rlp.decode(encoded, sedes=sedes, **kwargs)
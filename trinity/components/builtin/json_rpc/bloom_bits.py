@@ -0,0 +1,108 @@
+import asyncio
+from typing import (
+    Optional,
+    Tuple,
+)
+
+from async_service import Service
+
+from eth_typing import BlockNumber
+from eth.abc import (
+    AtomicDatabaseAPI,
+    BlockHeaderAPI,
+)
+from eth.db.header import HeaderDB
+from eth.exceptions import (
+    CanonicalHeadNotFound,
+    HeaderNotFound,
+)
+
+from trinity.db.eth1.bloom_bits import (
+    BLOOM_BITS_SECTION_SIZE,
+    BloomBitsDB,
+    get_section_block_range,
+)
+from trinity._utils.logging import get_logger
+
+
+# Only index sections whose last block is at least this deep in the canonical chain, so
+# that short re-orgs don't invalidate indexed sections.
+BLOOM_BITS_CONFIRMATIONS = 256
+
+# How long to wait between checks for new sections to index, in seconds
+BLOOM_BITS_INDEXING_INTERVAL = 60
+
+
+class BloomBitsIndexer(Service):
+    """
+    Keep the :class:`~trinity.db.eth1.bloom_bits.BloomBitsDB` up to date with the canonical
+    chain, so that ``eth_getLogs`` can find the blocks that may have matching logs without
+    loading every header in the requested range.
+    """
+
+    def __init__(self, db: AtomicDatabaseAPI) -> None:
+        self.logger = get_logger('trinity.components.json_rpc.BloomBitsIndexer')
+        self._headerdb = HeaderDB(db)
+        self._bloom_bits_db = BloomBitsDB(db)
+
+    async def run(self) -> None:
+        loop = asyncio.get_event_loop()
+        while self.manager.is_running:
+            # Reading thousands of headers from the database would block the event loop
+            # for too long, so do it in a thread.
+            await loop.run_in_executor(None, self._rewind_stale_sections)
+            while self.manager.is_running:
+                section = self._get_next_section_to_index()
+                if section is None:
+                    break
+                await loop.run_in_executor(None, self._index_section, section)
+
+            await asyncio.sleep(BLOOM_BITS_INDEXING_INTERVAL)
+
+    def _get_next_section_to_index(self) -> Optional[int]:
+        try:
+            head = self._headerdb.get_canonical_head()
+        except CanonicalHeadNotFound:
+            return None
+
+        confirmed_blocks = head.block_number + 1 - BLOOM_BITS_CONFIRMATIONS
+        next_section = self._bloom_bits_db.get_indexed_section_count()
+        if confirmed_blocks >= (next_section + 1) * BLOOM_BITS_SECTION_SIZE:
+            return next_section
+        else:
+            return None
+
+    def _rewind_stale_sections(self) -> None:
+        """
+        Re-index the latest sections if their headers are no longer canonical.
+        """
+        indexed_count = self._bloom_bits_db.get_indexed_section_count()
+        valid_count = indexed_count
+        while valid_count > 0:
+            section = valid_count - 1
+            _, last_block = get_section_block_range(section)
+            try:
+                canonical_hash = self._headerdb.get_canonical_block_hash(BlockNumber(last_block))
+            except HeaderNotFound:
+                pass
+            else:
+                if self._bloom_bits_db.is_section_indexed(section, canonical_hash):
+                    break
+            valid_count -= 1
+
+        if valid_count < indexed_count:
+            self.logger.info(
+                "Re-org detected, re-indexing bloom bits from section %d", valid_count
+            )
+            self._bloom_bits_db.rewind(valid_count)
+
+    def _index_section(self, section: int) -> None:
+        first_block, last_block = get_section_block_range(section)
+        headers: Tuple[BlockHeaderAPI, ...] = tuple(
+            self._headerdb.get_canonical_block_header_by_number(BlockNumber(block_number))
+            for block_number in range(first_block, last_block + 1)
+        )
+        self._bloom_bits_db.persist_section(section, headers)
+        self.logger.debug(
+            "Indexed bloom bits of blocks #%d to #%d", first_block, last_block
+        )
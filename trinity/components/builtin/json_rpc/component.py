@@ -25,6 +25,11 @@ from trinity.chains.base import AsyncChainAPI
 from trinity.chains.light_eventbus import (
     EventBusLightPeerChain,
 )
+from trinity.components.builtin.json_rpc.bloom_bits import BloomBitsIndexer
+from trinity.components.builtin.metrics.component import metrics_service_from_args
+from trinity.components.builtin.metrics.service.asyncio import AsyncioMetricsService
+from trinity.components.builtin.metrics.service.noop import NOOP_METRICS_SERVICE
+from trinity.db.eth1.bloom_bits import BloomBitsDB
 from trinity.db.manager import DBClient
 from trinity.extensibility import (
     AsyncioIsolatedComponent,
@@ -39,6 +44,10 @@ from trinity.rpc.modules import (
 from trinity.rpc.ipc import (
     IPCServer,
 )
+from trinity.rpc.workers import (
+    RPC_WORKER_THREADS,
+    RPCWorkerPool,
+)
 from trinity.http.handlers.rpc_handler import RPCHandler
 from trinity.http.main import (
     HTTPServer,
@@ -157,23 +166,54 @@ class JsonRpcServerComponent(AsyncioIsolatedComponent):
             help="JSON-RPC server port",
             default=8545,
         )
+        arg_parser.add_argument(
+            "--rpc-worker-threads",
+            type=int,
+            help=(
+                "Number of threads for each JSON-RPC method that executes the EVM, "
+                "like eth_call and eth_estimateGas"
+            ),
+            default=RPC_WORKER_THREADS,
+        )
 
     async def do_run(self, event_bus: EndpointAPI) -> None:
         boot_info = self._boot_info
         trinity_config = boot_info.trinity_config
 
-        with chain_for_config(trinity_config, event_bus) as chain:
+        if boot_info.args.enable_metrics:
+            metrics_service = metrics_service_from_args(
+                boot_info.args, AsyncioMetricsService, event_bus)
+        else:
+            # Use a NoopMetricsService so that no code branches need to be taken if metrics
+            # are disabled
+            metrics_service = NOOP_METRICS_SERVICE
+
+        worker_pool = RPCWorkerPool(boot_info.args.rpc_worker_threads, metrics_service.registry)
+
+        # The bloom bits index is read and written through its own connection, so that
+        # indexing in a thread doesn't contend with the RPC handlers for the chain's.
+        index_db = DBClient.connect(trinity_config.database_ipc_path)
+
+        with chain_for_config(trinity_config, event_bus) as chain, index_db:
             if trinity_config.has_app_config(Eth1AppConfig):
-                modules = initialize_eth1_modules(chain, event_bus, trinity_config)
+                modules = initialize_eth1_modules(
+                    chain,
+                    event_bus,
+                    trinity_config,
+                    BloomBitsDB(index_db),
+                    worker_pool,
+                )
             else:
                 raise Exception("Unsupported Node Type")
 
-            rpc = RPCServer(modules, chain, event_bus)
+            rpc = RPCServer(modules, chain, event_bus, metrics_service.registry)
 
             # Run IPC Server
             ipc_server = IPCServer(rpc, boot_info.trinity_config.jsonrpc_ipc_path)
             services_to_exit: Tuple[Service, ...] = (
                 ipc_server,
+                BloomBitsIndexer(index_db),
+                metrics_service,
             )
             try:
                 http_modules = get_http_enabled_modules(boot_info.args.enable_http_apis, modules)
@@ -194,4 +234,7 @@ class JsonRpcServerComponent(AsyncioIsolatedComponent):
                 )
                 services_to_exit += (http_server,)
 
-            await run_background_asyncio_services(services_to_exit)
+            try:
+                await run_background_asyncio_services(services_to_exit)
+            finally:
+                worker_pool.shutdown()
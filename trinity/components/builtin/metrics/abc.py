@@ -1,6 +1,7 @@
 from abc import abstractmethod
 
 from async_service import ServiceAPI
+from lahja import EndpointAPI
 from pyformance import MetricsRegistry
 
 
@@ -15,7 +16,8 @@ class MetricsServiceAPI(ServiceAPI):
                  host: str,
                  port: int,
                  protocol: str,
-                 reporting_frequency: int) -> None:
+                 reporting_frequency: int,
+                 event_bus: EndpointAPI = None) -> None:
         ...
 
     @property
@@ -4,14 +4,16 @@ from argparse import (
     Namespace,
     _SubParsersAction,
 )
-from typing import Type
+from typing import List, Type
 
+from async_service import ServiceAPI
 from eth_utils import ValidationError
 
 from lahja import EndpointAPI
 
 from trinity.boot_info import BootInfo
 from trinity.components.builtin.metrics.abc import MetricsServiceAPI
+from trinity.components.builtin.metrics.prometheus import PrometheusExporter
 from trinity.components.builtin.metrics.service.trio import TrioMetricsService
 from trinity.components.builtin.metrics.blockchain_metrics_collector import (
     collect_blockchain_metrics,
@@ -26,7 +28,12 @@ from trinity._utils.services import run_background_trio_services
 
 def metrics_service_from_args(
         args: Namespace,
-        metrics_service_class: Type[MetricsServiceAPI] = TrioMetricsService) -> MetricsServiceAPI:
+        metrics_service_class: Type[MetricsServiceAPI] = TrioMetricsService,
+        event_bus: EndpointAPI = None) -> MetricsServiceAPI:
+    """
+    Return a metrics service that reports to InfluxDB if a server is configured, and answers
+    requests to collect its metrics over ``event_bus``, if given, for the ``/metrics`` endpoint.
+    """
     return metrics_service_class(
         influx_server=args.metrics_influx_server,
         influx_user=args.metrics_influx_user,
@@ -36,6 +43,7 @@ def metrics_service_from_args(
         port=args.metrics_influx_port,
         protocol=args.metrics_influx_protocol,
         reporting_frequency=args.metrics_reporting_frequency,
+        event_bus=event_bus,
     )
 
 
@@ -107,6 +115,31 @@ class MetricsComponent(TrioIsolatedComponent):
             default=os.environ.get('TRINITY_METRICS_INFLUX_DB_PROTOCOL', 'http'),
         )
 
+        metrics_parser.add_argument(
+            '--metrics-prometheus-port',
+            type=int,
+            help=(
+                'Serve the metrics of all processes at /metrics on this port, in the '
+                'OpenMetrics text format. Disabled by default'
+            ),
+        )
+
+        metrics_parser.add_argument(
+            '--metrics-prometheus-address',
+            help='Address at which /metrics is served. Defaults to 127.0.0.1',
+            default='127.0.0.1',
+        )
+
+        metrics_parser.add_argument(
+            '--metrics-prometheus-cache-seconds',
+            type=float,
+            help=(
+                'Number of seconds during which metrics collected for a scrape of /metrics '
+                'are served to the following scrapes. Defaults to 5'
+            ),
+            default=5,
+        )
+
         metrics_parser.add_argument(
             '--metrics-reporting-frequency',
             help='The frequency in seconds at which metrics are reported',
@@ -156,8 +189,19 @@ class MetricsComponent(TrioIsolatedComponent):
             frequency_seconds=boot_info.args.metrics_blockchain_collector_frequency,
         )
 
-        await run_background_trio_services([
+        services: List[ServiceAPI] = [
             metrics_service,
             system_metrics_collector,
             blockchain_metrics_collector,
-        ])
+        ]
+
+        if boot_info.args.metrics_prometheus_port is not None:
+            services.append(PrometheusExporter(
+                event_bus,
+                metrics_service.registry,
+                host=boot_info.args.metrics_prometheus_address,
+                port=boot_info.args.metrics_prometheus_port,
+                cache_seconds=boot_info.args.metrics_prometheus_cache_seconds,
+            ))
+
+        await run_background_trio_services(services)
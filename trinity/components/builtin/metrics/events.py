@@ -0,0 +1,30 @@
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    Type,
+)
+
+from lahja import (
+    BaseEvent,
+    BaseRequestResponseEvent,
+)
+
+
+@dataclass
+class CollectMetricsResponse(BaseEvent):
+    """
+    The response class to answer a
+    :class:`trinity.components.builtin.metrics.events.CollectMetricsRequest`
+    """
+    metrics: Dict[str, Dict[str, Any]]
+
+
+class CollectMetricsRequest(BaseRequestResponseEvent[CollectMetricsResponse]):
+    """
+    A request class that is sent to the metrics service of every process, which answers with a
+    dump of its registry.
+    """
+    @staticmethod
+    def expected_response_type() -> Type[CollectMetricsResponse]:
+        return CollectMetricsResponse
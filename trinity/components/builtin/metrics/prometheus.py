@@ -0,0 +1,186 @@
+import re
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Optional,
+)
+
+from async_service import Service
+from lahja import (
+    BroadcastConfig,
+    EndpointAPI,
+)
+from prometheus_client.core import (
+    GaugeMetricFamily,
+    Metric,
+)
+from prometheus_client.openmetrics.exposition import (
+    CONTENT_TYPE_LATEST,
+    generate_latest,
+)
+import trio
+
+from trinity.components.builtin.metrics.events import CollectMetricsRequest
+from trinity.components.builtin.metrics.registry import HostMetricsRegistry
+from trinity._utils.logging import get_logger
+
+
+# Seconds to wait for the metrics of a process before serving the metrics without them
+COLLECT_TIMEOUT = 2
+
+# Seconds to wait for a client to send its request
+HTTP_REQUEST_TIMEOUT = 5
+
+# Maximum size of the request line and headers sent by a client
+MAX_HTTP_REQUEST_SIZE = 8192
+
+# Metrics dumped by the registries of many processes, keyed by the name of their endpoint
+CollectedMetrics = Dict[str, Dict[str, Dict[str, Any]]]
+
+
+def get_metric_name(key: str, field: str) -> str:
+    """
+    Return the name of a field of a pyformance metric, which only uses characters allowed in
+    OpenMetrics names, e.g. ``trinity_p2p_sync_pivot_rate_meter_m1_rate``.
+    """
+    name = re.sub(r'[^a-zA-Z0-9_:]', '_', f'{key}_{field}')
+    if name[0].isdigit():
+        return f'_{name}'
+    else:
+        return name
+
+
+class CollectedMetricsCollector:
+    """
+    A ``prometheus_client`` collector for the numeric fields of metrics collected from the
+    registries of many processes, labelled with their host and process.
+    """
+    def __init__(self, collected_metrics: CollectedMetrics) -> None:
+        self.collected_metrics = collected_metrics
+
+    def collect(self) -> Iterable[Metric]:
+        families: Dict[str, GaugeMetricFamily] = {}
+        for process, metrics in self.collected_metrics.items():
+            for key, values in metrics.items():
+                host = str(values.get('host', ''))
+                for field, value in values.items():
+                    if isinstance(value, bool) or not isinstance(value, (int, float)):
+                        continue
+
+                    name = get_metric_name(key, field)
+                    if name not in families:
+                        families[name] = GaugeMetricFamily(
+                            name,
+                            f'{field} of {key}',
+                            labels=('host', 'process'),
+                        )
+                    families[name].add_metric((host, process), value)
+        return families.values()
+
+
+def render_metrics(collected_metrics: CollectedMetrics) -> bytes:
+    """
+    Render collected metrics in the OpenMetrics text format.
+    """
+    return generate_latest(CollectedMetricsCollector(collected_metrics))
+
+
+class PrometheusExporter(Service):
+    """
+    Serve the metrics of all processes at ``/metrics``, in the OpenMetrics text format, for
+    Prometheus and other pull-based collectors.
+
+    Metrics are only collected from the other processes over the event bus, and rendered, when
+    scraped. A render is served to all scrapes within ``cache_seconds`` of it.
+    """
+    logger = get_logger('trinity.components.builtin.metrics.PrometheusExporter')
+
+    def __init__(self,
+                 event_bus: EndpointAPI,
+                 registry: HostMetricsRegistry,
+                 host: str,
+                 port: int,
+                 cache_seconds: float) -> None:
+        self._event_bus = event_bus
+        self._registry = registry
+        self._host = host
+        self._port = port
+        self._cache_seconds = cache_seconds
+        self._render_lock = trio.Lock()
+        self._rendered: Optional[bytes] = None
+        self._rendered_at = 0.0
+
+    async def run(self) -> None:
+        self.logger.info("Serving metrics at http://%s:%d/metrics", self._host, self._port)
+        await trio.serve_tcp(self._handle_connection, self._port, host=self._host)
+
+    async def get_rendered_metrics(self) -> bytes:
+        # Concurrent scrapes wait for a single collection
+        async with self._render_lock:
+            now = trio.current_time()
+            if self._rendered is None or now - self._rendered_at >= self._cache_seconds:
+                self._rendered = render_metrics(await self._collect_metrics())
+                self._rendered_at = now
+            return self._rendered
+
+    async def _collect_metrics(self) -> CollectedMetrics:
+        collected_metrics = {self._event_bus.name: self._registry.dump_metrics()}
+
+        async def collect_from(endpoint_name: str) -> None:
+            with trio.move_on_after(COLLECT_TIMEOUT) as cancel_scope:
+                response = await self._event_bus.request(
+                    CollectMetricsRequest(),
+                    BroadcastConfig(filter_endpoint=endpoint_name),
+                )
+                collected_metrics[endpoint_name] = response.metrics
+            if cancel_scope.cancelled_caught:
+                self.logger.debug("Timed out collecting metrics from %s", endpoint_name)
+
+        connected_endpoints = self._event_bus.get_connected_endpoints_and_subscriptions()
+        async with trio.open_nursery() as nursery:
+            for endpoint_name, subscriptions in connected_endpoints:
+                if CollectMetricsRequest in subscriptions:
+                    nursery.start_soon(collect_from, endpoint_name)
+
+        return collected_metrics
+
+    async def _handle_connection(self, stream: trio.SocketStream) -> None:
+        async with stream:
+            try:
+                await self._handle_request(stream)
+            except trio.BrokenResourceError:
+                self.logger.debug("Metrics scraper disconnected before receiving a response")
+
+    async def _handle_request(self, stream: trio.SocketStream) -> None:
+        request = b''
+        with trio.move_on_after(HTTP_REQUEST_TIMEOUT):
+            while b'\r\n\r\n' not in request and len(request) < MAX_HTTP_REQUEST_SIZE:
+                data = await stream.receive_some(MAX_HTTP_REQUEST_SIZE)
+                if not data:
+                    break
+                request += data
+
+        request_line = request.split(b'\r\n', 1)[0].split()
+        if len(request_line) == 3 and request_line[0] == b'GET':
+            path = request_line[1].split(b'?', 1)[0]
+        else:
+            path = None
+
+        if path == b'/metrics':
+            status = '200 OK'
+            content_type = CONTENT_TYPE_LATEST
+            body = await self.get_rendered_metrics()
+        else:
+            status = '404 Not Found'
+            content_type = 'text/plain; charset=utf-8'
+            body = b'Not Found\n'
+
+        headers = (
+            f'HTTP/1.1 {status}\r\n'
+            f'Content-Type: {content_type}\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            'Connection: close\r\n'
+            '\r\n'
+        )
+        await stream.send_all(headers.encode() + body)
@@ -10,9 +10,14 @@ from typing import (
 from urllib import parse
 
 from async_service import Service
+from lahja import EndpointAPI
 from pyformance.reporters.influx import InfluxReporter
 
 from trinity.components.builtin.metrics.abc import MetricsServiceAPI
+from trinity.components.builtin.metrics.events import (
+    CollectMetricsRequest,
+    CollectMetricsResponse,
+)
 from trinity.components.builtin.metrics.registry import HostMetricsRegistry
 from trinity._utils.logging import get_logger
 
@@ -88,7 +93,8 @@ class ExtendedInfluxReporter(InfluxReporter):
 class BaseMetricsService(Service, MetricsServiceAPI):
     """
     A service to provide a registry where metrics instruments can be registered and retrieved from.
-    It continuously reports metrics to the specified InfluxDB instance.
+    It continuously reports metrics to the specified InfluxDB instance, if any, and answers
+    requests to collect them over the event bus, if given one.
     """
 
     MIN_SECONDS_BETWEEN_ERROR_LOGS = 60
@@ -101,7 +107,9 @@ class BaseMetricsService(Service, MetricsServiceAPI):
                  host: str,
                  port: int,
                  protocol: str,
-                 reporting_frequency: int) -> None:
+                 reporting_frequency: int,
+                 event_bus: EndpointAPI = None) -> None:
+        self._event_bus = event_bus
         self._unreported_error: Exception = None
         self._last_time_reported: float = 0.0
         self._influx_server = influx_server
@@ -135,10 +143,20 @@ class BaseMetricsService(Service, MetricsServiceAPI):
             self.logger.warning("Unable to report annotations: %s", exc)
 
     async def run(self) -> None:
-        self.logger.info("Reporting metrics to %s", self._influx_server)
-        self.manager.run_daemon_task(self.continuously_report)
+        if self._influx_server:
+            self.logger.info("Reporting metrics to %s", self._influx_server)
+            self.manager.run_daemon_task(self.continuously_report)
+        if self._event_bus is not None:
+            self.manager.run_daemon_task(self.handle_collect_metrics_requests)
         await self.manager.wait_finished()
 
+    async def handle_collect_metrics_requests(self) -> None:
+        async for request in self._event_bus.stream(CollectMetricsRequest):
+            await self._event_bus.broadcast(
+                CollectMetricsResponse(self._registry.dump_metrics()),
+                request.broadcast_config(),
+            )
+
     async def report_now(self) -> None:
         try:
             await self.reporter.report_metrics()
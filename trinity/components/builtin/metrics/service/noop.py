@@ -1,4 +1,5 @@
 from async_service import Service
+from lahja import EndpointAPI
 
 from trinity.components.builtin.metrics.abc import MetricsServiceAPI
 from trinity.components.builtin.metrics.registry import NoopMetricsRegistry
@@ -20,7 +21,8 @@ class NoopMetricsService(Service, MetricsServiceAPI):
                  influx_password: str = '',
                  influx_database: str = '',
                  host: str = '',
-                 reporting_frequency: int = 10):
+                 reporting_frequency: int = 10,
+                 event_bus: EndpointAPI = None):
 
         self._registry = NoopMetricsRegistry()
 
@@ -1,3 +1,5 @@
+import asyncio
+
 from lahja import EndpointAPI
 
 from async_service import Service
@@ -13,6 +15,10 @@ from .events import (
 )
 
 
+# Seconds between two writes of the blacklist changes to the database
+FLUSH_INTERVAL = 5
+
+
 class ConnectionTrackerServer(Service):
     """
     Server to handle the event bus communication for BlacklistEvent and
@@ -49,6 +55,14 @@ class ConnectionTrackerServer(Service):
                 command.reason
             )
 
+    async def flush_periodically(self) -> None:
+        try:
+            while self.manager.is_running:
+                await asyncio.sleep(FLUSH_INTERVAL)
+                self.tracker.flush()
+        finally:
+            self.tracker.flush()
+
     async def run(self) -> None:
         self.logger.debug("Running ConnectionTrackerServer")
 
@@ -60,5 +74,9 @@ class ConnectionTrackerServer(Service):
             self.handle_get_blacklisted_requests,
             name='ConnectionTrackerServer.handle_get_blacklisted_requests,',
         )
+        self.manager.run_daemon_task(
+            self.flush_periodically,
+            name='ConnectionTrackerServer.flush_periodically',
+        )
 
         await self.manager.wait_finished()
@@ -1,7 +1,15 @@
 import datetime
+import heapq
 import math
 from pathlib import Path
-from typing import Tuple
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
 
 from eth_typing import NodeID
 from sqlalchemy import (
@@ -33,6 +41,7 @@ from trinity.constants import (
 from trinity.db.orm import (
     Base,
     get_tracking_database,
+    MAX_QUERY_PARAMETERS,
 )
 from .events import (
     BlacklistEvent,
@@ -60,38 +69,150 @@ def adjust_repeat_offender_timeout(base_timeout: float, error_count: int) -> dat
     return datetime.datetime.utcnow() + delta
 
 
+# Number of blacklist changes kept in memory before they are written to the database,
+# regardless of how long ago the last flush was.
+MAX_PENDING_RECORDS = 1000
+
+
+class BlacklistEntry(NamedTuple):
+    expires_at: datetime.datetime
+    reason: str
+    error_count: int
+
+
 class SQLiteConnectionTracker(BaseConnectionTracker):
+    """
+    Track blacklisted peers in a SQLite database.
+
+    The whole blacklist is loaded into memory at startup and indexed by node ID, with a heap of
+    expiry times to drop peers from the blacklist once their record expires, so blacklist checks
+    never hit the database. Changes are written behind in a single transaction when
+    :meth:`flush` is called, or once ``MAX_PENDING_RECORDS`` changes are pending.
+    """
     def __init__(self, session: BaseSession):
         self.session = session
 
+        self._entries: Dict[NodeID, BlacklistEntry] = {}
+        self._expiries: List[Tuple[datetime.datetime, NodeID]] = []
+        self._blacklisted: Set[NodeID] = set()
+        self._blacklisted_ids: Optional[Tuple[NodeID, ...]] = None
+        self._pending_node_ids: Set[NodeID] = set()
+
+        self._load_entries()
+
     #
     # Core API
     #
     def record_blacklist(self, remote: NodeAPI, timeout_seconds: int, reason: str) -> None:
         try:
-            record = self._get_record(remote.id)
-        except NoResultFound:
+            entry = self._entries[remote.id]
+        except KeyError:
             expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=timeout_seconds)
             self._create_record(remote, expires_at, reason)
         else:
             scaled_expires_at = adjust_repeat_offender_timeout(
                 timeout_seconds,
-                record.error_count + 1,
+                entry.error_count + 1,
             )
             self._update_record(remote, scaled_expires_at, reason)
 
     async def get_blacklisted(self) -> Tuple[NodeID, ...]:
-        now = datetime.datetime.utcnow()
-        # mypy doesn't know about the type of the `query()` function
-        records = self.session.query(BlacklistRecord).filter(  # type: ignore
-            BlacklistRecord.expires_at > now
-        )
-        return tuple(NodeID(to_bytes(hexstr=record.node_id)) for record in records)
+        self._expire_entries()
+        if self._blacklisted_ids is None:
+            self._blacklisted_ids = tuple(self._blacklisted)
+        return self._blacklisted_ids
+
+    def is_blacklisted(self, node_id: NodeID) -> bool:
+        try:
+            entry = self._entries[node_id]
+        except KeyError:
+            return False
+        else:
+            return entry.expires_at > datetime.datetime.utcnow()
+
+    def flush(self) -> None:
+        if not self._pending_node_ids:
+            return
+
+        node_ids = tuple(self._pending_node_ids)
+        self._pending_node_ids.clear()
+
+        records = {}
+        for offset in range(0, len(node_ids), MAX_QUERY_PARAMETERS):
+            hex_node_ids = [
+                to_hex(node_id) for node_id in node_ids[offset:offset + MAX_QUERY_PARAMETERS]
+            ]
+            # mypy doesn't know about the type of the `query()` function
+            existing_records = self.session.query(BlacklistRecord).filter(  # type: ignore
+                BlacklistRecord.node_id.in_(hex_node_ids),
+            )
+            records.update({record.node_id: record for record in existing_records})
+
+        for node_id in node_ids:
+            entry = self._entries[node_id]
+            hex_node_id = to_hex(node_id)
+            if hex_node_id in records:
+                record = records[hex_node_id]
+                record.expires_at = entry.expires_at
+                record.reason = entry.reason
+                record.error_count = entry.error_count
+            else:
+                record = BlacklistRecord(
+                    node_id=hex_node_id,
+                    expires_at=entry.expires_at,
+                    reason=entry.reason,
+                    error_count=entry.error_count,
+                )
+            self.session.add(record)
+
+        # mypy doesn't know about the type of the `commit()` function
+        self.session.commit()  # type: ignore
 
     #
     # Helpers
     #
+    def _load_entries(self) -> None:
+        now = datetime.datetime.utcnow()
+        # mypy doesn't know about the type of the `query()` function
+        records = self.session.query(  # type: ignore
+            BlacklistRecord.node_id,
+            BlacklistRecord.expires_at,
+            BlacklistRecord.reason,
+            BlacklistRecord.error_count,
+        )
+        for hex_node_id, expires_at, reason, error_count in records:
+            node_id = NodeID(to_bytes(hexstr=hex_node_id))
+            self._entries[node_id] = BlacklistEntry(expires_at, reason, error_count)
+            if expires_at > now:
+                self._expiries.append((expires_at, node_id))
+                self._blacklisted.add(node_id)
+        heapq.heapify(self._expiries)
+
+    def _set_entry(self, node_id: NodeID, entry: BlacklistEntry) -> None:
+        previous = self._entries.get(node_id)
+        self._entries[node_id] = entry
+        is_extended = previous is None or entry.expires_at != previous.expires_at
+        if is_extended and entry.expires_at > datetime.datetime.utcnow():
+            heapq.heappush(self._expiries, (entry.expires_at, node_id))
+            if node_id not in self._blacklisted:
+                self._blacklisted.add(node_id)
+                self._blacklisted_ids = None
+
+        self._pending_node_ids.add(node_id)
+        if len(self._pending_node_ids) >= MAX_PENDING_RECORDS:
+            self.flush()
+
+    def _expire_entries(self) -> None:
+        now = datetime.datetime.utcnow()
+        while self._expiries and self._expiries[0][0] <= now:
+            expires_at, node_id = heapq.heappop(self._expiries)
+            # Entries whose expiry got extended have been pushed again with the later one
+            if self._entries[node_id].expires_at == expires_at:
+                self._blacklisted.discard(node_id)
+                self._blacklisted_ids = None
+
     def _get_record(self, node_id: NodeID) -> BlacklistRecord:
+        self.flush()
         # mypy doesn't know about the type of the `query()` function
         return self.session.query(BlacklistRecord).filter_by(  # type: ignore
             node_id=to_hex(node_id)).one()
@@ -105,10 +226,7 @@ class SQLiteConnectionTracker(BaseConnectionTracker):
             return True
 
     def _create_record(self, remote: NodeAPI, expires_at: datetime.datetime, reason: str) -> None:
-        record = BlacklistRecord(node_id=to_hex(remote.id), expires_at=expires_at, reason=reason)
-        self.session.add(record)
-        # mypy doesn't know about the type of the `commit()` function
-        self.session.commit()  # type: ignore
+        self._set_entry(remote.id, BlacklistEntry(expires_at, reason, error_count=1))
 
         usable_delta = expires_at - datetime.datetime.utcnow()
         self.logger.debug(
@@ -119,17 +237,14 @@ class SQLiteConnectionTracker(BaseConnectionTracker):
         )
 
     def _update_record(self, remote: NodeAPI, expires_at: datetime.datetime, reason: str) -> None:
-        record = self._get_record(remote.id)
-
-        if expires_at > record.expires_at:
-            # only update expiration if it is further in the future than the existing expiration
-            record.expires_at = expires_at
-        record.reason = reason
-        record.error_count += 1
+        entry = self._entries[remote.id]
 
-        self.session.add(record)
-        # mypy doesn't know about the type of the `commit()` function
-        self.session.commit()  # type: ignore
+        # only update expiration if it is further in the future than the existing expiration
+        self._set_entry(remote.id, BlacklistEntry(
+            max(expires_at, entry.expires_at),
+            reason,
+            entry.error_count + 1,
+        ))
 
         usable_delta = expires_at - datetime.datetime.utcnow()
         self.logger.debug(
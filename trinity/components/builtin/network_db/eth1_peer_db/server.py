@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from lahja import EndpointAPI
@@ -14,6 +15,10 @@ from .events import (
 )
 
 
+# Seconds between two writes of the tracked peer connections to the database
+FLUSH_INTERVAL = 5
+
+
 class PeerDBServer(Service):
     """
     Server to handle the event bus communication for PeerDB
@@ -49,6 +54,14 @@ class PeerDBServer(Service):
                 req.broadcast_config(),
             )
 
+    async def flush_periodically(self) -> None:
+        try:
+            while self.manager.is_running:
+                await asyncio.sleep(FLUSH_INTERVAL)
+                self.tracker.flush()
+        finally:
+            self.tracker.flush()
+
     async def run(self) -> None:
         self.logger.debug("Running PeerDBServer")
 
@@ -60,5 +73,9 @@ class PeerDBServer(Service):
             self.handle_get_peer_candidates_request,
             name='PeerDBServer.handle_get_peer_candidates_request',
         )
+        self.manager.run_daemon_task(
+            self.flush_periodically,
+            name='PeerDBServer.flush_periodically',
+        )
 
         await self.manager.wait_finished()
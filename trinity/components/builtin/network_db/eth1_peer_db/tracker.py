@@ -1,18 +1,22 @@
 from abc import abstractmethod
 import datetime
+import itertools
 from pathlib import Path
 from typing import (
     Any,
     Callable,
     cast,
+    Dict,
     FrozenSet,
     Iterable,
+    NamedTuple,
     Optional,
     Type,
     Tuple,
 )
 
 from eth_typing import NodeID
+from lru import LRU
 from sqlalchemy.orm import (
     relationship,
     Session as BaseSession,
@@ -54,6 +58,7 @@ from trinity.constants import (
 from trinity.db.orm import (
     get_tracking_database,
     Base,
+    MAX_QUERY_PARAMETERS,
 )
 from trinity.components.builtin.network_db.connection.tracker import (
     BlacklistRecord,
@@ -78,7 +83,7 @@ class Remote(Base):
     created_at = Column(DateTime(timezone=True), nullable=False)
     updated_at = Column(DateTime(timezone=True), nullable=False, index=True)
 
-    last_connected_at = Column(DateTime(timezone=True), nullable=True)
+    last_connected_at = Column(DateTime(timezone=True), nullable=True, index=True)
 
     genesis_hash = Column(String, nullable=False, index=True)
     protocol = Column(String, nullable=False, index=True)
@@ -181,6 +186,12 @@ class BaseEth1PeerTracker(BasePeerBackend, PeerSubscriber):
                                   should_skip_fn: Callable[[NodeAPI], bool]) -> Tuple[NodeAPI, ...]:
         ...
 
+    def flush(self) -> None:
+        """
+        Persist any tracked peer connections that are buffered in memory.
+        """
+        pass
+
 
 class NoopEth1PeerTracker(BaseEth1PeerTracker):
     def track_peer_connection(self,
@@ -201,8 +212,36 @@ class NoopEth1PeerTracker(BaseEth1PeerTracker):
 
 MIN_QUALIFYING_UPTIME = 60
 
+# Number of tracked peer connections buffered in memory before they are written to the
+# database, regardless of how long ago the last flush was.
+MAX_PENDING_REMOTES = 1000
+
+# Number of candidate records fetched from the database at once
+CANDIDATE_PAGE_SIZE = 64
+
+# Number of nodes parsed from their ENR which are kept in memory
+NODE_CACHE_SIZE = 4096
+
+
+class PendingRemote(NamedTuple):
+    remote: NodeAPI
+    is_outbound: bool
+    last_connected_at: Optional[datetime.datetime]
+    genesis_hash: Hash32
+    protocol: str
+    protocol_version: int
+    network_id: int
+    updated_at: datetime.datetime
+
 
 class SQLiteEth1PeerTracker(BaseEth1PeerTracker):
+    """
+    Track peers in a SQLite database.
+
+    Tracked peer connections are buffered in memory and written in a single transaction when
+    :meth:`flush` is called, which happens before the database is read from, or once
+    ``MAX_PENDING_REMOTES`` connections are buffered.
+    """
     def __init__(self,
                  session: BaseSession,
                  genesis_hash: Hash32 = None,
@@ -217,6 +256,9 @@ class SQLiteEth1PeerTracker(BaseEth1PeerTracker):
         self.protocols = protocols
         self.protocol_versions = protocol_versions
         self.network_id = network_id
+        self._pending_remotes: Dict[NodeID, PendingRemote] = {}
+        # Maps hex-encoded node IDs to the ENR repr they were parsed from and the parsed node
+        self._node_cache = LRU(NODE_CACHE_SIZE)
 
     def track_peer_connection(self,
                               remote: NodeAPI,
@@ -226,38 +268,81 @@ class SQLiteEth1PeerTracker(BaseEth1PeerTracker):
                               protocol: str,
                               protocol_version: int,
                               network_id: int) -> None:
-        enr = repr(remote.enr)
         now = datetime.datetime.utcnow()
+        pending = PendingRemote(
+            remote,
+            is_outbound,
+            last_connected_at,
+            genesis_hash,
+            protocol,
+            protocol_version,
+            network_id,
+            now,
+        )
 
-        if self._remote_exists(remote.id):
-            self.logger.debug2("Updated ETH1 peer record: %s", remote)
-            record = self._get_remote(remote.id)
+        if remote.id in self._pending_remotes:
+            previous = self._pending_remotes[remote.id]
+            # A new record keeps the direction of the first connection and existing records
+            # keep the last time we were connected to them, just like when written one by one.
+            pending = pending._replace(
+                is_outbound=previous.is_outbound,
+                last_connected_at=last_connected_at or previous.last_connected_at,
+            )
+        self._pending_remotes[remote.id] = pending
 
-            record.updated_at = now
+        if len(self._pending_remotes) >= MAX_PENDING_REMOTES:
+            self.flush()
 
-            if last_connected_at is not None:
-                record.last_connected_at = last_connected_at
+    def flush(self) -> None:
+        if not self._pending_remotes:
+            return
 
-            record.genesis_hash = genesis_hash.hex()
-            record.protocol = protocol
-            record.protocol_version = protocol_version
-            record.network_id = network_id
-        else:
-            self.logger.debug2("New ETH1 peer record: %s", remote)
-            record = Remote(
-                node_id=to_hex(remote.id),
-                enr=enr,
-                is_outbound=is_outbound,
-                created_at=now,
-                updated_at=now,
-                last_connected_at=last_connected_at,
-                genesis_hash=genesis_hash.hex(),
-                protocol=protocol,
-                protocol_version=protocol_version,
-                network_id=network_id,
+        pending_remotes = tuple(self._pending_remotes.values())
+        self._pending_remotes.clear()
+
+        existing_records = {}
+        for offset in range(0, len(pending_remotes), MAX_QUERY_PARAMETERS):
+            node_ids = [
+                to_hex(pending.remote.id)
+                for pending in pending_remotes[offset:offset + MAX_QUERY_PARAMETERS]
+            ]
+            records = self.session.query(Remote).filter(  # type: ignore
+                Remote.node_id.in_(node_ids),
             )
+            existing_records.update({record.node_id: record for record in records})
+
+        for pending in pending_remotes:
+            node_id = to_hex(pending.remote.id)
+            if node_id in existing_records:
+                self.logger.debug2("Updated ETH1 peer record: %s", pending.remote)
+                record = existing_records[node_id]
+
+                record.updated_at = pending.updated_at
+
+                if pending.last_connected_at is not None:
+                    record.last_connected_at = pending.last_connected_at
+
+                record.genesis_hash = pending.genesis_hash.hex()
+                record.protocol = pending.protocol
+                record.protocol_version = pending.protocol_version
+                record.network_id = pending.network_id
+            else:
+                self.logger.debug2("New ETH1 peer record: %s", pending.remote)
+                record = Remote(
+                    node_id=node_id,
+                    enr=repr(pending.remote.enr),
+                    is_outbound=pending.is_outbound,
+                    created_at=pending.updated_at,
+                    updated_at=pending.updated_at,
+                    last_connected_at=pending.last_connected_at,
+                    genesis_hash=pending.genesis_hash.hex(),
+                    protocol=pending.protocol,
+                    protocol_version=pending.protocol_version,
+                    network_id=pending.network_id,
+                )
+
+            self.session.add(record)
 
-        self.session.add(record)
         self.session.commit()  # type: ignore
 
     @to_tuple
@@ -293,11 +378,12 @@ class SQLiteEth1PeerTracker(BaseEth1PeerTracker):
         * Either has no blacklist record or existing blacklist record is expired.
         * Not in the set of remotes we are already connected to.
         """
+        self.flush()
         now = datetime.datetime.utcnow()
         metadata_filters = self._get_candidate_filter_query()
 
         # Query the database for peers that match our criteria.
-        candidates = self.session.query(Remote).outerjoin(  # type: ignore
+        candidates = self.session.query(Remote.node_id, Remote.enr).outerjoin(  # type: ignore
             # Join against the blacklist records with matching node ID
             Remote.blacklist,
         ).filter(
@@ -310,38 +396,54 @@ class SQLiteEth1PeerTracker(BaseEth1PeerTracker):
         ).order_by(
             # We want the ones that we have recently connected to succesfully to be first.
             Remote.last_connected_at.desc(),
+            # Keep the order stable across pages.
+            Remote.id,
         )
 
-        # Return them as an iterator to allow the consuming process to
-        # determine how many records it wants to fetch.
-        for candidate in candidates:
-            node = Node.from_enr_repr(candidate.enr)
-            if not should_skip_fn(node):
-                yield node
+        # Fetch them in pages, as the consuming process determines how many records
+        # it wants, and some of them may be skipped.
+        page_size = max(max_candidates, CANDIDATE_PAGE_SIZE)
+        for offset in itertools.count(0, page_size):
+            page = candidates.limit(page_size).offset(offset).all()
+            for node_id, enr in page:
+                node = self._get_node(node_id, enr)
+                if not should_skip_fn(node):
+                    yield node
+            if len(page) < page_size:
+                break
 
     async def get_peer_candidates(self,
                                   max_candidates: int,
                                   should_skip_fn: Callable[[NodeAPI], bool]) -> Tuple[NodeAPI, ...]:
-        # For now we fully evaluate the response in order to print debug
-        # statistics.  Once this API is no longer experimental, this should be
-        # adjusted to only consume a maximum of `max_candidates` from the
-        # returned iterable.
-        all_candidates = tuple(self._get_peer_candidates(max_candidates, should_skip_fn))
-        candidates = all_candidates[:max_candidates]
-        total_in_database = self.session.query(Remote).count()  # type: ignore
+        candidates = tuple(itertools.islice(
+            self._get_peer_candidates(max_candidates, should_skip_fn),
+            max_candidates,
+        ))
         self.logger.debug(
-            "Eth1 Peer Candidate Request: req=%d  ret=%d  avail=%d  total=%d",
+            "Eth1 Peer Candidate Request: req=%d  ret=%d",
             max_candidates,
             len(candidates),
-            len(all_candidates),
-            total_in_database,
         )
         return candidates
 
     #
     # Helpers
     #
+    def _get_node(self, node_id: str, enr: str) -> NodeAPI:
+        try:
+            cached_enr, node = self._node_cache[node_id]
+        except KeyError:
+            pass
+        else:
+            if cached_enr == enr:
+                return node
+
+        node = Node.from_enr_repr(enr)
+        self._node_cache[node_id] = (enr, node)
+        return node
+
     def _get_remote(self, node_id: NodeID) -> Remote:
+        self.flush()
         return self.session.query(Remote).filter_by(node_id=to_hex(node_id)).one()  # type: ignore
 
     def _remote_exists(self, node_id: NodeID) -> bool:
@@ -1,12 +1,11 @@
 import asyncio
-import collections
+from concurrent.futures import ProcessPoolExecutor
 import math
-import pathlib
+import multiprocessing
 import random
 from typing import (
-    DefaultDict,
-    Iterable,
-    List,
+    Dict,
+    Optional,
     Tuple,
 )
 
@@ -16,22 +15,31 @@ from async_service import (
 )
 from eth.abc import (
     BlockAPI,
+    BlockHeaderAPI,
+    ChainAPI,
 )
+from eth.consensus.pow import PowConsensus, check_pow
 from eth_typing import BlockNumber, Hash32
 from eth_utils import (
     ExtendedDebugLogger,
     ValidationError,
     humanize_hash,
-    to_tuple,
 )
 from lahja import EndpointAPI
+from lru import LRU
 from pyformance import MetricsRegistry
 import trio
 
 from p2p.abc import SessionAPI
+from p2p.exceptions import PeerConnectionLost
 from trinity.boot_info import BootInfo
 from trinity.components.builtin.metrics.component import metrics_service_from_args
 from trinity.components.builtin.metrics.service.noop import NOOP_METRICS_SERVICE
+from trinity.components.builtin.new_block.constants import (
+    SEAL_VALIDATION_CACHE_SIZE,
+    SEAL_VALIDATION_PROCESSES,
+)
+from trinity.components.builtin.new_block.tracker import PeerBlockTracker
 from trinity.constants import TO_NETWORKING_BROADCAST_CONFIG
 from trinity.db.manager import DBClient
 from trinity.exceptions import WitnessHashesUnavailable
@@ -48,8 +56,9 @@ from trinity.protocol.eth.peer import (
 )
 from trinity.protocol.wit.db import AsyncWitnessDB
 from trinity.sync.common.events import CollectMissingTrieNodes, NewBlockImported
-from trinity._utils.connect import get_eth1_chain_with_remote_db
+from trinity._utils.connect import get_eth1_chain_with_db
 from trinity._utils.logging import get_logger
+from trinity._utils.timer import Timer
 
 
 class NewBlockComponent(TrioIsolatedComponent):
@@ -65,7 +74,8 @@ class NewBlockComponent(TrioIsolatedComponent):
 
     async def do_run(self, event_bus: EndpointAPI) -> None:
         if self._boot_info.args.enable_metrics:
-            metrics_service = metrics_service_from_args(self._boot_info.args)
+            metrics_service = metrics_service_from_args(
+                self._boot_info.args, event_bus=event_bus)
         else:
             metrics_service = NOOP_METRICS_SERVICE
         proxy_peer_pool = ETHProxyPeerPool(event_bus, TO_NETWORKING_BROADCAST_CONFIG)
@@ -81,6 +91,10 @@ class NewBlockService(Service):
 
     logger = get_logger('trinity.components.new_block.NewBlockService')
 
+    # Only available while the service is running
+    _chain: ChainAPI
+    _witness_db: AsyncWitnessDB
+
     def __init__(self,
                  event_bus: EndpointAPI,
                  peer_pool: ETHProxyPeerPool,
@@ -89,24 +103,51 @@ class NewBlockService(Service):
         self._event_bus = event_bus
         self._peer_pool = peer_pool
         self._metrics_registry = metrics_registry
-        # TODO: old blocks need to be pruned to avoid unbounded growth of tracker
-        self._peer_block_tracker: DefaultDict[bytes, List[str]] = collections.defaultdict(list)
+        self._peer_block_tracker = PeerBlockTracker()
         self._boot_info = boot_info
 
+        # Proof-of-work seals are validated in worker processes, so they don't block the event
+        # loop. Results are cached by header hash (None means valid), and concurrent NewBlock
+        # messages for the same block wait on the one validation already in progress.
+        # Worker processes are only started on the first submitted job. Use "spawn" so that
+        #   the workers don't inherit the threads and sockets of this process.
+        self._seal_validation_executor = ProcessPoolExecutor(
+            max_workers=SEAL_VALIDATION_PROCESSES,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
+        self._seal_validation_results = LRU(SEAL_VALIDATION_CACHE_SIZE)
+        self._pending_seal_validations: Dict[Hash32, trio.Event] = {}
+
+        self._validated_latency = metrics_registry.histogram(
+            'trinity.p2p/new_block/receive_to_validated.histogram')
+        self._relayed_latency = metrics_registry.histogram(
+            'trinity.p2p/new_block/receive_to_relayed.histogram')
+
     async def run(self) -> None:
-        self.manager.run_daemon_task(self._handle_imported_blocks)
-        self.manager.run_daemon_task(self._handle_new_block_hashes)
+        # A single DB connection (and chain) is shared by all handlers for the lifetime
+        # of the service, rather than reconnecting for every announced block.
+        base_db = DBClient.connect(self._boot_info.trinity_config.database_ipc_path)
+        with base_db:
+            self._chain = get_eth1_chain_with_db(self._boot_info, self._event_bus, base_db)
+            self._witness_db = AsyncWitnessDB(base_db)
 
-        async for event in self._event_bus.stream(NewBlockEvent):
-            self.manager.run_task(self._handle_new_block, event.session, event.command.payload)
+            self.manager.run_daemon_task(self._handle_imported_blocks)
+            self.manager.run_daemon_task(self._handle_new_block_hashes)
+
+            try:
+                async for event in self._event_bus.stream(NewBlockEvent):
+                    self.manager.run_task(
+                        self._handle_new_block, event.session, event.command.payload)
+            finally:
+                self._seal_validation_executor.shutdown(wait=False)
 
     async def _handle_new_block_hashes(self) -> None:
         async for event in self._event_bus.stream(NewBlockHashesEvent):
-            sender_peer = ETHProxyPeer.from_session(
-                event.session,
-                self._event_bus,
-                TO_NETWORKING_BROADCAST_CONFIG
-            )
+            try:
+                sender_peer = await self._peer_pool.ensure_proxy_peer(event.session)
+            except PeerConnectionLost:
+                self.logger.debug("Ignoring NewBlockHashes from departed %s", event.session)
+                continue
             for new_block_hash in event.command.payload:
                 self.manager.run_task(
                     self._fetch_witnesses, sender_peer, new_block_hash.hash, new_block_hash.number)
@@ -118,49 +159,116 @@ class NewBlockService(Service):
             await self._broadcast_new_block_hashes(block)
 
     async def _handle_new_block(self, sender: SessionAPI, payload: NewBlockPayload) -> None:
+        timer = Timer()
         header = payload.block.header
-        sender_peer = ETHProxyPeer.from_session(
-            sender,
-            self._event_bus,
-            TO_NETWORKING_BROADCAST_CONFIG
-        )
-        sender_peer_str = str(sender_peer)
+        try:
+            sender_peer = await self._peer_pool.ensure_proxy_peer(sender)
+        except PeerConnectionLost:
+            self.logger.debug("Ignoring NewBlock from departed %s", sender)
+            return
 
         # Add peer to tracker if we've seen this block before
         if header.hash in self._peer_block_tracker:
-            if sender_peer_str not in self._peer_block_tracker[header.hash]:
-                self._peer_block_tracker[header.hash].append(sender_peer_str)
-        else:
-            # Verify the validity of block, add to tracker and broadcast to eligible peers
-            with get_eth1_chain_with_remote_db(self._boot_info, self._event_bus) as chain:
+            self._peer_block_tracker.add(header.hash, sender)
+            return
+
+        # Verify the validity of block, add to tracker and broadcast to eligible peers
+        try:
+            await self._validate_seal(header)
+        except ValidationError as exc:
+            self.logger.info(
+                "Received invalid block from peer: %s. %s",
+                sender_peer, exc,
+            )
+            return
+        self._validated_latency.add(timer.elapsed)
+
+        if header.hash in self._peer_block_tracker:
+            # The same block arrived from another peer while we were validating it, and
+            # it has already been relayed.
+            self._peer_block_tracker.add(header.hash, sender)
+            return
+
+        self.manager.run_task(
+            self._fetch_witnesses, sender_peer, header.hash, header.block_number)
+        self._peer_block_tracker.add(header.hash, sender)
+        # Here we only broadcast a NewBlock msg to a subset of our peers, and once the
+        # block is imported into our chain a NewBlockImported event will be generated
+        # and we'll announce it to the remaining ones, as per the spec.
+        await self._broadcast_new_block(payload.block, payload.total_difficulty)
+        self._relayed_latency.add(timer.elapsed)
+
+    async def _validate_seal(self, header: BlockHeaderAPI) -> None:
+        """
+        Validate the seal of the given header off the event loop, raising a ValidationError
+        if it is invalid.
+
+        Only one validation runs per header at a time, and its result is cached.
+        """
+        block_hash = header.hash
+        # Loop in case the validation we waited on was cancelled before it had a result
+        while block_hash not in self._seal_validation_results:
+            if block_hash in self._pending_seal_validations:
+                await self._pending_seal_validations[block_hash].wait()
+                continue
+
+            validation_done = trio.Event()
+            self._pending_seal_validations[block_hash] = validation_done
+            try:
+                result: Optional[ValidationError]
                 try:
-                    chain.validate_seal(header)
+                    await self._run_seal_validation(header)
                 except ValidationError as exc:
-                    self.logger.info(
-                        "Received invalid block from peer: %s. %s",
-                        sender_peer_str, exc,
-                    )
+                    result = exc
                 else:
-                    self.manager.run_task(
-                        self._fetch_witnesses, sender_peer, header.hash, header.block_number)
-                    self._peer_block_tracker[header.hash] = [sender_peer_str]
-                    # Here we only broadcast a NewBlock msg to a subset of our peers, and once the
-                    # block is imported into our chain a NewBlockImported event will be generated
-                    # and we'll announce it to the remaining ones, as per the spec.
-                    await self._broadcast_new_block(payload.block, payload.total_difficulty)
+                    result = None
+                self._seal_validation_results[block_hash] = result
+            finally:
+                del self._pending_seal_validations[block_hash]
+                validation_done.set()
+
+            # Return the result directly, as it might be evicted from the cache already
+            if result is None:
+                return
+            else:
+                raise result
+
+        error = self._seal_validation_results[block_hash]
+        if error is not None:
+            raise error
+
+    async def _run_seal_validation(self, header: BlockHeaderAPI) -> None:
+        vm_class = self._chain.get_vm_class(header)
+        if vm_class.consensus_class is PowConsensus:
+            # pyethash holds the GIL while it builds the cache of an epoch and while it hashes,
+            # so a worker thread would still stall the event loop, and concurrent threads would
+            # race to build the same cache in py-evm's module-level cache_by_epoch. Worker
+            # processes each build their own cache, and only the wait for the result is done in
+            # a thread.
+            future = self._seal_validation_executor.submit(
+                check_pow,
+                header.block_number,
+                header.mining_hash,
+                header.mix_hash,
+                header.nonce,
+                header.difficulty,
+            )
+            await trio.to_thread.run_sync(future.result)
+        else:
+            # Other consensus engines are cheap to check, but may look up the database
+            await trio.to_thread.run_sync(self._chain.validate_seal, header)
 
     async def _broadcast_new_block_hashes(self, block: BlockAPI) -> None:
         """
         Send `NewBlockHashes` msgs to all peers that haven't heard about the given block yet.
         """
         all_peers = await self._peer_pool.get_peers()
-        eligible_peers = self._filter_eligible_peers(all_peers, block.hash)
+        eligible_peers = self._peer_block_tracker.filter_unseen(all_peers, block.hash)
         new_block_hash = NewBlockHash(hash=block.hash, number=block.number)
         for peer in eligible_peers:
             self.logger.debug("Sending NewBlockHashes(%s) to %s", block.header, peer)
-            target_peer = await self._peer_pool.ensure_proxy_peer(peer.session)
-            target_peer.eth_api.send_new_block_hashes((new_block_hash,))
-            self._peer_block_tracker[block.hash].append(str(target_peer))
+            peer.eth_api.send_new_block_hashes((new_block_hash,))
+            self._peer_block_tracker.add(block.hash, peer.session)
             # add checkpoint here to guarantee the event loop is released per iteration
             await trio.sleep(0)
 
@@ -169,46 +277,32 @@ class NewBlockService(Service):
         Send `NewBlock` msgs to a subset of our peers.
         """
         all_peers = await self._peer_pool.get_peers()
-        eligible_peers = self._filter_eligible_peers(all_peers, block_fields.header.hash)
+        eligible_peers = self._peer_block_tracker.filter_unseen(
+            all_peers, block_fields.header.hash)
         number_of_broadcasts = int(math.sqrt(len(all_peers)))
         sample_size = min(len(eligible_peers), number_of_broadcasts)
         broadcast_peers = random.sample(eligible_peers, sample_size)
 
         for peer in broadcast_peers:
-            target_peer = await self._peer_pool.ensure_proxy_peer(peer.session)
-            self.logger.debug("Sending NewBlock(%s) to %s", block_fields.header, target_peer)
-            target_peer.eth_api.send_new_block(block_fields, total_difficulty)
-            self._peer_block_tracker[block_fields.header.hash].append(str(target_peer))
-
-    @to_tuple
-    def _filter_eligible_peers(self,
-                               all_peers: Tuple[ETHProxyPeer],
-                               block_hash: bytes) -> Iterable[ETHProxyPeer]:
-        """
-        Filter and return peers who have not seen the given block hash.
-        """
-        for peer in all_peers:
-            if str(peer) not in self._peer_block_tracker[block_hash]:
-                yield peer
+            self.logger.debug("Sending NewBlock(%s) to %s", block_fields.header, peer)
+            peer.eth_api.send_new_block(block_fields, total_difficulty)
+            self._peer_block_tracker.add(block_fields.header.hash, peer.session)
 
     async def _fetch_witnesses(
             self, peer: ETHProxyPeer, block_hash: Hash32, block_number: BlockNumber) -> None:
-        base_db = DBClient.connect(self._boot_info.trinity_config.database_ipc_path)
-        with base_db:
-            try:
-                AsyncWitnessDB(base_db).get_witness_hashes(block_hash)
-            except WitnessHashesUnavailable:
-                pass
-            else:
-                block_str = f"Block #{block_number}-0x{humanize_hash(block_hash)}"
-                self.logger.debug(
-                    "Already have witness hashes for %s, not fetching again", block_str)
-                return
+        try:
+            self._witness_db.get_witness_hashes(block_hash)
+        except WitnessHashesUnavailable:
+            pass
+        else:
+            block_str = f"Block #{block_number}-0x{humanize_hash(block_hash)}"
+            self.logger.debug(
+                "Already have witness hashes for %s, not fetching again", block_str)
+            return
 
         await fetch_witnesses(
             peer, block_hash, block_number, self._event_bus,
-            self._boot_info.trinity_config.database_ipc_path,
-            self._metrics_registry, self.logger)
+            self._witness_db, self._metrics_registry, self.logger)
 
 
 async def fetch_witnesses(
@@ -216,7 +310,7 @@ async def fetch_witnesses(
         block_hash: Hash32,
         block_number: BlockNumber,
         event_bus: EndpointAPI,
-        database_ipc_path: pathlib.Path,
+        witness_db: AsyncWitnessDB,
         metrics_registry: MetricsRegistry,
         logger: ExtendedDebugLogger,
 ) -> Tuple[Hash32, ...]:
@@ -260,10 +354,7 @@ async def fetch_witnesses(
                 )
                 return witness_hashes
             await event_bus.broadcast(CollectMissingTrieNodes(witness_hashes, urgent, block_number))
-            base_db = DBClient.connect(database_ipc_path)
-            with base_db:
-                wit_db = AsyncWitnessDB(base_db)
-                wit_db.persist_witness_hashes(block_hash, witness_hashes)
+            witness_db.persist_witness_hashes(block_hash, witness_hashes)
         else:
             metrics_registry.counter('trinity.sync/block_witness_hashes.miss').inc()
             logger.debug(
@@ -0,0 +1,15 @@
+# How long to remember which peers know about a block. Blocks are propagated within
+# seconds of being mined, so after a few minutes nobody will announce them anymore.
+PEER_BLOCK_TRACKER_TTL = 5 * 60
+
+# Upper bound on the number of tracked blocks, regardless of their age, so that a flood of
+# announcements for distinct blocks can't grow the tracker unbounded.
+PEER_BLOCK_TRACKER_MAX_BLOCKS = 1024
+
+# How many worker processes validate proof-of-work seals. Each of them keeps its own ethash
+# cache of the current epoch, which takes a while to build, and each NewBlock is validated
+# only once, so a couple of processes is enough.
+SEAL_VALIDATION_PROCESSES = 2
+
+# How many seal validation results (valid or not) to remember, keyed by header hash
+SEAL_VALIDATION_CACHE_SIZE = 256
@@ -0,0 +1,90 @@
+import collections
+import time
+from typing import (
+    Iterable,
+    Set,
+    Tuple,
+)
+import uuid
+
+from eth_typing import Hash32
+
+from p2p.abc import SessionAPI
+from trinity.components.builtin.new_block.constants import (
+    PEER_BLOCK_TRACKER_MAX_BLOCKS,
+    PEER_BLOCK_TRACKER_TTL,
+)
+from trinity.protocol.eth.peer import ETHProxyPeer
+
+
+class PeerBlockTracker:
+    """
+    Keep track of which peers already know about which recent blocks, so that we
+    don't send them a block (or its hash) that they have already seen.
+
+    Peers are identified by their session id. Blocks are forgotten once they are older
+    than ``ttl`` seconds, or when more than ``max_blocks`` blocks are being tracked.
+    """
+
+    def __init__(self,
+                 ttl: float = PEER_BLOCK_TRACKER_TTL,
+                 max_blocks: int = PEER_BLOCK_TRACKER_MAX_BLOCKS) -> None:
+        self._ttl = ttl
+        self._max_blocks = max_blocks
+        # Insertion-ordered, so the oldest blocks are always at the front
+        self._sessions_by_block: 'collections.OrderedDict[Hash32, Tuple[float, Set[uuid.UUID]]]' = collections.OrderedDict()  # noqa: E501
+
+    def __contains__(self, block_hash: Hash32) -> bool:
+        self._prune()
+        return block_hash in self._sessions_by_block
+
+    def __len__(self) -> int:
+        self._prune()
+        return len(self._sessions_by_block)
+
+    def add(self, block_hash: Hash32, session: SessionAPI) -> None:
+        """
+        Record that the peer on the given session knows about the given block.
+        """
+        if block_hash not in self._sessions_by_block:
+            self._sessions_by_block[block_hash] = (time.monotonic(), set())
+        _, sessions = self._sessions_by_block[block_hash]
+        sessions.add(session.id)
+        self._prune()
+
+    def has_seen(self, block_hash: Hash32, session: SessionAPI) -> bool:
+        self._prune()
+        try:
+            _, sessions = self._sessions_by_block[block_hash]
+        except KeyError:
+            return False
+        else:
+            return session.id in sessions
+
+    def filter_unseen(
+            self,
+            peers: Iterable[ETHProxyPeer],
+            block_hash: Hash32) -> Tuple[ETHProxyPeer, ...]:
+        """
+        Return the peers that don't know about the given block.
+        """
+        self._prune()
+        try:
+            _, sessions = self._sessions_by_block[block_hash]
+        except KeyError:
+            return tuple(peers)
+        else:
+            return tuple(
+                peer for peer in peers
+                if peer.session.id not in sessions
+            )
+
+    def _prune(self) -> None:
+        expire_before = time.monotonic() - self._ttl
+        while self._sessions_by_block:
+            oldest_hash = next(iter(self._sessions_by_block))
+            added_at, _ = self._sessions_by_block[oldest_hash]
+            if added_at < expire_before or len(self._sessions_by_block) > self._max_blocks:
+                del self._sessions_by_block[oldest_hash]
+            else:
+                break
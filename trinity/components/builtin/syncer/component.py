@@ -372,7 +372,8 @@ class SyncerComponent(AsyncioIsolatedComponent):
         boot_info = self._boot_info
 
         if boot_info.args.enable_metrics:
-            metrics_service = metrics_service_from_args(boot_info.args, AsyncioMetricsService)
+            metrics_service = metrics_service_from_args(
+                boot_info.args, AsyncioMetricsService, event_bus)
         else:
             # Use a NoopMetricsService so that no code branches need to be taken if metrics
             # are disabled
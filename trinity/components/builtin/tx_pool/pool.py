@@ -15,6 +15,8 @@ from eth_utils.toolz import partition_all
 from eth.abc import SignedTransactionAPI
 
 from p2p.abc import SessionAPI
+from p2p.exceptions import PeerConnectionLost
+from p2p.logging import SampledLogger
 
 from trinity._utils.bloom import RollingBloom
 from trinity._utils.logging import get_logger
@@ -61,6 +63,7 @@ class TxPool(Service):
                  tx_validation_fn: Callable[[SignedTransactionAPI], bool],
                  ) -> None:
         self.logger = get_logger('trinity.components.txpool.TxPoolService')
+        self.sampled_logger = SampledLogger(self.logger)
         self._event_bus = event_bus
         self._peer_pool = peer_pool
 
@@ -117,7 +120,11 @@ class TxPool(Service):
     async def _process_get_pooled_transactions_requests(self) -> None:
 
         async for event in self._event_bus.stream(GetPooledTransactionsEvent):
-            asking_peer = await self._peer_pool.ensure_proxy_peer(event.session)
+            try:
+                asking_peer = await self._peer_pool.ensure_proxy_peer(event.session)
+            except PeerConnectionLost:
+                self.logger.debug("Ignoring GetPooledTransactions from departed %s", event.session)
+                continue
             asking_peer.eth_api.send_pooled_transactions([])
 
     async def _process_local_transactions(self) -> None:
@@ -131,7 +138,7 @@ class TxPool(Service):
 
     async def _handle_tx(self, sender: SessionAPI, txs: Sequence[SignedTransactionAPI]) -> None:
 
-        self.logger.debug2('Received %d transactions from %s', len(txs), sender)
+        self.sampled_logger.debug2('Received %d transactions from %s', len(txs), sender)
 
         self._add_txs_to_bloom(sender, txs)
         await self._internal_queue.put(txs)
@@ -84,6 +84,7 @@ from trinity.constants import (
     LOG_FILE,
     ENR_DB_DIR,
     PID_DIR,
+    PROFILE_DIR,
     SYNC_LIGHT,
 )
 from trinity.network_configurations import (
@@ -358,6 +359,13 @@ class TrinityConfig:
         """
         return self.with_app_suffix(self.data_dir / LOG_DIR)
 
+    @property
+    def profile_dir(self) -> Path:
+        """
+        Return the path of the directory where sampling profiler output is stored.
+        """
+        return self.with_app_suffix(self.data_dir / PROFILE_DIR)
+
     @property
     def trinity_root_dir(self) -> Path:
         """
@@ -25,6 +25,7 @@ IPC_DIR = 'ipcs'
 LOG_DIR = 'logs'
 LOG_FILE = 'trinity.log'
 PID_DIR = 'pids'
+PROFILE_DIR = 'profiles'
 ENR_DB_DIR = 'discovery-node-records'
 
 # sync modes
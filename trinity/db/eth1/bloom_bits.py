@@ -0,0 +1,213 @@
+from typing import (
+    Iterable,
+    Sequence,
+    Tuple,
+)
+
+from eth_typing import Hash32
+from eth_utils import (
+    big_endian_to_int,
+    int_to_big_endian,
+    keccak,
+)
+
+from eth.abc import (
+    AtomicDatabaseAPI,
+    BlockHeaderAPI,
+)
+
+
+# Number of blocks covered by each section of the bloom bits index
+BLOOM_BITS_SECTION_SIZE = 4096
+
+# Number of bits in a header's logs bloom
+BLOOM_BITS = 2048
+
+# Size of a bit vector, with one bit for each block of a section
+_BIT_VECTOR_SIZE = BLOOM_BITS_SECTION_SIZE // 8
+
+
+def get_bloom_bit_indices(value: bytes) -> Tuple[int, int, int]:
+    """
+    Return the three bits that are set in a logs bloom when ``value`` (an address or a
+    topic) is added to it.
+    """
+    value_hash = keccak(value)
+    return tuple(  # type: ignore
+        ((value_hash[i] << 8) | value_hash[i + 1]) % BLOOM_BITS
+        for i in (0, 2, 4)
+    )
+
+
+def bloom_matches(bloom: int, criteria: Sequence[Sequence[bytes]]) -> bool:
+    """
+    Whether the logs bloom may include a log that matches all the criteria, where each
+    criterion is a sequence of values that may match it. An empty criterion matches anything.
+    """
+    return all(
+        not alternatives or any(
+            all(bloom & (1 << bit) for bit in get_bloom_bit_indices(value))
+            for value in alternatives
+        )
+        for alternatives in criteria
+    )
+
+
+def get_section_block_range(section: int) -> Tuple[int, int]:
+    """
+    Return the first and last block numbers of the section, inclusive.
+    """
+    first_block = section * BLOOM_BITS_SECTION_SIZE
+    return first_block, first_block + BLOOM_BITS_SECTION_SIZE - 1
+
+
+class BloomBitsDB:
+    """
+    An index of the ``bloom`` field of the canonical headers, rotated into sections of
+    :data:`BLOOM_BITS_SECTION_SIZE` blocks.
+
+    For every section and every one of the 2048 bloom bits, a bit vector records which blocks
+    of the section have that bit set. Checking whether any block in a section may contain a
+    log for a value then takes three lookups, instead of one per block. Bit vectors with no
+    bits set are not stored.
+
+    The hash of the last header of each section is recorded, so that sections which are no
+    longer part of the canonical chain can be detected.
+    """
+    _indexed_sections_lookup_key = b'bloom-bits-indexed-sections'
+
+    def __init__(self, db: AtomicDatabaseAPI) -> None:
+        self.db = db
+
+    def _make_bit_vector_lookup_key(self, bit: int, section: int) -> bytes:
+        return b'bloom-bits:%d:%d' % (bit, section)
+
+    def _make_section_head_lookup_key(self, section: int) -> bytes:
+        return b'bloom-bits-section-head:%d' % section
+
+    def get_indexed_section_count(self) -> int:
+        """
+        Return the number of sections, starting from the genesis, that have been indexed.
+        """
+        try:
+            return big_endian_to_int(self.db[self._indexed_sections_lookup_key])
+        except KeyError:
+            return 0
+
+    def get_section_head(self, section: int) -> Hash32:
+        """
+        Return the hash of the last header of an indexed section.
+
+        Raise a ``KeyError`` if the section was never indexed.
+        """
+        return Hash32(self.db[self._make_section_head_lookup_key(section)])
+
+    def is_section_indexed(self, section: int, canonical_head_hash: Hash32) -> bool:
+        """
+        Whether the section is indexed, and its last header is the given canonical one.
+        """
+        if section >= self.get_indexed_section_count():
+            return False
+        return self.get_section_head(section) == canonical_head_hash
+
+    def get_bit_vector(self, bit: int, section: int) -> int:
+        """
+        Return a bitmask of the blocks in the section that have the bloom bit set, where
+        ``1 << n`` stands for the n-th block of the section.
+        """
+        try:
+            return big_endian_to_int(self.db[self._make_bit_vector_lookup_key(bit, section)])
+        except KeyError:
+            return 0
+
+    def get_matching_blocks(self, section: int, criteria: Sequence[Sequence[bytes]]) -> int:
+        """
+        Return a bitmask (like :meth:`get_bit_vector`) of the blocks in the section whose
+        bloom matches all the criteria, as defined by :func:`bloom_matches`.
+        """
+        # Every block in the section matches, until a criterion rules it out
+        matches = (1 << BLOOM_BITS_SECTION_SIZE) - 1
+        for alternatives in criteria:
+            if not alternatives:
+                continue
+
+            criterion_matches = 0
+            for value in alternatives:
+                value_matches = matches
+                for bit in get_bloom_bit_indices(value):
+                    value_matches &= self.get_bit_vector(bit, section)
+                    if not value_matches:
+                        break
+                criterion_matches |= value_matches
+
+            matches &= criterion_matches
+            if not matches:
+                break
+
+        return matches
+
+    def persist_section(self, section: int, headers: Sequence[BlockHeaderAPI]) -> None:
+        """
+        Index all the headers of a section, which must be the next one to index, or an
+        already indexed one being replaced after a re-org.
+        """
+        indexed_count = self.get_indexed_section_count()
+        if section > indexed_count:
+            raise ValueError(
+                f"Cannot index section {section} before section {indexed_count}"
+            )
+        elif len(headers) != BLOOM_BITS_SECTION_SIZE:
+            raise ValueError(
+                f"Section must have {BLOOM_BITS_SECTION_SIZE} headers, got {len(headers)}"
+            )
+
+        first_block, _ = get_section_block_range(section)
+        bit_vectors = [0] * BLOOM_BITS
+        for offset, header in enumerate(headers):
+            if header.block_number != first_block + offset:
+                raise ValueError(
+                    f"Expected header #{first_block + offset} at offset {offset} of "
+                    f"section {section}, got #{header.block_number}"
+                )
+            block_bit = 1 << offset
+            for bit in iter_set_bits(header.bloom):
+                bit_vectors[bit] |= block_bit
+
+        try:
+            self.get_section_head(section)
+        except KeyError:
+            is_reindexing = False
+        else:
+            # Bit vectors of the replaced headers must all be overwritten
+            is_reindexing = True
+
+        with self.db.atomic_batch() as batch:
+            for bit, bit_vector in enumerate(bit_vectors):
+                if bit_vector:
+                    batch[self._make_bit_vector_lookup_key(bit, section)] = int_to_big_endian(
+                        bit_vector
+                    ).rjust(_BIT_VECTOR_SIZE, b'\0')
+                elif is_reindexing:
+                    batch[self._make_bit_vector_lookup_key(bit, section)] = b''
+
+            batch[self._make_section_head_lookup_key(section)] = headers[-1].hash
+            batch[self._indexed_sections_lookup_key] = int_to_big_endian(
+                max(indexed_count, section + 1)
+            )
+
+    def rewind(self, section_count: int) -> None:
+        """
+        Mark every section starting at ``section_count`` as not indexed.
+        """
+        if section_count < self.get_indexed_section_count():
+            self.db[self._indexed_sections_lookup_key] = int_to_big_endian(section_count)
+
+
+def iter_set_bits(value: int) -> Iterable[int]:
+    """
+    Yield the positions of the bits that are set in ``value``, lowest first.
+    """
+    while value:
+        lowest_bit = value & -value
+        yield lowest_bit.bit_length() - 1
+        value ^= lowest_bit
@@ -15,6 +15,7 @@ from eth.abc import (
     ReceiptAPI,
     SignedTransactionAPI,
 )
+from eth.constants import GENESIS_PARENT_HASH
 from eth.db.chain import ChainDB
 
 from trinity._utils.async_dispatch import async_method
@@ -26,6 +27,18 @@ class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
     Abstract base class for the async counterpart to ``ChainDatabaseAPI``.
     """
 
+    def persist_blocks(
+            self,
+            blocks: Sequence[BlockAPI],
+            genesis_parent_hash: Hash32 = GENESIS_PARENT_HASH) -> None:
+        """
+        Persist a contiguous sequence of blocks, ordered by block number, in a single
+        atomic write to the database.
+        """
+        with self.db.atomic_batch() as db:
+            for block in blocks:
+                self._persist_block(db, block, genesis_parent_hash)
+
     @abstractmethod
     async def coro_exists(self, key: bytes) -> bool:
         ...
@@ -41,6 +54,10 @@ class BaseAsyncChainDB(BaseAsyncHeaderDB, ChainDB):
     ) -> Tuple[Tuple[Hash32, ...], Tuple[Hash32, ...]]:
         ...
 
+    @abstractmethod
+    async def coro_persist_blocks(self, blocks: Sequence[BlockAPI]) -> None:
+        ...
+
     @abstractmethod
     async def coro_persist_uncles(self, uncles: Sequence[BlockHeaderAPI]) -> Hash32:
         ...
@@ -82,6 +99,7 @@ class AsyncChainDB(BaseAsyncChainDB):
     coro_persist_header = async_method(BaseAsyncChainDB.persist_header)
     coro_persist_header_chain = async_method(BaseAsyncChainDB.persist_header_chain)
     coro_persist_block = async_method(BaseAsyncChainDB.persist_block)
+    coro_persist_blocks = async_method(BaseAsyncChainDB.persist_blocks)
     coro_persist_header_chain = async_method(BaseAsyncChainDB.persist_header_chain)
     coro_persist_uncles = async_method(BaseAsyncChainDB.persist_uncles)
     coro_persist_trie_data_dict = async_method(BaseAsyncChainDB.persist_trie_data_dict)
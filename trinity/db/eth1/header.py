@@ -1,19 +1,33 @@
 from abc import abstractmethod
 from typing import (
     Iterable,
+    Optional,
+    Sequence,
     Tuple,
     TypeVar,
 )
 
+import rlp
+
 from eth_typing import (
     Hash32,
     BlockNumber,
 )
+from eth_utils import (
+    encode_hex,
+    ValidationError,
+)
+from eth_utils.toolz import sliding_window
 
 from eth.abc import (
     BlockHeaderAPI,
+    DatabaseAPI,
 )
+from eth.constants import GENESIS_PARENT_HASH
 from eth.db.header import HeaderDB
+from eth.db.schema import SchemaV1
+from eth.exceptions import CanonicalHeadNotFound
+from eth.rlp.sedes import chain_gaps
 
 from trinity._utils.async_dispatch import async_method, trio_method
 
@@ -25,6 +39,87 @@ class BaseAsyncHeaderDB(HeaderDB):
     """
     Abstract base class for the async counterpart to ``HeaderDatabaseAPI``.
     """
+
+    def persist_header_chain(
+            self,
+            headers: Iterable[BlockHeaderAPI],
+            genesis_parent_hash: Hash32 = GENESIS_PARENT_HASH
+    ) -> Tuple[Tuple[BlockHeaderAPI, ...], Tuple[BlockHeaderAPI, ...]]:
+        headers = tuple(headers)
+        with self.db.atomic_batch() as db:
+            extension_result = self._extend_canonical_head(db, headers)
+            if extension_result is not None:
+                return extension_result
+            else:
+                return self._persist_header_chain(db, headers, genesis_parent_hash)
+
+    @classmethod
+    def _extend_canonical_head(
+            cls,
+            db: DatabaseAPI,
+            headers: Sequence[BlockHeaderAPI],
+    ) -> Optional[Tuple[Tuple[BlockHeaderAPI, ...], Tuple[BlockHeaderAPI, ...]]]:
+        """
+        Fast path for the most common case during sync: a segment of headers that directly
+        extends the canonical head, with no canonical headers (like checkpoints) beyond it.
+
+        The scores and canonical block number lookups of the whole segment are computed in
+        memory, instead of reading them back from the database header by header, which is
+        expensive when the database lives in another process.
+
+        Return ``None``, without writing anything, if the segment is not eligible, so that the
+        caller can fall back to the general code path.
+        """
+        if not headers:
+            return None
+
+        first_header = headers[0]
+        try:
+            head_hash = cls._get_canonical_head_hash(db)
+        except CanonicalHeadNotFound:
+            return None
+
+        if first_header.parent_hash != head_hash:
+            return None
+
+        gaps, tip_child = cls._get_header_chain_gaps(db)
+        if tip_child != first_header.block_number:
+            return None
+
+        if sum(header.difficulty for header in headers) == 0:
+            # The canonical head would not change, let the general code path handle it
+            return None
+
+        for parent, child in sliding_window(2, headers):
+            if parent.hash != child.parent_hash:
+                raise ValidationError(
+                    f"Non-contiguous chain. Expected {encode_hex(child.hash)} "
+                    f"to have {encode_hex(parent.hash)} as parent "
+                    f"but was {encode_hex(child.parent_hash)}"
+                )
+
+        score = cls._get_score(db, head_hash)
+        for header in headers:
+            score += header.difficulty
+            db.set(header.hash, rlp.encode(header))
+            db.set(
+                SchemaV1.make_block_hash_to_score_lookup_key(header.hash),
+                rlp.encode(score, sedes=rlp.sedes.big_endian_int),
+            )
+            db.set(
+                SchemaV1.make_block_number_to_hash_lookup_key(header.block_number),
+                rlp.encode(header.hash, sedes=rlp.sedes.binary),
+            )
+
+        last_header = headers[-1]
+        db.set(
+            SchemaV1.make_header_chain_gaps_lookup_key(),
+            rlp.encode((gaps, BlockNumber(last_header.block_number + 1)), sedes=chain_gaps),
+        )
+        db.set(SchemaV1.make_canonical_head_hash_lookup_key(), last_header.hash)
+
+        return headers, ()
+
     @abstractmethod
     async def coro_get_canonical_block_hash(self, block_number: BlockNumber) -> Hash32:
         ...
@@ -10,6 +10,8 @@ import threading
 from types import TracebackType
 from typing import (
     Iterator,
+    Sequence,
+    Tuple,
     Type,
 )
 
@@ -17,6 +19,7 @@ from eth_utils.toolz import partition
 
 from eth.abc import (
     AtomicDatabaseAPI,
+    DatabaseAPI,
 )
 from eth.db.atomic import AtomicDBWriteBatch
 from eth.db.backends.base import BaseAtomicDB
@@ -33,6 +36,7 @@ class Operation(enum.Enum):
     DELETE = b'\x02'
     EXISTS = b'\x03'
     ATOMIC_BATCH = b'\x04'
+    EXISTS_MANY = b'\x05'
 
 
 GET = Operation.GET
@@ -110,6 +114,19 @@ ATOMIC_BATCH Response:
 
 - Success Byte: 0x01
 """
+EXISTS_MANY = Operation.EXISTS_MANY
+"""
+EXISTS_MANY Request:
+
+- Operation Byte: 0x05
+- Key Count: 4-byte little endian
+- Key Sizes: Array of 4-byte little endian
+- Keys: Array of raw bytes
+
+EXISTS_MANY Response:
+
+- Response Bytes: one per key, in request order, True: 0x01 or False: 0x00
+"""
 
 
 LEN_BYTES = 4
@@ -171,6 +188,8 @@ class DBManager(IPCSocketServer):
                     self.handle_EXISTS(sock)
                 elif operation is ATOMIC_BATCH:
                     self.handle_ATOMIC_BATCH(sock)
+                elif operation is EXISTS_MANY:
+                    self.handle_EXISTS_MANY(sock)
                 else:
                     self.logger.error("Got unhandled operation %s", operation)
             except Exception as err:
@@ -243,6 +262,27 @@ class DBManager(IPCSocketServer):
 
         sock.sendall(SUCCESS_BYTE)
 
+    def handle_EXISTS_MANY(self, sock: BufferedSocket) -> None:
+        key_count_data = sock.read_exactly(LEN_BYTES)
+        key_count = int.from_bytes(key_count_data, 'little')
+
+        if key_count:
+            key_sizes_data = sock.read_exactly(LEN_BYTES * key_count)
+            key_sizes = struct.unpack('<' + 'I' * key_count, key_sizes_data)
+            keys_data = sock.read_exactly(sum(key_sizes))
+        else:
+            key_sizes = ()
+            keys_data = b''
+
+        response = bytearray()
+        offset = 0
+        for key_size in key_sizes:
+            key = keys_data[offset:offset + key_size]
+            offset += key_size
+            response += SUCCESS_BYTE if key in self.db else FAIL_BYTE
+
+        sock.sendall(bytes(response))
+
 
 class AtomicBatch(AtomicDBWriteBatch):
     """
@@ -323,6 +363,34 @@ class DBClient(BaseAtomicDB):
         else:
             raise Exception(f"Unknown result byte: {result_byte.hex}")
 
+    def exists_many(self, keys: Sequence[bytes]) -> Tuple[bool, ...]:
+        """
+        Check for the presence of all ``keys`` in a single round trip to the DBManager.
+        """
+        if not keys:
+            return ()
+
+        key_count_and_size_data = struct.pack(
+            '<I' + 'I' * len(keys),
+            len(keys),
+            *(len(key) for key in keys),
+        )
+        with self._lock:
+            self._socket.sendall(
+                EXISTS_MANY.value + key_count_and_size_data + b''.join(keys)
+            )
+            result_bytes = self._socket.read_exactly(len(keys))
+
+        results = []
+        for result_byte in result_bytes:
+            if result_byte == SUCCESS_BYTE[0]:
+                results.append(True)
+            elif result_byte == FAIL_BYTE[0]:
+                results.append(False)
+            else:
+                raise Exception(f"Unknown result byte: {result_byte:#x}")
+        return tuple(results)
+
     @contextlib.contextmanager
     def atomic_batch(self) -> Iterator[AtomicBatch]:
         batch = AtomicBatch(self)
@@ -373,6 +441,19 @@ class DBClient(BaseAtomicDB):
         return cls(s)
 
 
+def exists_many(db: DatabaseAPI, keys: Sequence[bytes]) -> Tuple[bool, ...]:
+    """
+    Check for the presence of each of ``keys`` in ``db``, returning the results in order.
+
+    When ``db`` is a :class:`DBClient` all keys are checked in a single round trip to the
+    database process, otherwise each key is checked individually.
+    """
+    if isinstance(db, DBClient):
+        return db.exists_many(keys)
+    else:
+        return tuple(key in db for key in keys)
+
+
 def _run() -> None:
     from eth.db.backends.level import LevelDB
     from eth.db.chain import ChainDB
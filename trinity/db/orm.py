@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Any
 
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.exc import (
@@ -14,6 +15,7 @@ from sqlalchemy.orm import (
 )
 from sqlalchemy import (
     create_engine,
+    event,
     Column,
     Integer,
     String,
@@ -29,6 +31,10 @@ Base = declarative_base()
 
 SCHEMA_VERSION = '4'
 
+# SQLite limits the number of host parameters of a single statement to 999, so statements
+# with one parameter per row should be split into batches of this many rows.
+MAX_QUERY_PARAMETERS = 500
+
 
 class SchemaVersion(Base):
     __tablename__ = 'schema_version'
@@ -40,6 +46,15 @@ class SchemaVersion(Base):
 #
 # SQL Based Trackers
 #
+def _configure_connection(dbapi_connection: Any, connection_record: Any) -> None:
+    # Write-ahead logging lets readers proceed while a transaction is being written, and only
+    # needs the log to be synced at checkpoints rather than on every commit.
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.close()
+
+
 def _get_session(path: Path) -> BaseSession:
     # python 3.6 does not support sqlite3.connect(Path)
     is_memory = path.name == ':memory:'
@@ -50,6 +65,8 @@ def _get_session(path: Path) -> BaseSession:
         database_uri = f'sqlite:///{path.resolve()}'
 
     engine = create_engine(database_uri)
+    if not is_memory:
+        event.listen(engine, 'connect', _configure_connection)
     Session = sessionmaker(bind=engine)
     session = Session()
     return session
@@ -96,6 +113,15 @@ def _check_tables_exist(session: BaseSession) -> bool:
     return True
 
 
+def _create_missing_indexes(session: BaseSession) -> None:
+    # Indexes added after a schema version was released are created in place, as they don't
+    # change what can be stored, so existing databases keep their data.
+    engine = session.get_bind()
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
+
 def get_tracking_database(db_path: Path) -> BaseSession:
     session = _get_session(db_path)
 
@@ -109,4 +135,5 @@ def get_tracking_database(db_path: Path) -> BaseSession:
             "with the CLI command `trinity remove-network-db`"
         )
 
+    _create_missing_indexes(session)
     return session
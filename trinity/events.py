@@ -32,3 +32,16 @@ class AvailableEndpointsUpdated(BaseEvent):
     """
 
     available_endpoints: Tuple[ConnectionConfig, ...]
+
+
+@dataclass
+class SamplingProfilerCommand(BaseEvent):
+    """
+    Broadcasted to start (``enabled=True``) or stop the
+    :class:`~trinity._utils.profiling.SamplingProfiler` of isolated components. If
+    ``endpoint_names`` is empty, every component acts on it, otherwise only those whose
+    endpoint is named there do.
+    """
+
+    enabled: bool
+    endpoint_names: Tuple[str, ...] = ()
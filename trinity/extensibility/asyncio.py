@@ -55,16 +55,25 @@ class AsyncioIsolatedComponent(BaseIsolatedComponent):
                 loop_monitoring_task = create_task(
                     self._loop_monitoring_task(event_bus),
                     f'AsyncioIsolatedComponent/{self.name}/loop_monitoring_task')
+                sampling_profiler_task = create_task(
+                    self._sampling_profiler_task(event_bus),
+                    f'AsyncioIsolatedComponent/{self.name}/sampling_profiler_task')
 
                 do_run_task = create_task(
                     self.do_run(event_bus),
                     f'AsyncioIsolatedComponent/{self.name}/do_run')
+
                 eventbus_task = create_task(
                     eventbus_manager.wait_finished(),
                     f'AsyncioIsolatedComponent/{self.name}/eventbus/wait_finished')
                 try:
                     max_wait_after_cancellation = 2
-                    tasks = [do_run_task, eventbus_task, loop_monitoring_task]
+                    tasks = [
+                        do_run_task,
+                        eventbus_task,
+                        loop_monitoring_task,
+                        sampling_profiler_task,
+                    ]
                     if self._boot_info.profile:
                         with profiler(f'profile_{self.get_endpoint_name()}'):
                             await wait_first(tasks, max_wait_after_cancellation)
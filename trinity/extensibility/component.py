@@ -30,10 +30,12 @@ from lahja import AsyncioEndpoint, ConnectionConfig, EndpointAPI, TrioEndpoint
 
 from trinity._utils.os import friendly_filename_or_url
 from trinity._utils.logging import get_logger
+from trinity._utils.profiling import SamplingProfiler
 from trinity.boot_info import BootInfo
 from trinity.cli_parser import parser, subparser
 from trinity.config import BaseAppConfig, Eth1AppConfig, TrinityConfig
 from trinity.constants import APP_IDENTIFIER_ETH1, SYNC_FULL
+from trinity.events import SamplingProfilerCommand
 from trinity.initialization import initialize_data_dir, is_data_dir_initialized
 
 if TYPE_CHECKING:
@@ -143,6 +145,27 @@ class BaseIsolatedComponent(BaseComponent):
         else:
             return cls.endpoint_name
 
+    async def _sampling_profiler_task(self, event_bus: EndpointAPI) -> None:
+        """
+        Start and stop a :class:`~trinity._utils.profiling.SamplingProfiler` for this
+        component's process as :class:`~trinity.events.SamplingProfilerCommand` events arrive.
+        """
+        endpoint_name = self.get_endpoint_name()
+        sampling_profiler = SamplingProfiler(
+            self._boot_info.trinity_config.profile_dir,
+            endpoint_name,
+        )
+        try:
+            async for command in event_bus.stream(SamplingProfilerCommand):
+                if command.endpoint_names and endpoint_name not in command.endpoint_names:
+                    continue
+                elif command.enabled and not sampling_profiler.is_running:
+                    sampling_profiler.start()
+                elif not command.enabled:
+                    sampling_profiler.stop()
+        finally:
+            sampling_profiler.stop()
+
 
 @contextlib.asynccontextmanager
 async def _run_asyncio_component_in_proc(
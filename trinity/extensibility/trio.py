@@ -72,6 +72,7 @@ class TrioIsolatedComponent(BaseIsolatedComponent):
                 event_bus = await event_bus_service.get_event_bus()
                 async with trio.open_nursery() as nursery:
                     nursery.start_soon(self._loop_monitoring_task, event_bus)
+                    nursery.start_soon(self._sampling_profiler_task, event_bus)
                     nursery.start_soon(self.run_process, event_bus)
                     try:
                         await trio.sleep_forever()
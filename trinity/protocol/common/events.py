@@ -126,11 +126,24 @@ class PeerPoolMessageEvent(BaseEvent):
     The event type is used bidirectionally, for peer messages that originate in the peer pool and
     are propagated to any consuming party but also for peer messages that originate elsewhere but
     are propagated toward the peer pool to be dispatched on a peer.
+
+    Commands only carry their encoded payload across the event bus (see
+    :meth:`p2p.commands.BaseCommand.from_encoded_payload`), which is decoded by the receiving
+    process once it accesses the payload.
     """
     session: SessionAPI
     command: CommandAPI[Any]
 
 
+@dataclass
+class SendCommandsBatchEvent(BaseEvent):
+    """
+    Carry many commands, to be sent to (possibly different) peers, from any process to the
+    peer pool in a single event. Commands are sent in the order they appear in the batch.
+    """
+    commands: Tuple[Tuple[SessionAPI, CommandAPI[Any]], ...]
+
+
 @dataclass
 class ProtocolCapabilitiesResponse(BaseEvent):
     """
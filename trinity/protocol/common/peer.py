@@ -241,6 +241,15 @@ class BaseChainPeerPool(BasePeerPool):
 
     @property
     def highest_td_peer(self) -> BaseChainPeer:
+        return random.choice(self.highest_td_peers)
+
+    @property
+    def highest_td_peers(self) -> Tuple[BaseChainPeer, ...]:
+        """
+        All the connected peers that share the highest total difficulty.
+
+        :raise NoConnectedPeers: if there are no connected peers
+        """
         peers = tuple(self.connected_nodes.values())
         if not peers:
             raise NoConnectedPeers("No connected peers")
@@ -252,7 +261,7 @@ class BaseChainPeerPool(BasePeerPool):
         )
         peers_by_td = groupby(td_getter, peers)
         max_td = max(peers_by_td.keys())
-        return random.choice(peers_by_td[max_td])
+        return tuple(peers_by_td[max_td])
 
     def setup_connection_tracker(self) -> BaseConnectionTracker:
         if self.has_event_bus:
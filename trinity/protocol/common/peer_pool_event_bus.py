@@ -10,9 +10,11 @@ from typing import (
     Dict,
     FrozenSet,
     Generic,
+    List,
     Tuple,
     Type,
     TypeVar,
+    Union,
 )
 
 from async_service import Service
@@ -23,6 +25,8 @@ from lahja import (
     BroadcastConfig,
     EndpointAPI,
 )
+from lru import LRU
+import trio
 
 from p2p.abc import CommandAPI, SessionAPI
 from p2p.exceptions import PeerConnectionLost
@@ -49,6 +53,7 @@ from .events import (
     PeerLeftEvent,
     ProtocolCapabilitiesResponse,
     PeerPoolMessageEvent,
+    SendCommandsBatchEvent,
 )
 from .peer import BaseProxyPeer
 
@@ -60,6 +65,17 @@ TRequest = TypeVar('TRequest', bound=BaseRequestResponseEvent[Any])
 
 async_fire_and_forget = async_suppress_exceptions(PeerConnectionLost, asyncio.TimeoutError)
 
+# Maximum number of commands coalesced into a single SendCommandsBatchEvent
+COMMAND_BATCH_MAX_SIZE = 200
+
+# Maximum number of seconds a command is held back to be sent together with later ones. With
+# zero, commands are coalesced until the current iteration of the event loop is over.
+COMMAND_BATCH_MAX_DELAY = 0
+
+# Number of sessions that left the actual pool to remember in proxy peer pools, so that late
+# messages from them do not bring their proxy peers back
+DEPARTED_SESSIONS_CACHE_SIZE = 1000
+
 
 class PeerPoolEventServer(Service, PeerSubscriber, Generic[TPeer]):
     """
@@ -92,6 +108,8 @@ class PeerPoolEventServer(Service, PeerSubscriber, Generic[TPeer]):
             )
         )
 
+        self.run_daemon_event(SendCommandsBatchEvent, self.handle_send_commands_batch)
+
         self.manager.run_daemon_task(self.handle_peer_count_requests)
         self.manager.run_daemon_task(self.handle_connect_to_node_requests)
         self.manager.run_daemon_task(self.handle_disconnect_from_peer_requests)
@@ -112,6 +130,24 @@ class PeerPoolEventServer(Service, PeerSubscriber, Generic[TPeer]):
             lambda peer: peer.sub_proto.send(event.command)
         )
 
+    async def handle_send_commands_batch(self, event: SendCommandsBatchEvent) -> None:
+        """
+        Process any :class:`trinity.protocol.common.events.SendCommandsBatchEvent` by
+        sending each of its commands through the protocol of the corresponding session.
+
+        A command that can't be sent doesn't prevent the rest of the batch from being sent.
+        """
+        for session, command in event.commands:
+            try:
+                await self.try_with_session(session, lambda peer: peer.sub_proto.send(command))
+            except asyncio.CancelledError:
+                raise
+            except (PeerConnectionLost, asyncio.TimeoutError):
+                # the transport of a peer that is going away may already be closed
+                self.logger.debug("Could not send %s to %s, peer is gone", command, session)
+            except Exception as exc:
+                self.logger.exception("Failed to send %s to %s: %s", command, session, exc)
+
     def run_daemon_event(self,
                          event_type: Type[TEvent],
                          event_handler_fn: Callable[[TEvent], Any]) -> None:
@@ -281,6 +317,56 @@ class DefaultPeerPoolEventServer(PeerPoolEventServer[BasePeer]):
         pass
 
 
+class OutboundCommandBatcher:
+    """
+    Coalesce commands sent to peers from outside of the process that runs the peer pool into
+    :class:`trinity.protocol.common.events.SendCommandsBatchEvent` events, instead of paying
+    for one event per command. A batch is broadcast once it reaches ``max_batch_size``
+    commands, or ``max_delay`` seconds after its first command was added.
+    """
+
+    def __init__(self,
+                 event_bus: EndpointAPI,
+                 broadcast_config: BroadcastConfig,
+                 max_batch_size: int = COMMAND_BATCH_MAX_SIZE,
+                 max_delay: float = COMMAND_BATCH_MAX_DELAY) -> None:
+        self._event_bus = event_bus
+        self._broadcast_config = broadcast_config
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._pending: List[Tuple[SessionAPI, CommandAPI[Any]]] = []
+        self._flush_handle: asyncio.TimerHandle = None
+
+    def send(self, session: SessionAPI, command: CommandAPI[Any]) -> None:
+        self._pending.append((session, command))
+        if len(self._pending) >= self._max_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # Not running on asyncio (e.g. in a trio component), so there is no loop to
+                # schedule the flush on.
+                self.flush()
+            else:
+                self._flush_handle = loop.call_later(self._max_delay, self.flush)
+
+    def flush(self) -> None:
+        """
+        Broadcast all pending commands right away.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        batch = tuple(self._pending)
+        self._pending.clear()
+        self._event_bus.broadcast_nowait(SendCommandsBatchEvent(batch), self._broadcast_config)
+
+
 TProxyPeer = TypeVar('TProxyPeer', bound=BaseProxyPeer)
 
 
@@ -289,13 +375,24 @@ class BaseProxyPeerPool(Service, Generic[TProxyPeer]):
     Base class for peer pools that can be used from any process instead of the actual peer pool
     that runs in another process. Eventually, every process that needs to interact with the peer
     pool should be able to use a proxy peer pool for all peer pool interactions.
+
+    The set of connected peers is fetched from the actual pool only once, after which it is kept
+    up to date from the :class:`~trinity.protocol.common.events.PeerJoinedEvent` and
+    :class:`~trinity.protocol.common.events.PeerLeftEvent` events that the actual pool pushes,
+    so looking up peers never waits on the event bus.
     """
 
     def __init__(self, event_bus: EndpointAPI, broadcast_config: BroadcastConfig) -> None:
         self.logger = get_logger('trinity.protocol.common.BaseProxyPeerPool')
         self.event_bus = event_bus
         self.broadcast_config = broadcast_config
+        self.command_batcher = OutboundCommandBatcher(event_bus, broadcast_config)
         self.connected_peers: Dict[SessionAPI, TProxyPeer] = dict()
+        self._has_fetched_initial_peers = False
+        # Set once the initial fetch of peers that is in progress, if any, is over
+        self._initial_peers_fetch: Union[asyncio.Event, trio.Event] = None
+        # The most recent sessions that left the actual pool, as keys with no value
+        self._departed_sessions = LRU(DEPARTED_SESSIONS_CACHE_SIZE)
 
     async def stream_existing_and_joining_peers(self) -> AsyncIterator[TProxyPeer]:
         for proxy_peer in await self.get_peers():
@@ -316,8 +413,10 @@ class BaseProxyPeerPool(Service, Generic[TProxyPeer]):
 
     async def handle_leaving_peers(self) -> None:
         async for ev in self.event_bus.stream(PeerLeftEvent):
+            self._departed_sessions[ev.session] = None
             if ev.session not in self.connected_peers:
-                self.logger.warning("Wanted to remove peer but it is missing %s", ev.session)
+                if self._has_fetched_initial_peers:
+                    self.logger.warning("Wanted to remove peer but it is missing %s", ev.session)
             else:
                 proxy_peer = self.connected_peers.pop(ev.session)
                 # TODO: Double check based on some session id if we are indeed
@@ -328,11 +427,14 @@ class BaseProxyPeerPool(Service, Generic[TProxyPeer]):
     async def fetch_initial_peers(self) -> Tuple[TProxyPeer, ...]:
         response = await self.event_bus.request(GetConnectedPeersRequest(), self.broadcast_config)
 
-        return tuple([
+        proxy_peers = tuple([
             await self.ensure_proxy_peer(peer_info.session)
             for peer_info
             in response.peers
+            if peer_info.session not in self._departed_sessions
         ])
+        self._has_fetched_initial_peers = True
+        return proxy_peers
 
     async def get_peers(self) -> Tuple[TProxyPeer, ...]:
         """
@@ -340,11 +442,21 @@ class BaseProxyPeerPool(Service, Generic[TProxyPeer]):
         """
 
         # The ProxyPeerPool could be started at any point in time after the actual peer pool.
-        # Based on this assumption, if we don't have any proxy peers yet, sync with the actual pool
-        # first. From that point on, the proxy peer pool will maintain the set of proxies based on
+        # Based on this assumption, sync with the actual pool the first time we're asked for
+        # peers. From that point on, the proxy peer pool will maintain the set of proxies based on
         # the events of incoming / leaving peers.
-        if not any(self.connected_peers):
-            await self.fetch_initial_peers()
+        # Loop in case the fetch we waited on failed or was cancelled
+        while not self._has_fetched_initial_peers:
+            if self._initial_peers_fetch is not None:
+                await self._initial_peers_fetch.wait()
+                continue
+
+            self._initial_peers_fetch = _new_event()
+            try:
+                await self.fetch_initial_peers()
+            finally:
+                self._initial_peers_fetch.set()
+                self._initial_peers_fetch = None
         return tuple(self.connected_peers.values())
 
     @abstractmethod
@@ -355,8 +467,15 @@ class BaseProxyPeerPool(Service, Generic[TProxyPeer]):
         ...
 
     async def ensure_proxy_peer(self, session: SessionAPI) -> TProxyPeer:
+        """
+        Return the proxy peer for the given session, creating it if needed.
 
-        if session not in self.connected_peers:
+        :raise PeerConnectionLost: if the session already left the actual pool, as its proxy
+            peer would never be removed again
+        """
+        if session in self._departed_sessions:
+            raise PeerConnectionLost(f"Peer at {session} already left the pool")
+        elif session not in self.connected_peers:
             proxy_peer = self.convert_session_to_proxy_peer(
                 session,
                 self.event_bus,
@@ -372,3 +491,13 @@ class BaseProxyPeerPool(Service, Generic[TProxyPeer]):
         self.manager.run_daemon_task(self.handle_joining_peers)
         self.manager.run_daemon_task(self.handle_leaving_peers)
         await self.manager.wait_finished()
+
+
+def _new_event() -> Union[asyncio.Event, trio.Event]:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # Not running on asyncio, proxy peer pools are also used by trio components
+        return trio.Event()
+    else:
+        return asyncio.Event()
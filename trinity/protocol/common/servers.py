@@ -25,6 +25,7 @@ from lahja import (
 )
 
 from p2p.abc import CommandAPI, SessionAPI
+from p2p.logging import SampledLogger
 
 from trinity._utils.headers import sequence_builder
 from trinity.db.eth1.header import BaseAsyncHeaderDB
@@ -40,6 +41,8 @@ class BaseIsolatedRequestServer(Service):
     Handle those inbound requests by querying our local database and replying.
     """
     logger = get_logger('trinity.protocol.common.servers.IsolatedRequestServer')
+    # For the logs of every request we receive
+    sampled_logger = SampledLogger(logger)
 
     def __init__(
             self,
@@ -83,6 +86,8 @@ class BaseIsolatedRequestServer(Service):
 
 class BasePeerRequestHandler:
     logger = get_logger('trinity.protocol.common.servers.PeerRequestHandler')
+    # For the logs of every request we handle
+    sampled_logger = SampledLogger(logger)
 
     def __init__(self, db: BaseAsyncHeaderDB) -> None:
         self.db = db
@@ -29,6 +29,7 @@ from trinity.protocol.common.peer_pool_event_bus import (
     async_fire_and_forget,
     BaseProxyPeer,
     BaseProxyPeerPool,
+    OutboundCommandBatcher,
     PeerPoolEventServer,
     FIRE_AND_FORGET_BROADCASTING,
 )
@@ -172,11 +173,12 @@ class ETHProxyPeer(BaseProxyPeer):
     def from_session(cls,
                      session: SessionAPI,
                      event_bus: EndpointAPI,
-                     broadcast_config: BroadcastConfig) -> 'ETHProxyPeer':
+                     broadcast_config: BroadcastConfig,
+                     command_batcher: OutboundCommandBatcher = None) -> 'ETHProxyPeer':
         return cls(
             session,
             event_bus,
-            ProxyETHAPI(session, event_bus, broadcast_config),
+            ProxyETHAPI(session, event_bus, broadcast_config, command_batcher),
             # XXX: For now all peers will have a ProxyWitAPI as here we can't find out whether or
             # not they support the wit API, but that shouldn't be a problem as this is currently
             # used only by the RequestServer component, and we shouldn't get any witness requests
@@ -436,5 +438,6 @@ class ETHProxyPeerPool(BaseProxyPeerPool[ETHProxyPeer]):
         return ETHProxyPeer.from_session(
             session,
             self.event_bus,
-            self.broadcast_config
+            self.broadcast_config,
+            self.command_batcher,
         )
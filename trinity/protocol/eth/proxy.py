@@ -22,6 +22,8 @@ from p2p.abc import SessionAPI
 
 from trinity._utils.errors import SupportsError
 from trinity._utils.logging import get_logger
+from trinity.protocol.common.events import PeerPoolMessageEvent
+from trinity.protocol.common.peer_pool_event_bus import OutboundCommandBatcher
 from trinity.protocol.common.typing import (
     BlockBodyBundles,
     NodeDataBundles,
@@ -61,16 +63,21 @@ class ProxyETHAPI:
     """
     An ``ETHAPI`` that can be used outside of the process that runs the peer pool. Any
     action performed on this class is delegated to the process that runs the peer pool.
+
+    If a ``command_batcher`` is given, commands sent to the peer are coalesced with those sent
+    to other peers through the same batcher.
     """
     logger = get_logger('trinity.protocol.eth.proxy.ProxyETHAPI')
 
     def __init__(self,
                  session: SessionAPI,
                  event_bus: EndpointAPI,
-                 broadcast_config: BroadcastConfig):
+                 broadcast_config: BroadcastConfig,
+                 command_batcher: OutboundCommandBatcher = None):
         self.session = session
         self._event_bus = event_bus
         self._broadcast_config = broadcast_config
+        self._command_batcher = command_batcher
 
     def raise_if_needed(self, value: SupportsError) -> None:
         if value.error is not None:
@@ -200,42 +207,33 @@ class ProxyETHAPI:
 
         return response.transactions
 
+    def _send(self, event: PeerPoolMessageEvent) -> None:
+        if self._command_batcher is None:
+            self._event_bus.broadcast_nowait(event, self._broadcast_config)
+        else:
+            self._command_batcher.send(event.session, event.command)
+
     def send_transactions(self,
                           txns: Sequence[SignedTransactionAPI]) -> None:
         command = Transactions(tuple(txns))
-        self._event_bus.broadcast_nowait(
-            SendTransactionsEvent(self.session, command),
-            self._broadcast_config,
-        )
+        self._send(SendTransactionsEvent(self.session, command))
 
     def send_pooled_transactions(self,
                                  txns: Sequence[SignedTransactionAPI]) -> None:
         command = PooledTransactionsV65(tuple(txns))
-        self._event_bus.broadcast_nowait(
-            SendPooledTransactionsEvent(self.session, command),
-            self._broadcast_config,
-        )
+        self._send(SendPooledTransactionsEvent(self.session, command))
 
     def send_block_headers(self, headers: Sequence[BlockHeaderAPI]) -> None:
         command = BlockHeadersV65(tuple(headers))
-        self._event_bus.broadcast_nowait(
-            SendBlockHeadersEvent(self.session, command),
-            self._broadcast_config,
-        )
+        self._send(SendBlockHeadersEvent(self.session, command))
 
     def send_new_block_hashes(self, new_block_hashes: Sequence[NewBlockHash]) -> None:
         command = NewBlockHashes(tuple(new_block_hashes))
-        self._event_bus.broadcast_nowait(
-            SendNewBlockHashesEvent(self.session, command),
-            self._broadcast_config,
-        )
+        self._send(SendNewBlockHashesEvent(self.session, command))
 
     def send_new_block(self, block_fields: BlockFields, total_difficulty: int) -> None:
         command = NewBlock(NewBlockPayload(block_fields, total_difficulty))
-        self._event_bus.broadcast_nowait(
-            SendNewBlockEvent(self.session, command),
-            self._broadcast_config,
-        )
+        self._send(SendNewBlockEvent(self.session, command))
 
     def send_block_bodies(self, blocks: Sequence[BlockAPI]) -> None:
         block_bodies = tuple(
@@ -243,21 +241,12 @@ class ProxyETHAPI:
             for block in blocks
         )
         command = BlockBodiesV65(block_bodies)
-        self._event_bus.broadcast_nowait(
-            SendBlockBodiesEvent(self.session, command),
-            self._broadcast_config,
-        )
+        self._send(SendBlockBodiesEvent(self.session, command))
 
     def send_receipts(self, receipts: Sequence[Sequence[ReceiptAPI]]) -> None:
         command = ReceiptsV65(tuple(map(tuple, receipts)))
-        self._event_bus.broadcast_nowait(
-            SendReceiptsEvent(self.session, command),
-            self._broadcast_config,
-        )
+        self._send(SendReceiptsEvent(self.session, command))
 
     def send_node_data(self, nodes: Sequence[bytes]) -> None:
         command = NodeDataV65(tuple(nodes))
-        self._event_bus.broadcast_nowait(
-            SendNodeDataEvent(self.session, command),
-            self._broadcast_config,
-        )
+        self._send(SendNodeDataEvent(self.session, command))
@@ -60,10 +60,10 @@ class ETHPeerRequestHandler(BasePeerRequestHandler):
             self,
             peer: ETHProxyPeer,
             command: GetBlockHeadersV65) -> None:
-        self.logger.debug("%s requested headers: %s", peer, command.payload)
+        self.sampled_logger.debug("%s requested headers: %s", peer, command.payload)
 
         headers = await self.lookup_headers(command.payload)
-        self.logger.debug2("Replying to %s with %d headers", peer, len(headers))
+        self.sampled_logger.debug2("Replying to %s with %d headers", peer, len(headers))
         peer.eth_api.send_block_headers(headers)
 
     async def handle_get_block_bodies(self,
@@ -71,7 +71,7 @@ class ETHPeerRequestHandler(BasePeerRequestHandler):
                                       command: GetBlockBodiesV65) -> None:
         block_hashes = command.payload
 
-        self.logger.debug2("%s requested bodies for %d blocks", peer, len(block_hashes))
+        self.sampled_logger.debug2("%s requested bodies for %d blocks", peer, len(block_hashes))
         bodies = []
         # Only serve up to MAX_BODIES_FETCH items in every request.
         for block_hash in block_hashes[:MAX_BODIES_FETCH]:
@@ -104,13 +104,13 @@ class ETHPeerRequestHandler(BasePeerRequestHandler):
                 )
                 continue
             bodies.append(BlockBody(transactions, uncles))
-        self.logger.debug2("Replying to %s with %d block bodies", peer, len(bodies))
+        self.sampled_logger.debug2("Replying to %s with %d block bodies", peer, len(bodies))
         peer.eth_api.send_block_bodies(bodies)
 
     async def handle_get_receipts(self, peer: ETHProxyPeer, command: GetReceiptsV65) -> None:
         block_hashes = command.payload
 
-        self.logger.debug2("%s requested receipts for %d blocks", peer, len(block_hashes))
+        self.sampled_logger.debug2("%s requested receipts for %d blocks", peer, len(block_hashes))
         receipts = []
         # Only serve up to MAX_RECEIPTS_FETCH items in every request.
         for block_hash in block_hashes[:MAX_RECEIPTS_FETCH]:
@@ -133,13 +133,14 @@ class ETHPeerRequestHandler(BasePeerRequestHandler):
                 )
                 continue
             receipts.append(block_receipts)
-        self.logger.debug2("Replying to %s with receipts for %d blocks", peer, len(receipts))
+        self.sampled_logger.debug2(
+            "Replying to %s with receipts for %d blocks", peer, len(receipts))
         peer.eth_api.send_receipts(receipts)
 
     async def handle_get_node_data(self, peer: ETHProxyPeer, command: GetNodeDataV65) -> None:
         node_hashes = command.payload
 
-        self.logger.debug2("%s requested %d trie nodes", peer, len(node_hashes))
+        self.sampled_logger.debug2("%s requested %d trie nodes", peer, len(node_hashes))
         nodes = []
         missing_node_hashes = []
         # Only serve up to MAX_STATE_FETCH items in every request.
@@ -150,7 +151,7 @@ class ETHPeerRequestHandler(BasePeerRequestHandler):
                 missing_node_hashes.append(node_hash)
             else:
                 nodes.append(node)
-        self.logger.debug2("Replying to %s with %d trie nodes", peer, len(nodes))
+        self.sampled_logger.debug2("Replying to %s with %d trie nodes", peer, len(nodes))
         if len(missing_node_hashes):
             self.logger.debug(
                 "%s asked for %d trie nodes that we don't have, out of request for %d",
@@ -183,7 +184,7 @@ class ETHRequestServer(BaseIsolatedRequestServer):
                           session: SessionAPI,
                           cmd: CommandAPI[Any]) -> None:
 
-        self.logger.debug2("Peer %s requested %s", session, cmd)
+        self.sampled_logger.debug2("Peer %s requested %s", session, cmd)
         peer = ETHProxyPeer.from_session(session, self.event_bus, self.broadcast_config)
 
         if isinstance(cmd, commands.GetBlockHeadersV65):
@@ -5,6 +5,7 @@ from typing import (
     Optional,
     Sequence,
     Tuple,
+    Type,
     TypeVar,
     Union,
 )
@@ -15,7 +16,7 @@ from eth.abc import BlockHeaderAPI
 from eth_typing import BlockNumber, Hash32
 from eth_utils import ValidationError
 
-from p2p.abc import ConnectionAPI
+from p2p.abc import CommandAPI, ConnectionAPI
 from p2p.exchange import ExchangeAPI, ExchangeLogic
 from p2p.logic import Application, CommandHandler
 from p2p.qualifiers import HasProtocol
@@ -30,13 +31,21 @@ from .constants import (
 )
 from .commands import (
     Announce,
+    BlockBodies,
     BlockHeaders,
+    ContractCodes,
     GetBlockBodies,
     GetBlockHeaders,
     GetContractCodes,
+    GetProofsV1,
+    GetProofsV2,
     GetReceipts,
+    ProofsV1,
+    ProofsV2,
+    Receipts,
 )
 from .exchanges import GetBlockHeadersExchange
+from .flow_control import BufferValueTracker, FlowControlBuffer
 from .handshaker import LESHandshakeReceipt
 from .payloads import (
     AnnouncePayload,
@@ -110,6 +119,11 @@ class BaseLESAPI(Application, Generic[TLESProtocol]):
         self.get_block_headers = GetBlockHeadersExchange()
         self.add_child_behavior(ExchangeLogic(self.get_block_headers).as_behavior())
 
+        # Only the replies supported by the negotiated protocol version get tracked
+        for reply_type in (BlockHeaders, BlockBodies, Receipts, ProofsV1, ProofsV2, ContractCodes):
+            tracker = BufferValueTracker(reply_type, lambda: self.flow_control)
+            self.add_child_behavior(tracker.as_behavior())
+
     @cached_property
     def exchanges(self) -> Tuple[ExchangeAPI[Any, Any, Any], ...]:
         return (
@@ -135,6 +149,19 @@ class BaseLESAPI(Application, Generic[TLESProtocol]):
     def network_id(self) -> int:
         return self.receipt.network_id
 
+    @cached_property
+    def flow_control(self) -> FlowControlBuffer:
+        return FlowControlBuffer.from_status(self.receipt.handshake_params)
+
+    def get_request_cost(self, command_type: Type[CommandAPI[Any]], num_items: int) -> int:
+        """
+        The maximum cost the server charges for a request, as announced in the handshake.
+        Either GetProofs type may be given, the one of the negotiated version is used.
+        """
+        if command_type in (GetProofsV1, GetProofsV2):
+            command_type = self.protocol.get_proofs_command_type
+        return self.flow_control.get_request_cost(command_type, num_items)
+
     @cached_property
     def genesis_hash(self) -> Hash32:
         return self.receipt.genesis_hash
@@ -0,0 +1,124 @@
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Tuple,
+    Type,
+)
+
+from p2p.abc import CommandAPI, ConnectionAPI
+from p2p.logic import CommandHandler
+
+from .payloads import StatusPayload
+
+
+class FlowControlBuffer:
+    """
+    Client-side estimate of the flow control buffer that a LES server keeps for us.
+
+    The server announces its buffer limit (BL), minimum recharge rate (MRR) and maximum
+    request costs (MRC) during the handshake. Every request we send is charged against
+    the buffer, which recharges at MRR units per millisecond up to BL. Each reply carries
+    the server's view of the buffer value (BV), which we use to resynchronize. A server
+    disconnects a client that sends a request it can't afford.
+
+    If the server announced no flow control parameters, it is treated as never throttling.
+    """
+
+    def __init__(self,
+                 buffer_limit: int,
+                 min_recharge_rate: int,
+                 request_costs: Dict[int, Tuple[int, int]]) -> None:
+        self.buffer_limit = buffer_limit
+        self._min_recharge_rate = min_recharge_rate
+        # protocol command id -> (base cost, cost per requested item)
+        self._request_costs = request_costs
+
+        self._buffer_value = buffer_limit
+        self._updated_at = time.monotonic()
+
+    @classmethod
+    def from_status(cls, status: StatusPayload) -> 'FlowControlBuffer':
+        if status.flow_control_bl is None or status.flow_control_mrr is None:
+            return cls(0, 0, {})
+
+        request_costs = {
+            command_id: (base_cost, request_cost)
+            for command_id, base_cost, request_cost in (status.flow_control_mcr or ())
+        }
+        return cls(status.flow_control_bl, status.flow_control_mrr, request_costs)
+
+    @property
+    def is_limited(self) -> bool:
+        return self.buffer_limit > 0
+
+    @property
+    def estimated_buffer(self) -> int:
+        if not self.is_limited:
+            return 0
+        elapsed_ms = (time.monotonic() - self._updated_at) * 1000
+        recharged = self._buffer_value + int(elapsed_ms * self._min_recharge_rate)
+        return min(self.buffer_limit, recharged)
+
+    def get_request_cost(self, command_type: Type[CommandAPI[Any]], num_items: int) -> int:
+        try:
+            base_cost, item_cost = self._request_costs[command_type.protocol_command_id]
+        except KeyError:
+            return 0
+        else:
+            return base_cost + item_cost * num_items
+
+    def can_afford(self, cost: int) -> bool:
+        return not self.is_limited or self.estimated_buffer >= cost
+
+    def seconds_until_affordable(self, cost: int) -> float:
+        """
+        How long until the buffer has recharged enough to pay for a request of this cost.
+        """
+        missing = cost - self.estimated_buffer
+        if not self.is_limited or missing <= 0:
+            return 0
+        elif self._min_recharge_rate == 0:
+            return float("inf")
+        else:
+            return missing / self._min_recharge_rate / 1000
+
+    def get_spare_ratio(self, cost: int) -> float:
+        """
+        The fraction of the buffer left over after paying for a request of this cost.
+        """
+        if not self.is_limited:
+            return 1.0
+        return (self.estimated_buffer - cost) / self.buffer_limit
+
+    def spend(self, cost: int) -> None:
+        if self.is_limited:
+            self._buffer_value = self.estimated_buffer - cost
+            self._updated_at = time.monotonic()
+
+    def update(self, buffer_value: int) -> None:
+        """
+        Resynchronize with the buffer value reported by the server in a reply.
+        """
+        if self.is_limited:
+            self._buffer_value = min(self.buffer_limit, buffer_value)
+            self._updated_at = time.monotonic()
+
+
+class BufferValueTracker(CommandHandler[Any]):
+    """
+    Update the :class:`FlowControlBuffer` with the buffer value included in every reply
+    of the given type.
+
+    The buffer is looked up lazily, because it's only available after the handshake.
+    """
+
+    def __init__(self,
+                 command_type: Type[CommandAPI[Any]],
+                 get_buffer: Callable[[], FlowControlBuffer]) -> None:
+        self.command_type = command_type
+        self._get_buffer = get_buffer
+
+    async def handle(self, connection: ConnectionAPI, cmd: CommandAPI[Any]) -> None:
+        self._get_buffer().update(cmd.payload.buffer_value)
@@ -18,6 +18,7 @@ from eth.constants import GENESIS_BLOCK_NUMBER
 from lahja import (
     BroadcastConfig,
 )
+from pyformance.meters import SimpleGauge
 
 from p2p.abc import BehaviorAPI, CommandAPI, HandshakerAPI, SessionAPI
 from p2p.peer_pool import BasePeerPool
@@ -28,6 +29,7 @@ from trinity.protocol.common.peer import (
     BaseProxyPeer,
     BaseChainPeerFactory,
     BaseChainPeerPool,
+    BaseChainPeerReporterRegistry,
 )
 from trinity.protocol.common.peer_pool_event_bus import (
     PeerPoolEventServer,
@@ -226,8 +228,27 @@ class LESPeerPoolEventServer(PeerPoolEventServer[LESPeer]):
             raise Exception(f"Command {cmd} is not broadcasted")
 
 
+class LESPeerReporterRegistry(BaseChainPeerReporterRegistry):
+    """
+    Report each LES peer's estimated flow control buffer, on top of the chain metrics.
+    """
+    def reset_peer_meters(self, peer_id: int) -> None:
+        super().reset_peer_meters(peer_id)
+        self._get_flow_control_buffer_gauge(peer_id).set_value(0)
+
+    def make_periodic_update(self, peer: LESPeer, peer_id: int) -> None:  # type: ignore
+        super().make_periodic_update(peer, peer_id)
+        self._get_flow_control_buffer_gauge(peer_id).set_value(
+            peer.les_api.flow_control.estimated_buffer
+        )
+
+    def _get_flow_control_buffer_gauge(self, peer_id: int) -> SimpleGauge:
+        return self.metrics_registry.gauge(f"trinity.p2p/peer_{peer_id}_les_buffer.gauge")
+
+
 class LESPeerPool(BaseChainPeerPool):
     peer_factory_class = LESPeerFactory
+    peer_reporter_registry_class = LESPeerReporterRegistry
 
 
 class LESProxyPeerPool(BaseProxyPeerPool[LESProxyPeer]):
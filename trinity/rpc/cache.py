@@ -0,0 +1,181 @@
+"""
+Caching of JSON-RPC results that can't change, or only change with the canonical head.
+"""
+import inspect
+import json
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Hashable,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from eth_typing import Hash32
+from lru import LRU
+
+from trinity.chains.base import AsyncChainAPI
+from trinity.rpc.format import to_int_if_hex
+
+
+Func = Callable[..., Any]
+Meth = TypeVar('Meth', bound=Func)
+
+
+CACHEABLE_ATTRIBUTE_NAME = '_rpc_cache_policy'
+
+# Results that depend on a block with at least this many blocks on top of it are cached
+# for good, assuming no re-org will ever go that deep.
+RPC_CACHE_CONFIRMATIONS = 64
+
+# Maximum number of results cached for good
+RPC_CACHE_FINALIZED_SIZE = 4096
+
+# Maximum number of results cached until the canonical head changes
+RPC_CACHE_UNFINALIZED_SIZE = 1024
+
+
+class _CachePolicy:
+    def __init__(self,
+                 which_block_arg_name: Optional[str],
+                 result_block_number_key: Optional[str],
+                 immutable: bool) -> None:
+        self.which_block_arg_name = which_block_arg_name
+        self.result_block_number_key = result_block_number_key
+        self.immutable = immutable
+
+
+def cacheable(which_block_arg_name: str = None,
+              result_block_number_key: str = None,
+              immutable: bool = False) -> Func:
+    """
+    A decorator which marks RPCs whose results only depend on their parameters and on the
+    canonical chain. By default, results are cached until the canonical head changes. They are
+    cached for good once final, which depends on how they were marked:
+
+    :param which_block_arg_name: names the argument used to pass in the block identifier
+        ("at_block", usually). The result is final once that block has enough confirmations.
+    :param result_block_number_key: names the key of the result that holds the (hex encoded)
+        number of the block it comes from. The result is final once that block has enough
+        confirmations.
+    :param immutable: the result can never change, e.g. because it is looked up by block hash.
+    """
+    def make_meth_cacheable(meth: Meth) -> Meth:
+        if which_block_arg_name is not None:
+            sig = inspect.signature(meth)
+            if which_block_arg_name not in sig.parameters:
+                raise Exception(
+                    f'"{which_block_arg_name}" does not name an argument to this function'
+                )
+
+        policy = _CachePolicy(which_block_arg_name, result_block_number_key, immutable)
+        setattr(meth, CACHEABLE_ATTRIBUTE_NAME, policy)
+        return meth
+    return make_meth_cacheable
+
+
+def _normalize_param(param: Any) -> Any:
+    if isinstance(param, str) and param.startswith('0x'):
+        return param.lower()
+    elif isinstance(param, (list, tuple)):
+        return [_normalize_param(item) for item in param]
+    elif isinstance(param, dict):
+        return {key: _normalize_param(value) for key, value in param.items()}
+    else:
+        return param
+
+
+class RPCResponseCache:
+    """
+    Cache the results of the RPC methods marked with :func:`cacheable`, keyed by method name
+    and parameters.
+    """
+
+    def __init__(self,
+                 chain: AsyncChainAPI,
+                 confirmations: int = RPC_CACHE_CONFIRMATIONS,
+                 finalized_size: int = RPC_CACHE_FINALIZED_SIZE,
+                 unfinalized_size: int = RPC_CACHE_UNFINALIZED_SIZE) -> None:
+        self._chain = chain
+        self._confirmations = confirmations
+        self._finalized_size = finalized_size
+        self._unfinalized_size = unfinalized_size
+        self._finalized_results = LRU(finalized_size)
+        self._unfinalized_results = LRU(unfinalized_size)
+        self._unfinalized_head: Hash32 = None
+
+    def reset(self, chain: AsyncChainAPI) -> None:
+        """
+        Drop all cached results, and follow the head of a new chain.
+        """
+        self._chain = chain
+        self._finalized_results = LRU(self._finalized_size)
+        self._unfinalized_results = LRU(self._unfinalized_size)
+        self._unfinalized_head = None
+
+    async def get_or_execute(self,
+                             method_name: str,
+                             method: Func,
+                             params: Sequence[Any],
+                             execute: Callable[[], Awaitable[Any]]) -> Any:
+        policy: _CachePolicy = getattr(method, CACHEABLE_ATTRIBUTE_NAME, None)
+        if policy is None:
+            return await execute()
+
+        try:
+            key: Hashable = (method_name, json.dumps(_normalize_param(params), sort_keys=True))
+        except TypeError:
+            # Parameters that can't be serialized won't be valid either
+            return await execute()
+
+        head = self._chain.get_canonical_head()
+        if self._unfinalized_head != head.hash:
+            # Any result that wasn't final may have changed with the head
+            self._unfinalized_results.clear()
+            self._unfinalized_head = head.hash
+
+        if key in self._finalized_results:
+            return self._finalized_results[key]
+        elif key in self._unfinalized_results:
+            return self._unfinalized_results[key]
+
+        result = await execute()
+
+        if self._is_final(policy, method, params, result, head.block_number):
+            self._finalized_results[key] = result
+        elif self._chain.get_canonical_head().hash == head.hash:
+            # If the head changed during execution, the result may be for either head
+            self._unfinalized_results[key] = result
+
+        return result
+
+    def _is_final(self,
+                  policy: _CachePolicy,
+                  method: Func,
+                  params: Sequence[Any],
+                  result: Any,
+                  head_number: int) -> bool:
+        if policy.immutable:
+            return True
+
+        if policy.which_block_arg_name is not None:
+            arguments = inspect.signature(method).bind(*params).arguments
+            at_block = to_int_if_hex(arguments[policy.which_block_arg_name])
+            if at_block == 'earliest':
+                block_number = 0
+            elif isinstance(at_block, int):
+                block_number = at_block
+            else:
+                # 'latest' and 'pending' follow the head
+                return False
+        elif policy.result_block_number_key is not None and isinstance(result, dict):
+            try:
+                block_number = int(result[policy.result_block_number_key], 16)
+            except (KeyError, TypeError, ValueError):
+                return False
+        else:
+            return False
+
+        return block_number <= head_number - self._confirmations
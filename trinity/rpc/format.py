@@ -27,6 +27,7 @@ import rlp
 from eth.abc import (
     BlockAPI,
     BlockHeaderAPI,
+    LogAPI,
     ReceiptAPI,
     SignedTransactionAPI,
 )
@@ -39,6 +40,7 @@ from trinity.rpc.typing import (
     RpcBlockResponse,
     RpcBlockTransactionResponse,
     RpcHeaderResponse,
+    RpcLogResponse,
     RpcReceiptResponse,
     RpcTransactionResponse,
 )
@@ -51,6 +53,28 @@ def format_bloom(bloom: int) -> str:
     return formatted_bloom
 
 
+def to_log_response(log: LogAPI,
+                    header: BlockHeaderAPI,
+                    log_index: str,
+                    transaction_index: str,
+                    transaction_hash: str) -> RpcLogResponse:
+    return {
+        "address": encode_hex(log.address),
+        "data": encode_hex(log.data),
+        "blockHash": encode_hex(header.hash),
+        "blockNumber": hex(header.block_number),
+        "logIndex": log_index,
+        # We only serve logs from transactions that ended up in the canonical chain
+        # which means this can never be `True`
+        "removed": False,
+        "topics": [
+            encode_hex(int_to_big_endian(topic)) for topic in log.topics
+        ],
+        "transactionHash": transaction_hash,
+        "transactionIndex": transaction_index,
+    }
+
+
 def to_receipt_response(receipt: ReceiptAPI,
                         transaction: SignedTransactionAPI,
                         index: int,
@@ -76,21 +100,13 @@ def to_receipt_response(receipt: ReceiptAPI,
         "from": encode_hex(transaction.sender),
         'gasUsed': hex(tx_gas_used),
         "logs": [
-            {
-                "address": encode_hex(log.address),
-                "data": encode_hex(log.data),
-                "blockHash": block_hash,
-                "blockNumber": block_number,
-                "logIndex": receipt_and_transaction_index,
-                # We only serve receipts from transactions that ended up in the canonical chain
-                # which means this can never be `True`
-                "removed": False,
-                "topics": [
-                    encode_hex(int_to_big_endian(topic)) for topic in log.topics
-                ],
-                "transactionHash": transaction_hash,
-                "transactionIndex": receipt_and_transaction_index,
-            }
+            to_log_response(
+                log,
+                header,
+                receipt_and_transaction_index,
+                receipt_and_transaction_index,
+                transaction_hash,
+            )
             for log in receipt.logs
         ],
         "logsBloom": format_bloom(receipt.bloom),
@@ -1,4 +1,5 @@
 import json
+import time
 from typing import (
     Any,
     Dict,
@@ -9,6 +10,7 @@ from typing import (
 )
 
 from lahja import EndpointAPI
+from pyformance import MetricsRegistry
 
 from eth_utils import (
     get_logger,
@@ -18,7 +20,9 @@ from eth_utils import (
 from eth_utils.toolz import curry
 
 from trinity.chains.base import AsyncChainAPI
+from trinity.components.builtin.metrics.service.noop import NOOP_METRICS_REGISTRY
 from trinity.exceptions import RpcError
+from trinity.rpc.cache import RPCResponseCache
 from trinity.rpc.modules import (
     BaseRPCModule,
 )
@@ -70,10 +74,13 @@ class RPCServer:
     def __init__(self,
                  modules: Sequence[BaseRPCModule],
                  chain: AsyncChainAPI,
-                 event_bus: EndpointAPI = None) -> None:
+                 event_bus: EndpointAPI = None,
+                 metrics_registry: MetricsRegistry = NOOP_METRICS_REGISTRY) -> None:
         self.event_bus = event_bus
+        self._metrics_registry = metrics_registry
         self.modules: Dict[str, BaseRPCModule] = {}
         self.chain = chain
+        self._response_cache = RPCResponseCache(chain)
         self.logger: ExtendedDebugLogger = get_logger('trinity.rpc.main.RPCServer')
 
         for module in modules:
@@ -128,11 +135,24 @@ class RPCServer:
 
             params = request.get('params', [])
 
-            result = await execute_with_retries(
-                self.event_bus, method, params, self.chain,
+            # Only time methods that exist, so clients can't create arbitrary metrics
+            latency = self._metrics_registry.histogram(
+                f"trinity.rpc/{request['method']}/latency.histogram"
             )
+            start_at = time.perf_counter()
+            try:
+                result = await self._response_cache.get_or_execute(
+                    request['method'],
+                    method,
+                    params,
+                    lambda: execute_with_retries(self.event_bus, method, params, self.chain),
+                )
+            finally:
+                latency.add((time.perf_counter() - start_at) * 1000)
 
             if request['method'] == 'evm_resetToGenesisFixture':
+                # Results cached from the previous chain are no longer valid
+                self._response_cache.reset(result)
                 result = True
 
         except TypeError as exc:
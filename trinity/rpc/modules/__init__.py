@@ -10,6 +10,8 @@ from eth_utils import (
 
 from trinity.chains.base import AsyncChainAPI
 from trinity.config import TrinityConfig
+from trinity.db.eth1.bloom_bits import BloomBitsDB
+from trinity.rpc.workers import RPCWorkerPool
 
 from .main import (  # noqa: F401
     BaseRPCModule,
@@ -28,8 +30,10 @@ from .web3 import Web3  # noqa: F401
 @to_tuple
 def initialize_eth1_modules(chain: AsyncChainAPI,
                             event_bus: EndpointAPI,
-                            trinity_config: TrinityConfig) -> Iterable[BaseRPCModule]:
-    yield Eth(chain, event_bus, trinity_config)
+                            trinity_config: TrinityConfig,
+                            bloom_bits_db: BloomBitsDB = None,
+                            worker_pool: RPCWorkerPool = None) -> Iterable[BaseRPCModule]:
+    yield Eth(chain, event_bus, trinity_config, bloom_bits_db, worker_pool)
     yield EVM(chain, event_bus)
     yield Net(event_bus)
     yield Web3()
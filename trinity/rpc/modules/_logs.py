@@ -0,0 +1,185 @@
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from eth_typing import (
+    Address,
+    BlockNumber,
+    Hash32,
+)
+from eth_utils import (
+    decode_hex,
+    int_to_big_endian,
+    to_tuple,
+    ValidationError,
+)
+
+from eth.abc import (
+    ChainAPI,
+    LogAPI,
+)
+from eth._utils.padding import pad32
+
+from trinity.db.eth1.bloom_bits import (
+    BLOOM_BITS_SECTION_SIZE,
+    BloomBitsDB,
+    bloom_matches,
+    get_section_block_range,
+    iter_set_bits,
+)
+from trinity.rpc.format import to_int_if_hex
+
+
+# Maximum number of blocks that a single eth_getLogs query may scan one header at a time,
+# because they are not covered by the bloom bits index (yet). Indexed blocks are not limited.
+MAX_UNINDEXED_LOGS_BLOCKS = 10000
+
+
+class LogFilter(NamedTuple):
+    from_block: Union[str, int]
+    to_block: Union[str, int]
+    block_hash: Optional[Hash32]
+    # An empty tuple matches any address
+    addresses: Tuple[Address, ...]
+    # One tuple of alternatives for each topic position, where an empty tuple matches any topic
+    topics: Tuple[Tuple[Hash32, ...], ...]
+
+    @property
+    def criteria(self) -> Tuple[Tuple[bytes, ...], ...]:
+        """
+        The values to look for in logs blooms, as expected by
+        :func:`~trinity.db.eth1.bloom_bits.bloom_matches`.
+        """
+        return (self.addresses,) + self.topics
+
+
+def _to_alternatives(value: Union[None, str, Sequence[str]]) -> Tuple[bytes, ...]:
+    if value is None:
+        return ()
+    elif isinstance(value, str):
+        return (decode_hex(value),)
+    else:
+        return tuple(decode_hex(item) for item in value if item is not None)
+
+
+def normalize_log_filter(filter_params: Dict[str, Any]) -> LogFilter:
+    block_hash = filter_params.get('blockHash')
+    if block_hash is not None and ('fromBlock' in filter_params or 'toBlock' in filter_params):
+        raise ValidationError("Cannot filter by blockHash together with fromBlock or toBlock")
+
+    addresses = _to_alternatives(filter_params.get('address'))
+    if any(len(address) != 20 for address in addresses):
+        raise ValidationError(f"Invalid log filter address: {filter_params['address']!r}")
+
+    topics = tuple(_to_alternatives(topic) for topic in filter_params.get('topics') or ())
+    if any(len(topic) != 32 for alternatives in topics for topic in alternatives):
+        raise ValidationError(f"Invalid log filter topics: {filter_params['topics']!r}")
+
+    return LogFilter(
+        from_block=to_int_if_hex(filter_params.get('fromBlock', 'latest')),
+        to_block=to_int_if_hex(filter_params.get('toBlock', 'latest')),
+        block_hash=None if block_hash is None else Hash32(decode_hex(block_hash)),
+        addresses=addresses,  # type: ignore
+        topics=topics,  # type: ignore
+    )
+
+
+def log_matches(log: LogAPI, log_filter: LogFilter) -> bool:
+    if log_filter.addresses and log.address not in log_filter.addresses:
+        return False
+    elif len(log_filter.topics) > len(log.topics):
+        return False
+
+    for alternatives, topic in zip(log_filter.topics, log.topics):
+        if alternatives and pad32(int_to_big_endian(topic)) not in alternatives:
+            return False
+    return True
+
+
+def find_candidate_blocks(
+        chain: ChainAPI,
+        bloom_bits_db: Optional[BloomBitsDB],
+        from_block: BlockNumber,
+        to_block: BlockNumber,
+        criteria: Sequence[Sequence[bytes]],
+        max_unindexed_blocks: int = None) -> Tuple[BlockNumber, ...]:
+    """
+    Find the canonical blocks in the range (inclusive) whose logs bloom matches the criteria.
+
+    The bloom bits index is used for the sections it covers, and the bloom of every header
+    is checked for the rest.
+
+    :raise ValidationError: if more than ``max_unindexed_blocks`` blocks of the range are not
+        covered by the index
+    """
+    sections = tuple(_get_section_ranges(chain, bloom_bits_db, from_block, to_block))
+    if max_unindexed_blocks is not None:
+        unindexed_blocks = sum(
+            last_block - first_block + 1
+            for _, first_block, last_block, is_indexed in sections
+            if not is_indexed
+        )
+        if unindexed_blocks > max_unindexed_blocks:
+            raise ValidationError(
+                f"Cannot scan {unindexed_blocks} blocks that are not indexed for logs, the limit "
+                f"is {max_unindexed_blocks}: use a smaller range of recent blocks"
+            )
+
+    return _find_candidate_blocks(chain, bloom_bits_db, sections, criteria)
+
+
+def _get_section_ranges(
+        chain: ChainAPI,
+        bloom_bits_db: Optional[BloomBitsDB],
+        from_block: BlockNumber,
+        to_block: BlockNumber) -> Iterable[Tuple[int, int, int, bool]]:
+    """
+    Return the section, first and last block in the range, and whether it is indexed, of all
+    sections that overlap with the range.
+    """
+    for section in range(from_block // BLOOM_BITS_SECTION_SIZE,
+                         to_block // BLOOM_BITS_SECTION_SIZE + 1):
+        first_block, last_block = get_section_block_range(section)
+        is_indexed = (
+            bloom_bits_db is not None and _is_section_indexed(chain, bloom_bits_db, section)
+        )
+        yield section, max(first_block, from_block), min(last_block, to_block), is_indexed
+
+
+@to_tuple
+def _find_candidate_blocks(
+        chain: ChainAPI,
+        bloom_bits_db: Optional[BloomBitsDB],
+        sections: Iterable[Tuple[int, int, int, bool]],
+        criteria: Sequence[Sequence[bytes]]) -> Iterable[BlockNumber]:
+    for section, first_block, last_block, is_indexed in sections:
+        if is_indexed and bloom_bits_db is not None:
+            section_start = section * BLOOM_BITS_SECTION_SIZE
+            # Only keep the blocks of the section that are in the range
+            in_range = (
+                (1 << (last_block + 1 - section_start)) - (1 << (first_block - section_start))
+            )
+            matches = bloom_bits_db.get_matching_blocks(section, criteria) & in_range
+            for offset in iter_set_bits(matches):
+                yield BlockNumber(section_start + offset)
+        else:
+            for block_number in range(first_block, last_block + 1):
+                header = chain.get_canonical_block_header_by_number(BlockNumber(block_number))
+                if bloom_matches(header.bloom, criteria):
+                    yield BlockNumber(block_number)
+
+
+def _is_section_indexed(chain: ChainAPI, bloom_bits_db: BloomBitsDB, section: int) -> bool:
+    if section >= bloom_bits_db.get_indexed_section_count():
+        return False
+
+    _, last_block = get_section_block_range(section)
+    canonical_hash = chain.get_canonical_block_hash(BlockNumber(last_block))
+    return bloom_bits_db.is_section_indexed(section, canonical_hash)
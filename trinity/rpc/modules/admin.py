@@ -15,6 +15,7 @@ from p2p.validation import validate_enode_uri
 from trinity.chains.base import AsyncChainAPI
 from trinity.config import TrinityConfig, Eth1AppConfig, Eth1ChainConfig
 from trinity.constants import TO_NETWORKING_BROADCAST_CONFIG
+from trinity.events import SamplingProfilerCommand
 from trinity.protocol.common.events import (
     ConnectToNodeCommand,
     DisconnectFromPeerCommand,
@@ -74,6 +75,16 @@ class Admin(Eth1ChainRPCModule):
                 return True
         return False
 
+    async def startProfiling(self, endpoint_names: Sequence[str] = ()) -> None:
+        """
+        Start the sampling profiler of the given components (or all of them), which
+        periodically write collapsed stacks to the profile directory.
+        """
+        await self.event_bus.broadcast(SamplingProfilerCommand(True, tuple(endpoint_names)))
+
+    async def stopProfiling(self, endpoint_names: Sequence[str] = ()) -> None:
+        await self.event_bus.broadcast(SamplingProfilerCommand(False, tuple(endpoint_names)))
+
     async def nodeInfo(self) -> RpcNodeInfoResponse:
         response = await self.event_bus.request(
             GetProtocolCapabilitiesRequest(),
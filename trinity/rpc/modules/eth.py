@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 import rlp
@@ -7,10 +8,14 @@ from eth_utils.toolz import (
 )
 from typing import (
     Any,
+    Callable,
     cast,
     Dict,
+    Hashable,
     List,
     NoReturn,
+    Sequence,
+    TypeVar,
     Union,
 )
 
@@ -62,6 +67,10 @@ from trinity.config import TrinityConfig
 from trinity.constants import (
     TO_NETWORKING_BROADCAST_CONFIG,
 )
+from trinity.db.eth1.bloom_bits import (
+    BloomBitsDB,
+    bloom_matches,
+)
 from trinity.exceptions import RpcError
 from trinity.rpc.format import (
     block_to_dict,
@@ -69,19 +78,31 @@ from trinity.rpc.format import (
     format_params,
     normalize_transaction_dict,
     to_int_if_hex,
+    to_log_response,
     to_receipt_response,
     transaction_to_dict,
 )
+from trinity.rpc.cache import cacheable
 from trinity.rpc.modules import (
     Eth1ChainRPCModule,
 )
+from trinity.rpc.modules._logs import (
+    MAX_UNINDEXED_LOGS_BLOCKS,
+    find_candidate_blocks,
+    log_matches,
+    normalize_log_filter,
+    LogFilter,
+)
 from trinity.rpc.modules._util import (
     get_header,
 )
 from trinity.rpc.retry import retryable
+from trinity.rpc.state_cache import RecentStateCache
+from trinity.rpc.workers import RPCWorkerPool
 from trinity.rpc.typing import (
     RpcBlockResponse,
     RpcHeaderResponse,
+    RpcLogResponse,
     RpcReceiptResponse,
     RpcTransactionResponse,
 )
@@ -96,13 +117,7 @@ from trinity._utils.validation import (
 )
 
 
-async def state_at_block(
-        chain: AsyncChainAPI,
-        at_block: Union[str, int],
-        read_only: bool = True) -> StateAPI:
-    at_header = await get_header(chain, at_block)
-    vm = chain.get_vm(at_header)
-    return vm.state
+TValue = TypeVar('TValue')
 
 
 async def get_block_at_number(chain: AsyncChainAPI, at_block: Union[str, int]) -> BlockAPI:
@@ -162,10 +177,28 @@ class Eth(Eth1ChainRPCModule):
     def __init__(self,
                  chain: AsyncChainAPI,
                  event_bus: EndpointAPI,
-                 trinity_config: TrinityConfig) -> None:
+                 trinity_config: TrinityConfig,
+                 bloom_bits_db: BloomBitsDB = None,
+                 worker_pool: RPCWorkerPool = None) -> None:
         self.trinity_config = trinity_config
+        self._bloom_bits_db = bloom_bits_db
+        if worker_pool is None:
+            worker_pool = RPCWorkerPool()
+        self._worker_pool = worker_pool
+        self._state_cache = RecentStateCache()
         super().__init__(chain, event_bus)
 
+    def on_chain_replacement(self, chain: AsyncChainAPI) -> None:
+        # The new chain may have different states under the same block numbers
+        self._state_cache = RecentStateCache()
+        super().on_chain_replacement(chain)
+
+    def _read_state(self,
+                    header: BlockHeaderAPI,
+                    key: Hashable,
+                    read: Callable[[StateAPI], TValue]) -> TValue:
+        return self._state_cache.get(header, key, lambda: read(self.chain.get_vm(header).state))
+
     async def accounts(self) -> List[str]:
         # trinity does not manage accounts for the user
         return []
@@ -179,34 +212,51 @@ class Eth(Eth1ChainRPCModule):
         return to_hex(chain_id)
 
     @format_params(identity, to_int_if_hex)
+    @cacheable(which_block_arg_name='at_block')
     @retryable(which_block_arg_name='at_block')
     async def call(self, txn_dict: Dict[str, Any], at_block: Union[str, int]) -> str:
         header = await get_header(self.chain, at_block)
         validate_transaction_call_dict(txn_dict, self.chain.get_vm(header))
         transaction = dict_to_spoof_transaction(self.chain, header, txn_dict)
-        result = self.chain.get_transaction_result(transaction, header)
+        result = await self._worker_pool.run(
+            'eth_call',
+            self.chain.get_transaction_result,
+            transaction,
+            header,
+        )
         return encode_hex(result)
 
     async def coinbase(self) -> str:
         raise NotImplementedError("Trinity does not support mining")
 
     @format_params(identity, to_int_if_hex)
+    @cacheable(which_block_arg_name='at_block')
     @retryable(which_block_arg_name='at_block')
     async def estimateGas(self, txn_dict: Dict[str, Any], at_block: Union[str, int]) -> str:
         header = await get_header(self.chain, at_block)
         validate_transaction_gas_estimation_dict(txn_dict, self.chain.get_vm(header))
         transaction = dict_to_spoof_transaction(self.chain, header, txn_dict)
-        gas = self.chain.estimate_gas(transaction, header)
+        gas = await self._worker_pool.run(
+            'eth_estimateGas',
+            self.chain.estimate_gas,
+            transaction,
+            header,
+        )
         return hex(gas)
 
     async def gasPrice(self) -> str:
         return hex(int(os.environ.get('TRINITY_GAS_PRICE', to_wei(1, 'gwei'))))
 
     @format_params(decode_hex, to_int_if_hex)
+    @cacheable(which_block_arg_name='at_block')
     @retryable(which_block_arg_name='at_block')
     async def getBalance(self, address: Address, at_block: Union[str, int]) -> str:
-        state = await state_at_block(self.chain, at_block)
-        balance = state.get_balance(address)
+        header = await get_header(self.chain, at_block)
+        balance = self._read_state(
+            header,
+            ('balance', address),
+            lambda state: state.get_balance(address),
+        )
 
         return hex(balance)
 
@@ -222,6 +272,7 @@ class Eth(Eth1ChainRPCModule):
         raise NotImplementedError("Trinity does not support mining")
 
     @format_params(decode_hex, identity)
+    @cacheable(immutable=True)
     async def getBlockByHash(self,
                              block_hash: Hash32,
                              include_transactions: bool) -> RpcBlockResponse:
@@ -229,6 +280,7 @@ class Eth(Eth1ChainRPCModule):
         return block_to_dict(block, self.chain, include_transactions)
 
     @format_params(to_int_if_hex, identity)
+    @cacheable(which_block_arg_name='at_block')
     async def getBlockByNumber(self,
                                at_block: Union[str, int],
                                include_transactions: bool) -> RpcBlockResponse:
@@ -236,40 +288,107 @@ class Eth(Eth1ChainRPCModule):
         return block_to_dict(block, self.chain, include_transactions)
 
     @format_params(decode_hex)
+    @cacheable(immutable=True)
     async def getBlockTransactionCountByHash(self, block_hash: Hash32) -> str:
         block = await self.chain.coro_get_block_by_hash(block_hash)
         return hex(len(block.transactions))
 
     @format_params(to_int_if_hex)
+    @cacheable(which_block_arg_name='at_block')
     async def getBlockTransactionCountByNumber(self, at_block: Union[str, int]) -> str:
         block = await get_block_at_number(self.chain, at_block)
         return hex(len(block.transactions))
 
     @format_params(decode_hex, to_int_if_hex)
+    @cacheable(which_block_arg_name='at_block')
     @retryable(which_block_arg_name='at_block')
     async def getCode(self, address: Address, at_block: Union[str, int]) -> str:
-        state = await state_at_block(self.chain, at_block)
-        code = state.get_code(address)
+        header = await get_header(self.chain, at_block)
+        code = self._read_state(header, ('code', address), lambda state: state.get_code(address))
         return encode_hex(code)
 
     @format_params(decode_hex, to_int_if_hex, to_int_if_hex)
+    @cacheable(which_block_arg_name='at_block')
     @retryable(which_block_arg_name='at_block')
     async def getStorageAt(self, address: Address, position: int, at_block: Union[str, int]) -> str:
         if not is_integer(position) or position < 0:
             raise TypeError("Position of storage must be a whole number, but was: %r" % position)
 
-        state = await state_at_block(self.chain, at_block)
-        stored_val = state.get_storage(address, position)
+        header = await get_header(self.chain, at_block)
+        stored_val = self._read_state(
+            header,
+            ('storage', address, position),
+            lambda state: state.get_storage(address, position),
+        )
 
         return encode_hex(pad32(int_to_big_endian(stored_val)))
 
+    @format_params(normalize_log_filter)
+    async def getLogs(self, log_filter: LogFilter) -> List[RpcLogResponse]:
+        criteria = log_filter.criteria
+        if log_filter.block_hash is not None:
+            header = await self.chain.coro_get_block_header_by_hash(log_filter.block_hash)
+            canonical_hash = self.chain.get_canonical_block_hash(header.block_number)
+            if canonical_hash != header.hash:
+                raise RpcError(
+                    f"Block {encode_hex(header.hash)} is not in the canonical chain"
+                )
+            if bloom_matches(header.bloom, criteria):
+                block_numbers: Sequence[BlockNumber] = (header.block_number,)
+            else:
+                block_numbers = ()
+        else:
+            from_header = await get_header(self.chain, log_filter.from_block)
+            to_header = await get_header(self.chain, log_filter.to_block)
+            # Checking the blooms of a large range takes many database reads, so keep them
+            # off the event loop.
+            block_numbers = await asyncio.get_event_loop().run_in_executor(
+                None,
+                find_candidate_blocks,
+                self.chain,
+                self._bloom_bits_db,
+                from_header.block_number,
+                to_header.block_number,
+                criteria,
+                MAX_UNINDEXED_LOGS_BLOCKS,
+            )
+
+        logs = []
+        for block_number in block_numbers:
+            block = await self.chain.coro_get_canonical_block_by_number(block_number)
+            log_index = 0
+            for transaction_index, transaction in enumerate(block.transactions):
+                receipt = await self.chain.coro_get_transaction_receipt_by_index(
+                    block_number,
+                    transaction_index,
+                )
+                # The block bloom only tells that one of its receipts may have matching logs
+                if not bloom_matches(receipt.bloom, criteria):
+                    log_index += len(receipt.logs)
+                    continue
+
+                for log in receipt.logs:
+                    if log_matches(log, log_filter):
+                        logs.append(to_log_response(
+                            log,
+                            block.header,
+                            hex(log_index),
+                            hex(transaction_index),
+                            encode_hex(transaction.hash),
+                        ))
+                    log_index += 1
+
+        return logs
+
     @format_params(decode_hex)
+    @cacheable()
     async def getTransactionByHash(self,
                                    transaction_hash: Hash32) -> RpcTransactionResponse:
         transaction = await self.chain.coro_get_canonical_transaction(transaction_hash)
         return transaction_to_dict(transaction)
 
     @format_params(decode_hex, to_int_if_hex)
+    @cacheable(immutable=True)
     async def getTransactionByBlockHashAndIndex(self,
                                                 block_hash: Hash32,
                                                 index: int) -> RpcTransactionResponse:
@@ -278,6 +397,7 @@ class Eth(Eth1ChainRPCModule):
         return transaction_to_dict(transaction)
 
     @format_params(to_int_if_hex, to_int_if_hex)
+    @cacheable(which_block_arg_name='at_block')
     async def getTransactionByBlockNumberAndIndex(self,
                                                   at_block: Union[str, int],
                                                   index: int) -> RpcTransactionResponse:
@@ -286,14 +406,16 @@ class Eth(Eth1ChainRPCModule):
         return transaction_to_dict(transaction)
 
     @format_params(decode_hex, to_int_if_hex)
+    @cacheable(which_block_arg_name='at_block')
     @retryable(which_block_arg_name='at_block')
     async def getTransactionCount(self, address: Address, at_block: Union[str, int]) -> str:
 
-        state = await state_at_block(self.chain, at_block)
-        nonce = state.get_nonce(address)
+        header = await get_header(self.chain, at_block)
+        nonce = self._read_state(header, ('nonce', address), lambda state: state.get_nonce(address))
         return hex(nonce)
 
     @format_params(decode_hex)
+    @cacheable(result_block_number_key='blockNumber')
     async def getTransactionReceipt(self,
                                     transaction_hash: Hash32) -> RpcReceiptResponse:
 
@@ -350,16 +472,19 @@ class Eth(Eth1ChainRPCModule):
         return to_receipt_response(receipt, transaction, tx_index, block_header, tx_gas_used)
 
     @format_params(decode_hex)
+    @cacheable(immutable=True)
     async def getUncleCountByBlockHash(self, block_hash: Hash32) -> str:
         block = await self.chain.coro_get_block_by_hash(block_hash)
         return hex(len(block.uncles))
 
     @format_params(to_int_if_hex)
+    @cacheable(which_block_arg_name='at_block')
     async def getUncleCountByBlockNumber(self, at_block: Union[str, int]) -> str:
         block = await get_block_at_number(self.chain, at_block)
         return hex(len(block.uncles))
 
     @format_params(decode_hex, to_int_if_hex)
+    @cacheable(immutable=True)
     async def getUncleByBlockHashAndIndex(self,
                                           block_hash: Hash32,
                                           index: int) -> RpcHeaderResponse:
@@ -368,6 +493,7 @@ class Eth(Eth1ChainRPCModule):
         return header_to_dict(uncle)
 
     @format_params(to_int_if_hex, to_int_if_hex)
+    @cacheable(which_block_arg_name='at_block')
     async def getUncleByBlockNumberAndIndex(self,
                                             at_block: Union[str, int],
                                             index: int) -> RpcHeaderResponse:
@@ -0,0 +1,88 @@
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    TypeVar,
+)
+
+from eth_typing import Hash32
+from lru import LRU
+
+from eth.abc import BlockHeaderAPI
+
+
+# Only cache the state of blocks that are at most this many blocks behind the highest
+# block that was read from.
+RECENT_STATE_WINDOW = 32
+
+# Maximum number of values cached for each state root
+RECENT_STATE_CACHE_SIZE = 4096
+
+TValue = TypeVar('TValue')
+
+
+class RecentStateCache:
+    """
+    Cache values read from the state of recent blocks, like account balances and storage
+    slots, keyed by state root. Reading one otherwise takes a walk down the account trie
+    (and the storage trie) in the database, which RPC clients polling the same accounts at
+    every new block repeat many times over.
+
+    The state of a block is dropped from the cache once it falls
+    :data:`RECENT_STATE_WINDOW` blocks behind the highest block read from, and reads of
+    older blocks are not cached at all.
+    """
+
+    def __init__(self,
+                 window: int = RECENT_STATE_WINDOW,
+                 max_entries_per_state: int = RECENT_STATE_CACHE_SIZE) -> None:
+        self._window = window
+        self._max_entries_per_state = max_entries_per_state
+        self._states: Dict[Hash32, LRU] = {}
+        self._state_block_numbers: Dict[Hash32, int] = {}
+        self._highest_block_number = -1
+
+    def get(self, header: BlockHeaderAPI, key: Hashable, load: Callable[[], TValue]) -> TValue:
+        """
+        Return the cached value for ``key`` in the state of the given header, or cache the
+        one returned by ``load()``. Exceptions raised by ``load()`` aren't cached.
+        """
+        if header.block_number > self._highest_block_number:
+            self._highest_block_number = header.block_number
+            self._evict_old_states()
+
+        if header.block_number <= self._highest_block_number - self._window:
+            return load()
+
+        state_root = header.state_root
+        try:
+            entries = self._states[state_root]
+        except KeyError:
+            entries = LRU(self._max_entries_per_state)
+            self._states[state_root] = entries
+        # Blocks without transactions share the state root of their parent
+        self._state_block_numbers[state_root] = max(
+            header.block_number,
+            self._state_block_numbers.get(state_root, header.block_number),
+        )
+
+        try:
+            return entries[key]
+        except KeyError:
+            value = load()
+            entries[key] = value
+            return value
+
+    def _evict_old_states(self) -> None:
+        oldest_block_number = self._highest_block_number - self._window
+        old_state_roots = tuple(
+            state_root
+            for state_root, block_number in self._state_block_numbers.items()
+            if block_number <= oldest_block_number
+        )
+        for state_root in old_state_roots:
+            del self._states[state_root]
+            del self._state_block_numbers[state_root]
+
+    def __len__(self) -> int:
+        return len(self._states)
@@ -0,0 +1,73 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    TypeVar,
+)
+
+from pyformance import MetricsRegistry
+
+from trinity.components.builtin.metrics.service.noop import NOOP_METRICS_REGISTRY
+
+
+# Default number of threads for each RPC method that executes the EVM
+RPC_WORKER_THREADS = 2
+
+TReturn = TypeVar('TReturn')
+
+
+class RPCWorkerPool:
+    """
+    Run the EVM execution of expensive RPC methods (like ``eth_call``) in worker threads, so
+    that a slow one doesn't hold up the event loop and, with it, every other request.
+
+    Each method gets its own pool of ``max_workers`` threads, so a flood of requests to one
+    method can only queue up behind each other. The number of calls waiting for or running
+    in each pool is reported in the ``trinity.rpc/{method}/pending.counter`` metric, and the
+    time they take in ``trinity.rpc/{method}/worker_latency.histogram``.
+    """
+
+    def __init__(self,
+                 max_workers: int = RPC_WORKER_THREADS,
+                 metrics_registry: MetricsRegistry = NOOP_METRICS_REGISTRY) -> None:
+        self._max_workers = max_workers
+        self._metrics_registry = metrics_registry
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+
+    def _get_executor(self, method_name: str) -> ThreadPoolExecutor:
+        try:
+            return self._executors[method_name]
+        except KeyError:
+            executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix=f'rpc-{method_name}',
+            )
+            self._executors[method_name] = executor
+            return executor
+
+    async def run(self,
+                  method_name: str,
+                  func: Callable[..., TReturn],
+                  *args: Any) -> TReturn:
+        executor = self._get_executor(method_name)
+        pending = self._metrics_registry.counter(f'trinity.rpc/{method_name}/pending.counter')
+        latency = self._metrics_registry.histogram(
+            f'trinity.rpc/{method_name}/worker_latency.histogram'
+        )
+
+        loop = asyncio.get_event_loop()
+        pending.inc()
+        start_at = time.perf_counter()
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        finally:
+            pending.dec()
+            latency.add((time.perf_counter() - start_at) * 1000)
+
+    def shutdown(self) -> None:
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+        self._executors.clear()
@@ -46,6 +46,12 @@ NON_IDEAL_RESPONSE_PENALTY = 2.0
 #   block. 1500 / 4000 ~= 0.4
 MAX_ACCEPTABLE_WAIT_FOR_URGENT_NODE = 0.4
 
+# How many trie node hashes should the beam downloader remember as being present
+#   in the database? Checking the in-memory cache first avoids a round trip to the
+#   database process for nodes that were just stored, or were recently checked.
+#   Roughly sized to hold several blocks' worth of newly downloaded nodes.
+RECENTLY_PRESENT_NODES_CACHE_SIZE = 32768
+
 # How long before the block importer gives up on waiting for a missing trie
 #   node, and reissues the event to request it again.
 BLOCK_IMPORT_MISSING_STATE_TIMEOUT = 600
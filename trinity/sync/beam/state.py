@@ -21,6 +21,8 @@ from async_service import Service
 
 from lahja import EndpointAPI
 
+from lru import LRU
+
 from eth_hash.auto import keccak
 from eth_utils import (
     clamp,
@@ -48,6 +50,7 @@ from trie.exceptions import MissingTrieNode
 from trinity._utils.datastructures import TaskQueue
 from trinity._utils.logging import get_logger
 from trinity._utils.timer import Timer
+from trinity.db.manager import exists_many
 from trinity.protocol.common.typing import (
     NodeDataBundles,
 )
@@ -67,6 +70,7 @@ from trinity.sync.beam.constants import (
     ESTIMATED_BEAMABLE_SECONDS,
     MAX_ACCEPTABLE_WAIT_FOR_URGENT_NODE,
     NON_IDEAL_RESPONSE_PENALTY,
+    RECENTLY_PRESENT_NODES_CACHE_SIZE,
     REQUEST_BUFFER_MULTIPLIER,
     TOO_LONG_PREDICTIVE_PEER_DELAY,
 )
@@ -126,6 +130,11 @@ class BeamDownloader(Service, PeerSubscriber):
         self._trie_db = HexaryTrie(db)
         self._event_bus = event_bus
 
+        # Trie nodes are never deleted during beam sync, so once a node is known to be
+        #   present, we can skip asking the database about it again. This is especially
+        #   important when the database lives in another process.
+        self._recently_present_nodes = LRU(RECENTLY_PRESENT_NODES_CACHE_SIZE)
+
         # Track the needed node data that is urgent and important:
         buffer_size = MAX_STATE_FETCH * REQUEST_BUFFER_MULTIPLIER
         self._node_tasks = TaskQueue[Hash32](buffer_size, lambda task: 0)
@@ -206,14 +215,34 @@ class BeamDownloader(Service, PeerSubscriber):
         return max(0, max_factor)
 
     def _get_unique_missing_hashes(self, hashes: Iterable[Hash32]) -> Set[Hash32]:
-        return set(
-            node_hash for node_hash in hashes if node_hash not in self._db
-        )
+        _, missing_hashes = self._partition_present_hashes(hashes)
+        return missing_hashes
 
     def _get_unique_present_hashes(self, hashes: Iterable[Hash32]) -> Set[Hash32]:
-        return set(
-            node_hash for node_hash in hashes if node_hash in self._db
+        present_hashes, _ = self._partition_present_hashes(hashes)
+        return present_hashes
+
+    def _partition_present_hashes(
+            self,
+            hashes: Iterable[Hash32]) -> Tuple[Set[Hash32], Set[Hash32]]:
+        """
+        Split the given hashes into the ones present in the database and the ones missing.
+
+        Hashes that were recently seen are answered from memory, all the others are checked
+        against the database in a single batch.
+        """
+        unique_hashes = set(hashes)
+        present_hashes = set(
+            node_hash for node_hash in unique_hashes if node_hash in self._recently_present_nodes
         )
+        unknown_hashes = tuple(unique_hashes - present_hashes)
+        if unknown_hashes:
+            for node_hash, is_present in zip(unknown_hashes, exists_many(self._db, unknown_hashes)):
+                if is_present:
+                    present_hashes.add(node_hash)
+                    self._recently_present_nodes[node_hash] = True
+
+        return present_hashes, unique_hashes - present_hashes
 
     async def _wait_for_nodes(
             self,
@@ -710,9 +739,10 @@ class BeamDownloader(Service, PeerSubscriber):
         nodes are urgently-needed.
         """
 
+        missing_hashes = self._get_unique_missing_hashes(node_hash for node_hash, _ in nodes)
         new_nodes = tuple(
             (node_hash, node) for node_hash, node in nodes
-            if node_hash not in self._db
+            if node_hash in missing_hashes
         )
 
         if new_nodes:
@@ -721,16 +751,14 @@ class BeamDownloader(Service, PeerSubscriber):
                 for node_hash, node in new_nodes:
                     batch[node_hash] = node
 
+            for node_hash, _ in new_nodes:
+                self._recently_present_nodes[node_hash] = True
+
             # Don't bother checking if the nodes were found another way
             found_independent = False
         elif urgent:
             # Check if the nodes were found another way, if they are urgently needed
-            for requested_hash in node_hashes:
-                if requested_hash in self._db:
-                    found_independent = True
-                    break
-            else:
-                found_independent = False
+            found_independent = len(self._get_unique_present_hashes(node_hashes)) > 0
         else:
             # Don't bother checking if the nodes were found another way, if they are predictive
             found_independent = False
@@ -1,11 +1,17 @@
 from abc import ABC, abstractmethod
+import asyncio
+from concurrent.futures import Executor
 from typing import (
+    Dict,
     Tuple,
+    Type,
 )
 
 from eth.abc import BlockImportResult
 
 from eth_typing import (
+    Address,
+    BlockNumber,
     Hash32,
 )
 
@@ -14,8 +20,11 @@ from eth.abc import (
     BlockHeaderAPI,
     SignedTransactionAPI,
 )
+import rlp
 
 from trinity.chains.base import AsyncChainAPI
+from trinity.sync.common.constants import MAX_PENDING_SENDER_RECOVERIES
+from trinity._utils.logging import get_logger
 
 
 class BaseBlockImporter(ABC):
@@ -48,11 +57,138 @@ class BaseBlockImporter(ABC):
         pass
 
 
+def _recover_senders(
+        transaction_class: Type[SignedTransactionAPI],
+        encoded_transactions: Tuple[bytes, ...]) -> Tuple[Address, ...]:
+    """
+    Decode the transactions, check their signatures and recover the sender of each one. This is
+    meant to run in a worker process, so it takes and returns only plain, picklable values.
+
+    :raise ValidationError: if the signature of any transaction is invalid
+    """
+    transactions = tuple(
+        rlp.decode(encoded, sedes=transaction_class)
+        for encoded in encoded_transactions
+    )
+    for transaction in transactions:
+        transaction.check_signature_validity()
+    return tuple(transaction.sender for transaction in transactions)
+
+
+def _signature_already_checked() -> None:
+    """
+    Stand-in for the ``check_signature_validity()`` of a transaction whose signature was
+    already checked in a worker process.
+    """
+    pass
+
+
+def _discard_sender_recovery(recovery: 'asyncio.Future[Tuple[Address, ...]]') -> None:
+    """
+    Cancel a sender recovery whose result is not needed anymore. If it is already done, retrieve
+    its exception, so that a failed recovery doesn't get logged as never retrieved.
+    """
+    if not recovery.cancel() and not recovery.cancelled():
+        recovery.exception()
+
+
 class SimpleBlockImporter(BaseBlockImporter):
-    def __init__(self, chain: AsyncChainAPI) -> None:
+    """
+    Import blocks with full validation.
+
+    If a ``sender_recovery_executor`` is given (typically a process pool), the transaction
+    signatures of every previewed block are checked, and their senders recovered, in that
+    executor, while older blocks are still being imported. The recovered senders are attached to
+    the block's transactions right before it is imported, and their signatures marked as checked,
+    so the EVM doesn't need to recover or verify them serially. If any signature of a block is
+    invalid, nothing is attached, and the import validates all its signatures as usual.
+
+    Recoveries of blocks that are not imported, like blocks from a peer that was dropped, are
+    discarded once a block at or above their number gets imported, or once more than
+    ``MAX_PENDING_SENDER_RECOVERIES`` blocks are pending.
+    """
+    def __init__(
+            self,
+            chain: AsyncChainAPI,
+            sender_recovery_executor: Executor = None) -> None:
+        self.logger = get_logger('trinity.sync.common.chain.SimpleBlockImporter')
         self._chain = chain
+        self._sender_recovery_executor = sender_recovery_executor
+        # The sender recoveries of previewed blocks, and their block numbers, in preview order
+        self._pending_senders: Dict[
+            Hash32,
+            Tuple[BlockNumber, 'asyncio.Future[Tuple[Address, ...]]'],
+        ] = {}
 
     async def import_block(
             self,
             block: BlockAPI) -> BlockImportResult:
+        await self._attach_recovered_senders(block)
         return await self._chain.coro_import_block(block, perform_validation=True)
+
+    async def preview_transactions(
+            self,
+            header: BlockHeaderAPI,
+            transactions: Tuple[SignedTransactionAPI, ...],
+            parent_state_root: Hash32,
+            lagging: bool = True) -> None:
+
+        if self._sender_recovery_executor is None or not transactions:
+            return
+
+        if header.hash in self._pending_senders:
+            # The block was previewed before, replace its recovery
+            _, previous_recovery = self._pending_senders.pop(header.hash)
+            _discard_sender_recovery(previous_recovery)
+
+        recovery = asyncio.get_event_loop().run_in_executor(
+            self._sender_recovery_executor,
+            _recover_senders,
+            type(transactions[0]),
+            tuple(rlp.encode(transaction) for transaction in transactions),
+        )
+        self._pending_senders[header.hash] = (header.block_number, recovery)
+
+        while len(self._pending_senders) > MAX_PENDING_SENDER_RECOVERIES:
+            oldest_hash = next(iter(self._pending_senders))
+            _, oldest_recovery = self._pending_senders.pop(oldest_hash)
+            _discard_sender_recovery(oldest_recovery)
+
+    def _discard_stale_recoveries(self, block_number: BlockNumber) -> None:
+        """
+        Discard the recoveries of blocks at or below ``block_number``. Once a block at that height
+        is imported, they belong to blocks that were previewed but won't be imported.
+        """
+        stale_hashes = tuple(
+            block_hash
+            for block_hash, (pending_number, _) in self._pending_senders.items()
+            if pending_number <= block_number
+        )
+        for block_hash in stale_hashes:
+            _, recovery = self._pending_senders.pop(block_hash)
+            _discard_sender_recovery(recovery)
+
+    async def _attach_recovered_senders(self, block: BlockAPI) -> None:
+        pending = self._pending_senders.pop(block.hash, None)
+        self._discard_stale_recoveries(block.number)
+        if pending is None:
+            # block was not previewed, or has no transactions
+            return
+
+        _, recovery = pending
+
+        try:
+            senders = await recovery
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            # An invalid signature or a broken worker pool: leave the transactions alone, so
+            #   that the import checks them itself and raises the appropriate validation error.
+            self.logger.debug("Could not pre-recover senders of %s: %r", block, exc)
+            return
+
+        for transaction, sender in zip(block.transactions, senders):
+            # Populate the cached_property, as if the sender had been recovered locally
+            transaction.__dict__['sender'] = sender
+            # Skip checking the signature again when the transaction is validated during import
+            transaction.__dict__['check_signature_validity'] = _signature_already_checked
@@ -1,3 +1,5 @@
+import os
+
 # If a peer returns 0 results, wait this many seconds before asking it for anything else
 EMPTY_PEER_RESPONSE_PENALTY = 15.0
 
@@ -5,6 +7,17 @@ EMPTY_PEER_RESPONSE_PENALTY = 15.0
 # which covers about 6 days at 15s blocks
 MAX_SKELETON_REORG_DEPTH = 35000
 
+# How many skeleton strides (a skip request of parent headers, plus their children) to
+# request concurrently. Each stride spans ~37k blocks on a full response. All strides but
+# one need an idle witness peer to serve their parents, so only their children are requested
+# from the skeleton peer. Each stride has at most one request queued at the skeleton peer, which
+# only queues up to p2p.exchange.constants.NUM_QUEUED_REQUESTS of them at a time.
+MAX_SKELETON_STRIDES_IN_FLIGHT = 4
+
+# If a peer stalls or disagrees with the skeleton peer while serving skeleton headers,
+# don't ask it for skeleton headers again for this many seconds
+SKELETON_WITNESS_STALL_PENALTY = 60.0
+
 # The maximum number of headers that the backfill can sync in one uninterrupted stretch.
 # Depending on the lag, the job may get paused but will continue until the current stretch
 # has processed this number of headers.
@@ -46,3 +59,13 @@ BLOCK_IMPORT_QUEUE_SIZE = 75
 #   There is no point previewing more than that, because if we are that far behind,
 #   then we will pivot anyway. So we can try this setting until we identify I/O as the
 #   bottleneck.
+
+# How many worker processes recover transaction senders for upcoming blocks during
+#   regular sync, while earlier blocks are being imported. Signature recovery is
+#   CPU-bound, so it scales with cores, but leave one core for the import itself.
+SENDER_RECOVERY_PROCESSES = max(1, (os.cpu_count() or 2) - 1)
+
+# How many previewed blocks can have their senders recovered ahead of import at once. Previews
+#   only get about BLOCK_IMPORT_QUEUE_SIZE blocks ahead of import, so this only bounds the
+#   recoveries of blocks that were previewed but never imported, like after a peer switch.
+MAX_PENDING_SENDER_RECOVERIES = BLOCK_IMPORT_QUEUE_SIZE * 2
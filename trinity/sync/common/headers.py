@@ -1,23 +1,29 @@
 from abc import ABC, abstractmethod
 import asyncio
+from collections import deque
 from concurrent.futures import CancelledError
 import contextlib
 import functools
 from operator import attrgetter, itemgetter
-from random import randrange
+from random import choice, randrange
+import time
 from typing import (
     Any,
     AsyncIterator,
     Awaitable,
     Callable,
+    Deque,
+    Dict,
     FrozenSet,
     Generic,
     Iterable,
     Optional,
     Sequence,
+    Set,
     Tuple,
     Type,
     NamedTuple,
+    cast,
 )
 
 from async_service import Service, background_asyncio_service
@@ -50,8 +56,12 @@ from eth.exceptions import (
 from lahja import EndpointAPI
 
 from p2p.abc import CommandAPI
+from p2p.asyncio_utils import (
+    cleanup_tasks,
+    create_task,
+)
 from p2p.constants import SEAL_CHECK_RANDOM_SAMPLE_RATE
-from p2p.exceptions import BaseP2PError, PeerConnectionLost
+from p2p.exceptions import BaseP2PError, ConnectionBusy, PeerConnectionLost
 from p2p.logging import loggable
 from p2p.peer import BasePeer, PeerSubscriber
 from trinity._utils.timer import Timer
@@ -69,6 +79,8 @@ from trinity.sync.common.constants import (
     EMPTY_PEER_RESPONSE_PENALTY,
     HEADER_QUEUE_SIZE_TARGET,
     MAX_SKELETON_REORG_DEPTH,
+    MAX_SKELETON_STRIDES_IN_FLIGHT,
+    SKELETON_WITNESS_STALL_PENALTY,
 )
 from trinity.sync.common.events import SyncingRequest, SyncingResponse
 from trinity.sync.common.peers import TChainPeer, WaitingPeers
@@ -92,6 +104,9 @@ from trinity._utils.humanize import (
 from trinity._utils.logging import get_logger
 
 
+HeaderSegments = Tuple[Tuple[BlockHeaderAPI, ...], ...]
+
+
 # NOTE: This service should not be cancelled externally as doing so may cause queued headers
 # to get dropped on the floor.
 class SkeletonSyncer(Service, Generic[TChainPeer]):
@@ -102,11 +117,17 @@ class SkeletonSyncer(Service, Generic[TChainPeer]):
 
     _fetched_headers: 'asyncio.Queue[Tuple[BlockHeaderAPI, ...]]'
 
+    # Peers (other than the skeleton peer) that are currently serving a skeleton stride
+    _busy_witnesses: Set[TChainPeer]
+    # Peers that stalled or disagreed while serving a skeleton stride, and until when to skip them
+    _stalled_witnesses: Dict[TChainPeer, float]
+
     def __init__(self,
                  chain: AsyncChainAPI,
                  db: BaseAsyncHeaderDB,
                  peer: TChainPeer,
-                 launch_strategy: SyncLaunchStrategyAPI = None) -> None:
+                 launch_strategy: SyncLaunchStrategyAPI = None,
+                 peer_pool: BaseChainPeerPool = None) -> None:
         self.logger = get_logger('trinity.sync.common.headers.SkeletonSyncer')
         self._chain = chain
         self._db = db
@@ -118,6 +139,12 @@ class SkeletonSyncer(Service, Generic[TChainPeer]):
         max_pending_headers = peer.max_headers_fetch * 8
         self._fetched_headers = asyncio.Queue(max_pending_headers)
 
+        # If a peer pool is available, the other peers in it are used to cross-validate
+        # the skeleton, and to share the load of requesting it.
+        self._peer_pool = peer_pool
+        self._busy_witnesses = set()
+        self._stalled_witnesses = {}
+
     async def skeleton_segments(self) -> AsyncIterator[Tuple[BlockHeaderAPI, ...]]:
         while self.manager.is_running:
             yield await self._fetched_headers.get()
@@ -162,6 +189,11 @@ class SkeletonSyncer(Service, Generic[TChainPeer]):
         parent -> child -> [skip] ... [skip] -> parent -> child -> [skip] ... [skip] -> ...
 
         There are some exceptions where more than two headers are returned consecutively.
+
+        Strides of the skeleton (a full request of parents and their children) are emitted in
+        order, but each idle witness peer can serve the parents of one more stride concurrently,
+        up to MAX_SKELETON_STRIDES_IN_FLIGHT strides. Without witnesses, strides are requested
+        one at a time, since the skeleton peer only serves one header request at a time anyway.
         """
         peer = self.peer
 
@@ -169,66 +201,302 @@ class SkeletonSyncer(Service, Generic[TChainPeer]):
         launch_headers = await self._find_launch_headers(peer)
         self._fetched_headers.put_nowait(launch_headers)
         previous_tail_header = launch_headers[-1]
-        start_num = BlockNumber(previous_tail_header.block_number + self._skip_length)
-
-        while self.manager.is_running:
-            # get parents
-            parents = await self._fetch_headers_from(peer, start_num)
-            if not parents:
-                break
+        next_stride_start = BlockNumber(previous_tail_header.block_number + self._skip_length)
 
-            # get children
-            children = await self._fetch_headers_from(peer, BlockNumber(start_num + 1))
-            if not children:
-                break
+        # How far the start of the next stride is from the start of a stride with a full response
+        # from the peer: its parents are (skip_length + 1) blocks apart, and the next stride starts
+        # at (skip_length - 1) blocks after the child of its last parent.
+        stride_length = peer.max_headers_fetch * (self._skip_length + 1) - 1
 
-            # validate that parents and children match
-            pairs = tuple(zip(parents, children))
-            try:
-                validate_pair_coros = (
-                    self._chain.coro_validate_chain(parent, (child, ))
-                    for parent, child in pairs
-                )
-                await asyncio.gather(*validate_pair_coros)
-            except ValidationError as e:
-                self.logger.warning(
-                    "Received an invalid header pair from %s: %s",
+        pending_strides: Deque[Tuple[BlockNumber, 'asyncio.Task[HeaderSegments]']] = deque()
+        try:
+            while self.manager.is_running:
+                # keep the pipeline of stride requests full
+                while len(pending_strides) < MAX_SKELETON_STRIDES_IN_FLIGHT:
+                    witness = self._get_witness_peer()
+                    if witness is None and pending_strides:
+                        # only request strides ahead of time if another peer can serve them
+                        break
+                    stride_task = self._start_skeleton_stride(next_stride_start, witness)
+                    pending_strides.append((next_stride_start, stride_task))
+                    next_stride_start = BlockNumber(next_stride_start + stride_length)
+
+                _, stride_task = pending_strides.popleft()
+                segments = await stride_task
+                if not segments:
+                    break
+
+                previous_lead_header = segments[0][0]
+                previous_tail_header = segments[-1][-1]
+                self.logger.debug(
+                    "Got new header bones from %s: %s-%s",
                     peer,
-                    e,
+                    previous_lead_header,
+                    previous_tail_header,
                 )
-                raise
-
-            # select and validate a single random gap, to test that skeleton peer has meat headers
-            if len(pairs) >= 2:
-                # choose random gap to fill
-                gap_index = randrange(0, len(pairs) - 1)
-                segments = await self._fill_in_gap(peer, pairs, gap_index)
-                if len(segments) == 0:
-                    raise ValidationError(
-                        "Unexpected - filling in gap silently returned no headers"
-                    )
-            else:
-                segments = pairs
+                # load all headers, pausing when buffer is full
+                for segment in segments:
+                    if len(segment) > 0:
+                        await self._fetched_headers.put(segment)
+                    else:
+                        raise ValidationError(f"Found empty header segment in {segments}")
+
+                # prepare for the next request
+                expected_start = BlockNumber(
+                    previous_tail_header.block_number + self._skip_length - 1
+                )
+                if pending_strides and pending_strides[0][0] != expected_start:
+                    # The stride was shorter than a full response, so the strides that were
+                    # requested ahead of it don't line up. Drop them, and restart from here.
+                    await self._cancel_strides(pending_strides)
+                    next_stride_start = expected_start
+                elif not pending_strides:
+                    next_stride_start = expected_start
+        finally:
+            await self._cancel_strides(pending_strides)
+
+        await self._get_final_headers(peer, previous_tail_header)
+
+    async def _cancel_strides(
+            self,
+            pending_strides: Deque[Tuple[BlockNumber, 'asyncio.Task[HeaderSegments]']]) -> None:
+        if pending_strides:
+            async with cleanup_tasks(*(task for _, task in pending_strides)):
+                pending_strides.clear()
 
-            previous_lead_header = segments[0][0]
-            previous_tail_header = segments[-1][-1]
+    def _start_skeleton_stride(
+            self,
+            start_num: BlockNumber,
+            witness: Optional[TChainPeer]) -> 'asyncio.Task[HeaderSegments]':
+        """
+        Start fetching one stride of the skeleton, with the parents served by the given witness
+        if there is one. The witness is reserved for the stride until the task is done.
+        """
+        if witness is None:
+            stride_coro = self._fetch_skeleton_stride(start_num)
+        else:
+            self._busy_witnesses.add(witness)
+            stride_coro = self._fetch_witnessed_skeleton_stride(start_num, witness)
+
+        stride_task = create_task(
+            stride_coro,
+            name=f"SkeletonSyncer._fetch_skeleton_stride({start_num})",
+        )
+        if witness is not None:
+            # Not in a finally clause of the stride, which doesn't run if the task is cancelled
+            # before it starts.
+            stride_task.add_done_callback(lambda _: self._busy_witnesses.discard(witness))
+        return stride_task
+
+    async def _fetch_witnessed_skeleton_stride(
+            self,
+            start_num: BlockNumber,
+            witness: TChainPeer) -> HeaderSegments:
+        """
+        Fetch one stride of the skeleton with the parents and the filled gap served by a witness
+        peer, and only the children by the skeleton peer. Every pair links a witness header to a
+        skeleton peer header, so the two peers cross-validate each other on all skeleton points.
+
+        If the witness stalls, is busy, returns less than a full response, or disagrees with the
+        skeleton peer, fall back to fetching the stride from the skeleton peer immediately.
+        """
+        witness_segments = await self._try_witnessed_skeleton_stride(start_num, witness)
+        if witness_segments is None:
+            return await self._fetch_skeleton_stride(start_num)
+        else:
+            return witness_segments
+
+    async def _try_witnessed_skeleton_stride(
+            self,
+            start_num: BlockNumber,
+            witness: TChainPeer) -> Optional[HeaderSegments]:
+        """
+        :return: the header segments of the stride, or None if the witness couldn't serve it
+        """
+        # Only a full response lines up with the strides that are requested after this one
+        full_response = self.peer.max_headers_fetch
+        parents = await self._fetch_witness_headers(witness, start_num, full_response)
+        if len(parents) != full_response:
             self.logger.debug(
-                "Got new header bones from %s: %s-%s",
-                peer,
-                previous_lead_header,
-                previous_tail_header,
+                "Witness %s returned %d/%d skeleton parents at #%d, falling back to %s",
+                witness,
+                len(parents),
+                full_response,
+                start_num,
+                self.peer,
             )
-            # load all headers, pausing when buffer is full
-            for segment in segments:
-                if len(segment) > 0:
-                    await self._fetched_headers.put(segment)
+            self._stall_witness(witness)
+            return None
+
+        children = await self._fetch_headers_from(self.peer, BlockNumber(start_num + 1))
+        if len(children) != len(parents):
+            # The skeleton peer defines the chain to sync, even if the witness has more of it
+            return None
+
+        pairs = tuple(zip(parents, children))
+        try:
+            await self._validate_skeleton_pairs(pairs)
+        except ValidationError as exc:
+            self.logger.debug(
+                "Skeleton parents from %s disagree with children from %s: %s",
+                witness,
+                self.peer,
+                exc,
+            )
+            self._stall_witness(witness)
+            return None
+
+        # validate that the witness has meat headers in a random gap
+        gap_index = randrange(0, len(pairs) - 1)
+        try:
+            return await self._fill_in_gap(witness, pairs, gap_index)
+        except (ValidationError, ConnectionBusy) as exc:
+            self.logger.debug("Witness %s could not fill skeleton gap: %r", witness, exc)
+            self._stall_witness(witness)
+            return None
+
+    async def _fetch_skeleton_stride(self, start_num: BlockNumber) -> HeaderSegments:
+        """
+        Fetch one stride of the skeleton from the skeleton peer: header pairs starting at
+        ``start_num``, with one of the gaps between them filled in.
+
+        When possible, the children are requested from another peer, which cross-validates
+        the skeleton points.
+
+        :return: the header segments, or an empty tuple if the skeleton peer is out of headers
+        """
+        peer = self.peer
+
+        # get parents
+        parents = await self._fetch_headers_from(peer, start_num)
+        if not parents:
+            return ()
+
+        # get children
+        pairs = await self._fetch_skeleton_children(parents)
+        if not pairs:
+            return ()
+
+        # select and validate a single random gap, to test that skeleton peer has meat headers
+        if len(pairs) >= 2:
+            # choose random gap to fill
+            gap_index = randrange(0, len(pairs) - 1)
+            segments = await self._fill_in_gap(peer, pairs, gap_index)
+            if len(segments) == 0:
+                raise ValidationError(
+                    "Unexpected - filling in gap silently returned no headers"
+                )
+            return segments
+        else:
+            return pairs
+
+    async def _fetch_skeleton_children(self, parents: Tuple[BlockHeaderAPI, ...]) -> HeaderSegments:
+        """
+        Get the children of the skeleton parents, preferably from a witness peer. If the witness
+        stalls, or disagrees with the skeleton peer, fall back to the skeleton peer immediately.
+
+        :return: validated (parent, child) pairs, or an empty tuple if no children were returned
+        """
+        children_start = BlockNumber(parents[0].block_number + 1)
+        witness = self._get_witness_peer()
+        if witness is not None:
+            self._busy_witnesses.add(witness)
+            try:
+                witness_children = await self._fetch_witness_headers(witness, children_start)
+            finally:
+                self._busy_witnesses.discard(witness)
+
+            if len(witness_children) != len(parents):
+                self.logger.debug(
+                    "Witness %s returned %d/%d skeleton children at #%d, falling back to %s",
+                    witness,
+                    len(witness_children),
+                    len(parents),
+                    children_start,
+                    self.peer,
+                )
+                self._stall_witness(witness)
+            else:
+                pairs = tuple(zip(parents, witness_children))
+                try:
+                    await self._validate_skeleton_pairs(pairs)
+                except ValidationError as exc:
+                    self.logger.debug(
+                        "Skeleton children from %s disagree with parents from %s: %s",
+                        witness,
+                        self.peer,
+                        exc,
+                    )
+                    self._stall_witness(witness)
                 else:
-                    raise ValidationError(f"Found empty header segment in {segments}")
+                    return pairs
 
-            # prepare for the next request
-            start_num = BlockNumber(previous_tail_header.block_number + self._skip_length - 1)
+        children = await self._fetch_headers_from(self.peer, children_start)
+        if not children:
+            return ()
 
-        await self._get_final_headers(peer, previous_tail_header)
+        # validate that parents and children match
+        pairs = tuple(zip(parents, children))
+        try:
+            await self._validate_skeleton_pairs(pairs)
+        except ValidationError as e:
+            self.logger.warning(
+                "Received an invalid header pair from %s: %s",
+                self.peer,
+                e,
+            )
+            raise
+        else:
+            return pairs
+
+    async def _validate_skeleton_pairs(self, pairs: HeaderSegments) -> None:
+        for parent, child in pairs:
+            if child.parent_hash != parent.hash:
+                raise ValidationError(f"Skeleton child {child} is not a child of {parent}")
+
+        validate_pair_coros = (
+            self._chain.coro_validate_chain(parent, (child, ))
+            for parent, child in pairs
+        )
+        await asyncio.gather(*validate_pair_coros)
+
+    async def _fetch_witness_headers(
+            self,
+            witness: TChainPeer,
+            start_at: BlockNumber,
+            max_headers: int = None) -> Tuple[BlockHeaderAPI, ...]:
+        """
+        Fetch skeleton headers from a witness, which may be busy serving other header requests,
+        like the ones of the HeaderMeatSyncer. If so, treat it like a timeout.
+        """
+        try:
+            return await self._fetch_headers_from(witness, start_at, max_headers)
+        except ConnectionBusy:
+            self.logger.debug("Witness %s is busy with other header requests", witness)
+            return tuple()
+
+    def _get_witness_peer(self) -> Optional[TChainPeer]:
+        """
+        Pick an idle peer, other than the skeleton peer, to request skeleton headers from.
+        """
+        if self._peer_pool is None:
+            return None
+
+        now = time.monotonic()
+        candidates = tuple(
+            peer for peer in self._peer_pool.connected_nodes.values()
+            if peer is not self.peer
+            and peer.is_alive
+            and peer not in self._busy_witnesses
+            and self._stalled_witnesses.get(peer, 0) <= now
+        )
+        if candidates:
+            return cast(TChainPeer, choice(candidates))
+        else:
+            return None
+
+    def _stall_witness(self, peer: TChainPeer) -> None:
+        self._stalled_witnesses[peer] = time.monotonic() + SKELETON_WITNESS_STALL_PENALTY
 
     async def _get_final_headers(self,
                                  peer: TChainPeer,
@@ -367,8 +635,8 @@ class SkeletonSyncer(Service, Generic[TChainPeer]):
     async def _fill_in_gap(
             self,
             peer: TChainPeer,
-            pairs: Tuple[Tuple[BlockHeaderAPI, ...], ...],
-            gap_index: int) -> Tuple[Tuple[BlockHeaderAPI, ...], ...]:
+            pairs: HeaderSegments,
+            gap_index: int) -> HeaderSegments:
         """
         Fill headers into the specified gap in the middle of the header pairs using supplied peer.
         Validate the returned segment of headers against the surrounding header pairs.
@@ -986,6 +1254,7 @@ class BaseHeaderChainSyncer(Service, HeaderSyncerAPI, Generic[TChainPeer]):
             self._db,
             peer,
             self._launch_strategy,
+            self._peer_pool,
         )
         async with background_asyncio_service(self._skeleton):
             try:
@@ -1,10 +1,11 @@
 import asyncio
-from concurrent.futures import CancelledError
+from concurrent.futures import CancelledError, ProcessPoolExecutor
 import datetime
 import enum
 from functools import (
     partial,
 )
+import multiprocessing
 from operator import attrgetter
 import time
 from typing import (
@@ -78,6 +79,7 @@ from trinity.sync.common.constants import (
     EMPTY_PEER_RESPONSE_PENALTY,
     HEADER_QUEUE_SIZE_TARGET,
     PREDICTED_BLOCK_TIME,
+    SENDER_RECOVERY_PROCESSES,
 )
 from trinity.sync.common.headers import HeaderSyncerAPI
 from trinity.sync.common.peers import WaitingPeers
@@ -734,30 +736,35 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
         """
         Persist blocks for the given headers, directly to the database
 
+        Block bodies and receipts were already written out of order, as soon as they were
+        validated. All that is left is to link the blocks into the canonical chain, which is
+        done for all the given headers in a single atomic write.
+
         :param headers: headers for which block bodies and receipts have been downloaded
         """
-        for header in headers:
-            vm_class = self.chain.get_vm_class(header)
-            block_class = vm_class.get_block_class()
+        blocks = tuple(self._header_to_persistable_block(header) for header in headers)
+        await self.db.coro_persist_blocks(blocks)
+        for block in blocks:
+            self.tracker.record_transactions(len(block.transactions))
+        self.tracker.set_latest_head(headers[-1])
 
-            if _is_body_empty(header):
-                transactions: List[SignedTransactionAPI] = []
-                uncles: List[BlockHeaderAPI] = []
-            else:
-                body = self._pending_bodies.pop(header)
-                uncles = body.uncles
+    def _header_to_persistable_block(self, header: BlockHeaderAPI) -> BlockAPI:
+        vm_class = self.chain.get_vm_class(header)
+        block_class = vm_class.get_block_class()
 
-                # transaction data was already persisted in _block_body_bundle_processing, but
-                # we need to include the transactions for them to be added to the hash->txn lookup
-                tx_class = block_class.get_transaction_class()
-                transactions = [tx_class.from_base_transaction(tx) for tx in body.transactions]
+        if _is_body_empty(header):
+            transactions: List[SignedTransactionAPI] = []
+            uncles: List[BlockHeaderAPI] = []
+        else:
+            body = self._pending_bodies.pop(header)
+            uncles = body.uncles
 
-                # record progress in the tracker
-                self.tracker.record_transactions(len(transactions))
+            # transaction data was already persisted in _block_body_bundle_processing, but
+            # we need to include the transactions for them to be added to the hash->txn lookup
+            tx_class = block_class.get_transaction_class()
+            transactions = [tx_class.from_base_transaction(tx) for tx in body.transactions]
 
-            block = block_class(header, transactions, uncles)
-            await self.db.coro_persist_block(block)
-            self.tracker.set_latest_head(header)
+        return block_class(header, transactions, uncles)
 
     async def _assign_receipt_download_to_peers(self) -> None:
         """
@@ -824,9 +831,13 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
         """
         Fast sync writes all the block body bundle data directly to the database,
         in order to make it... fast.
+
+        The bodies don't depend on their parents being persisted, so they are all written
+        in a single batch, as soon as they arrive.
         """
-        for (_, (_, trie_data_dict), _) in bundles:
-            await self.db.coro_persist_trie_data_dict(trie_data_dict)
+        trie_data_dicts = tuple(trie_data_dict for (_, (_, trie_data_dict), _) in bundles)
+        if trie_data_dicts:
+            await self.db.coro_persist_trie_data_dict(merge(*trie_data_dicts))
 
     async def _process_receipts(
             self,
@@ -876,11 +887,10 @@ class FastChainBodySyncer(BaseBodyChainSyncer):
             return trivial_headers
 
         # process all of the returned receipts, storing their trie data
-        # dicts in the database
+        # dicts in the database, in a single batch
         receipts, trie_roots_and_data_dicts = zip(*receipt_bundles)
         receipt_roots, trie_data_dicts = zip(*trie_roots_and_data_dicts)
-        for trie_data in trie_data_dicts:
-            await self.db.coro_persist_trie_data_dict(trie_data)
+        await self.db.coro_persist_trie_data_dict(merge(*trie_data_dicts))
 
         # Identify which headers have the receipt roots that are now complete.
         completed_header_groups = tuple(
@@ -962,19 +972,28 @@ class RegularChainSyncer(Service):
                  db: BaseAsyncChainDB,
                  peer_pool: ETHPeerPool) -> None:
         self._header_syncer = ETHHeaderChainSyncer(chain, db, peer_pool)
+        # Worker processes are only started on the first submitted job. Use "spawn" so that
+        #   the workers don't inherit the threads and sockets of this process.
+        self._sender_recovery_executor = ProcessPoolExecutor(
+            max_workers=SENDER_RECOVERY_PROCESSES,
+            mp_context=multiprocessing.get_context('spawn'),
+        )
         self._body_syncer = RegularChainBodySyncer(
             chain,
             db,
             peer_pool,
             self._header_syncer,
-            SimpleBlockImporter(chain),
+            SimpleBlockImporter(chain, self._sender_recovery_executor),
         )
 
     async def run(self) -> None:
         self.manager.run_daemon_child_service(self._header_syncer)
         self.manager.run_daemon_child_service(self._body_syncer)
-        # run regular sync until cancelled
-        await self.manager.wait_finished()
+        try:
+            # run regular sync until cancelled
+            await self.manager.wait_finished()
+        finally:
+            self._sender_recovery_executor.shutdown(wait=False)
 
 
 @enum.unique
@@ -1090,9 +1109,6 @@ class RegularChainBodySyncer(BaseBodyChainSyncer):
             header = completed_headers[0]
             block = self._header_to_block(header)
 
-            # Put block in short queue for import, wait here if queue is full
-            await self._import_queue.put(block)
-
             # Load the state root of the parent header
             try:
                 parent_state_root = self._block_hash_to_state_root[header.parent_hash]
@@ -1106,12 +1122,18 @@ class RegularChainBodySyncer(BaseBodyChainSyncer):
             #   - look up the addresses referenced by the transaction (eg~ sender and recipient)
             #   - execute the block ahead of time to start collecting any missing state
             #   - store the header (for future evm execution that might look up old block hashes)
+            #   - start recovering the transaction senders
+            # This must happen before the block is queued: when the queue has room, the block
+            # can be imported right away, before the preview was even started.
             await self._block_importer.preview_transactions(
                 header,
                 block.transactions,
                 parent_state_root,
             )
 
+            # Put block in short queue for import, wait here if queue is full
+            await self._import_queue.put(block)
+
     async def _import_ready_blocks(self) -> None:
         """
         Wait for block bodies to be downloaded, then compile the blocks and
@@ -0,0 +1,71 @@
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from trinity.protocol.les.peer import LESPeer
+
+
+TRequest = TypeVar('TRequest')
+TResult = TypeVar('TResult')
+
+
+class _Batch(Generic[TRequest, TResult]):
+    def __init__(self) -> None:
+        self.requests: List[TRequest] = []
+        self.results: 'asyncio.Future[Sequence[TResult]]' = None
+
+
+class PeerRequestBatcher(Generic[TRequest, TResult]):
+    """
+    Merge the requests for a peer that are made during the same event loop iteration into
+    a single message, up to ``max_batch_size`` requests per message.
+
+    Requests are grouped by peer and by ``batch_key``. ``send_batch`` must send all the
+    requests to the peer in one message, and return one result per request, in order.
+    """
+
+    def __init__(
+            self,
+            send_batch: Callable[[LESPeer, Tuple[TRequest, ...]], Awaitable[Sequence[TResult]]],
+            max_batch_size: int) -> None:
+        self._send_batch = send_batch
+        self._max_batch_size = max_batch_size
+        self._open_batches: Dict[Tuple[LESPeer, Hashable], _Batch[TRequest, TResult]] = {}
+
+    async def request(self, peer: LESPeer, batch_key: Hashable, request: TRequest) -> TResult:
+        key = (peer, batch_key)
+        batch = self._open_batches.get(key)
+        if batch is None or len(batch.requests) >= self._max_batch_size:
+            batch = _Batch()
+            self._open_batches[key] = batch
+            batch.results = asyncio.ensure_future(self._send_when_ready(peer, key, batch))
+
+        index = len(batch.requests)
+        batch.requests.append(request)
+
+        # Other requesters in the batch must not be affected if this one is cancelled
+        results = await asyncio.shield(batch.results)
+        return results[index]
+
+    async def _send_when_ready(
+            self,
+            peer: LESPeer,
+            key: Tuple[LESPeer, Hashable],
+            batch: _Batch[TRequest, TResult]) -> Sequence[TResult]:
+
+        # Yield to the event loop once, so that other requests made at the same time can
+        # join the batch.
+        await asyncio.sleep(0)
+        if self._open_batches.get(key) is batch:
+            del self._open_batches[key]
+
+        return await self._send_batch(peer, tuple(batch.requests))
@@ -0,0 +1,107 @@
+import asyncio
+import collections
+from functools import (
+    partial,
+    wraps,
+)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Tuple,
+    TypeVar,
+)
+
+import rlp
+
+
+TFunc = TypeVar('TFunc', bound=Callable[..., Any])
+
+
+def rlp_size(value: Any) -> int:
+    return len(rlp.encode(value))
+
+
+class ByteSizedLRU:
+    """
+    A least-recently-used cache, bounded by the total size of its values rather than by
+    their number.
+    """
+
+    def __init__(self, max_bytes: int, get_size: Callable[[Any], int] = rlp_size) -> None:
+        self._max_bytes = max_bytes
+        self._get_size = get_size
+        self._entries: 'collections.OrderedDict[Hashable, Tuple[Any, int]]' = collections.OrderedDict()  # noqa: E501
+        self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value, _ = self._entries[key]
+        self._entries.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        size = self._get_size(value)
+        if key in self._entries:
+            self._remove(key)
+
+        if size > self._max_bytes:
+            # Caching this value would evict everything else, and still not fit
+            return
+
+        self._entries[key] = (value, size)
+        self._total_bytes += size
+        while self._total_bytes > self._max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def _remove(self, key: Hashable) -> None:
+        _, size = self._entries.pop(key)
+        self._total_bytes -= size
+
+
+def coalesce_and_cache(func: TFunc) -> TFunc:
+    """
+    Decorate a coroutine method of an object that has a ``_response_cache`` (like a
+    :class:`ByteSizedLRU`) and an ``_in_flight_requests`` dict.
+
+    Successful results are cached by the method name and arguments. Concurrent calls
+    with the same arguments share a single in-flight call, instead of each sending its own
+    request to a peer. Exceptions are not cached, so the next call retries.
+    """
+    @wraps(func)
+    async def wrapped(self: Any, *args: Hashable) -> Any:
+        key = (func.__name__,) + args
+        try:
+            return self._response_cache[key]
+        except KeyError:
+            pass
+
+        in_flight_requests: Dict[Hashable, 'asyncio.Future[Any]'] = self._in_flight_requests
+        try:
+            in_flight = in_flight_requests[key]
+        except KeyError:
+            in_flight = asyncio.ensure_future(func(self, *args))
+            in_flight_requests[key] = in_flight
+            in_flight.add_done_callback(partial(_finish_request, self, key))
+
+        # If one caller is cancelled, the request must keep going for the others
+        return await asyncio.shield(in_flight)
+
+    return wrapped  # type: ignore
+
+
+def _finish_request(obj: Any, key: Hashable, request: 'asyncio.Future[Any]') -> None:
+    del obj._in_flight_requests[key]
+    if not request.cancelled() and request.exception() is None:
+        obj._response_cache[key] = request.result()
@@ -0,0 +1,4 @@
+# How many bytes of (rlp-encoded) peer responses the LightPeerChain may keep in its cache.
+# Entries vary a lot in size, from a 100-byte account to a multi-megabyte block body, so
+# the cache is bounded by size rather than by the number of entries.
+LIGHT_PEER_CHAIN_CACHE_BYTES = 64 * 1024 * 1024
@@ -7,13 +7,17 @@ from functools import (
     partial,
     wraps,
 )
+import random
 from typing import (
     Any,
     Callable,
     cast,
+    Dict,
     List,
     FrozenSet,
+    Hashable,
     Optional,
+    Sequence,
     Tuple,
     Type,
 )
@@ -21,8 +25,6 @@ import weakref
 
 from async_service import Service, ServiceAPI
 
-from async_lru import alru_cache
-
 import rlp
 
 from eth_typing import (
@@ -35,6 +37,10 @@ from eth_hash.auto import keccak
 from eth_utils import (
     encode_hex,
 )
+from eth_utils.toolz import (
+    concat,
+    unique,
+)
 
 from trie import HexaryTrie
 from trie.exceptions import BadTrieProof
@@ -67,9 +73,31 @@ from p2p.disconnect import DisconnectReason
 from p2p.peer import PeerSubscriber
 
 from trinity.db.eth1.header import BaseAsyncHeaderDB
+from trinity.protocol.les.commands import (
+    GetBlockBodies,
+    GetBlockHeaders,
+    GetContractCodes,
+    GetProofsV2,
+    GetReceipts,
+    ProofsV1,
+    ProofsV2,
+)
+from trinity.protocol.les.constants import (
+    MAX_CODE_FETCH,
+    MAX_PROOFS_FETCH,
+)
+from trinity.protocol.les.payloads import (
+    ContractCodeRequest,
+    ProofRequest,
+)
 from trinity.protocol.les.peer import LESPeer, LESPeerPool
-from trinity.protocol.les.commands import ProofsV1, ProofsV2
 from trinity.rlp.block_body import BlockBody
+from trinity.sync.light.batching import PeerRequestBatcher
+from trinity.sync.light.cache import (
+    ByteSizedLRU,
+    coalesce_and_cache,
+)
+from trinity.sync.light.constants import LIGHT_PEER_CHAIN_CACHE_BYTES
 from trinity._utils.logging import get_logger
 
 
@@ -127,6 +155,14 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
         self.peer_pool = peer_pool
         self._pending_replies = weakref.WeakValueDictionary()
 
+        # Shared by all the coro_* methods, see coalesce_and_cache()
+        self._response_cache = ByteSizedLRU(LIGHT_PEER_CHAIN_CACHE_BYTES)
+        self._in_flight_requests: Dict[Hashable, 'asyncio.Future[Any]'] = {}
+
+        # Proof and code requests for the same peer and block are sent in a single message
+        self._proof_batcher = PeerRequestBatcher(self._send_proof_requests, MAX_PROOFS_FETCH)
+        self._code_batcher = PeerRequestBatcher(self._send_code_requests, MAX_CODE_FETCH)
+
     # TODO: be more specific about what messages we want.
     subscription_msg_types: FrozenSet[Type[CommandAPI[Any]]] = frozenset({BaseCommand})
 
@@ -153,7 +189,7 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
         self._pending_replies[request_id] = fut
         return await asyncio.wait_for(fut, timeout=self.reply_timeout)
 
-    @alru_cache(maxsize=1024, cache_exceptions=False)
+    @coalesce_and_cache
     @service_timeout(COMPLETION_TIMEOUT)
     async def coro_get_block_header_by_hash(self, block_hash: Hash32) -> BlockHeader:
         """
@@ -165,13 +201,14 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
         :raise asyncio.TimeoutError: if an individual request or the overall process times out
         """
         return await self._retry_on_bad_response(
-            partial(self._get_block_header_by_hash, block_hash)
+            partial(self._get_block_header_by_hash, block_hash),
+            (GetBlockHeaders, 1),
         )
 
-    @alru_cache(maxsize=1024, cache_exceptions=False)
+    @coalesce_and_cache
     @service_timeout(COMPLETION_TIMEOUT)
     async def coro_get_block_body_by_hash(self, block_hash: Hash32) -> BlockBody:
-        peer = cast(LESPeer, self.peer_pool.highest_td_peer)
+        peer = await self._select_peer((GetBlockBodies, 1))
         self.logger.debug("Fetching block %s from %s", encode_hex(block_hash), peer)
         request_id = peer.les_api.send_get_block_bodies([block_hash])
         block_bodies = await self._wait_for_reply(request_id)
@@ -181,10 +218,10 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
 
     # TODO add a get_receipts() method to BaseChain API, and dispatch to this, as needed
 
-    @alru_cache(maxsize=1024, cache_exceptions=False)
+    @coalesce_and_cache
     @service_timeout(COMPLETION_TIMEOUT)
     async def coro_get_receipts(self, block_hash: Hash32) -> List[Receipt]:
-        peer = cast(LESPeer, self.peer_pool.highest_td_peer)
+        peer = await self._select_peer((GetReceipts, 1))
         self.logger.debug("Fetching %s receipts from %s", encode_hex(block_hash), peer)
         request_id = peer.les_api.send_get_receipts((block_hash,))
         receipts = await self._wait_for_reply(request_id)
@@ -195,11 +232,14 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
     # TODO implement AccountDB exceptions that provide the info needed to
     # request accounts and code (and storage?)
 
-    @alru_cache(maxsize=1024, cache_exceptions=False)
+    @coalesce_and_cache
     @service_timeout(COMPLETION_TIMEOUT)
     async def coro_get_account(self, block_hash: Hash32, address: ETHAddress) -> Account:
         return await self._retry_on_bad_response(
-            partial(self._get_account_from_peer, block_hash, address)
+            partial(self._get_account_from_peer, block_hash, address),
+            # the account proof, and the header to verify it against
+            (GetProofsV2, 1),
+            (GetBlockHeaders, 1),
         )
 
     async def _get_account_from_peer(
@@ -219,7 +259,7 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
             ) from exc
         return rlp.decode(rlp_account, sedes=Account)
 
-    @alru_cache(maxsize=1024, cache_exceptions=False)
+    @coalesce_and_cache
     @service_timeout(COMPLETION_TIMEOUT)
     async def coro_get_contract_code(self, block_hash: Hash32, address: ETHAddress) -> bytes:
         """
@@ -243,7 +283,8 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
         code_hash = account.code_hash
 
         return await self._retry_on_bad_response(
-            partial(self._get_contract_code_from_peer, block_hash, address, code_hash)
+            partial(self._get_contract_code_from_peer, block_hash, address, code_hash),
+            (GetContractCodes, 1),
         )
 
     async def _get_contract_code_from_peer(
@@ -259,13 +300,8 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
             account's code hash
         """
         # request contract code
-        request_id = peer.les_api.send_get_contract_code(block_hash, keccak(address))
-        contract_codes = await self._wait_for_reply(request_id)
-
-        if not contract_codes.payload.codes:
-            bytecode = b''
-        else:
-            bytecode = contract_codes.payload.codes[0]
+        code_request = ContractCodeRequest(block_hash=block_hash, account=keccak(address))
+        bytecode = await self._code_batcher.request(peer, block_hash, code_request)
 
         # validate bytecode against a proven account
         if code_hash == keccak(bytecode):
@@ -367,32 +403,114 @@ class LightPeerChain(PeerSubscriber, Service, BaseLightPeerChain):
                          state_key: Hash32,
                          storage_key: Optional[Hash32],
                          from_level: int = 0) -> Tuple[bytes, ...]:
-        request_id = peer.les_api.send_get_proof(block_hash, state_key, storage_key, from_level)
+        proof_request = ProofRequest(
+            block_hash=block_hash,
+            storage_key=storage_key,
+            state_key=state_key,
+            from_level=from_level,
+        )
+        return await self._proof_batcher.request(peer, block_hash, proof_request)
+
+    async def _send_proof_requests(
+            self,
+            peer: LESPeer,
+            proof_requests: Tuple[ProofRequest, ...]) -> Sequence[Tuple[bytes, ...]]:
+        """
+        Request proofs for a batch of keys, all at the same block, in a single message.
+
+        Every requester gets all the returned trie nodes: a LES/2 peer merges the proofs into
+        a single list anyway, and the proof verification ignores nodes it doesn't need.
+        """
+        request_id = peer.les_api.send_get_proofs(*proof_requests)
         proofs = await self._wait_for_reply(request_id)
         if isinstance(proofs, ProofsV1):
-            if proofs.payload.proofs:
-                return proofs.payload.proofs[0]
-            else:
-                return ()
+            proof = tuple(unique(concat(proofs.payload.proofs)))
         elif isinstance(proofs, ProofsV2):
-            return proofs.payload.proof
+            proof = proofs.payload.proof
         else:
             raise Exception("Unreachable")
+        return (proof,) * len(proof_requests)
 
-    async def _retry_on_bad_response(self, make_request_to_peer: Callable[[LESPeer], Any]) -> Any:
+    async def _send_code_requests(
+            self,
+            peer: LESPeer,
+            code_requests: Tuple[ContractCodeRequest, ...]) -> Sequence[bytes]:
+        """
+        Request the code of a batch of accounts, all at the same block, in a single message.
+
+        A peer skips the requests for a block it doesn't have, and truncates the response
+        if it's too big, so codes that are missing at the end are returned as ``b''``.
+        """
+        request_id = peer.les_api.send_get_contract_codes(*code_requests)
+        contract_codes = await self._wait_for_reply(request_id)
+        codes = tuple(contract_codes.payload.codes)
+        return codes + (b'',) * (len(code_requests) - len(codes))
+
+    async def _select_peer(self, *requests: Tuple[Type[CommandAPI[Any]], int]) -> LESPeer:
+        """
+        Choose the peer to send the given requests to, and charge their cost to the peer's
+        flow control buffer.
+
+        Requests are spread across all peers with the highest total difficulty, picking the
+        one with the most buffer to spare. If none can afford the requests, wait until one
+        has recharged enough, rather than have the server throttle or disconnect us.
+
+        :param requests: pairs of request command type and number of requested items
+
+        :raise NoEligiblePeers: if no peers are available to fulfill the request
+        """
+        while True:
+            try:
+                candidates = list(cast(Tuple[LESPeer, ...], self.peer_pool.highest_td_peers))
+            except NoConnectedPeers as exc:
+                raise NoEligiblePeers() from exc
+
+            # Break ties (e.g. between peers without flow control) randomly
+            random.shuffle(candidates)
+            costs = {
+                peer: sum(
+                    peer.les_api.get_request_cost(command_type, num_items)
+                    for command_type, num_items in requests
+                )
+                for peer in candidates
+            }
+            affordable = tuple(
+                peer for peer in candidates
+                if peer.les_api.flow_control.can_afford(costs[peer])
+            )
+            if affordable:
+                peer = max(
+                    affordable,
+                    key=lambda peer: peer.les_api.flow_control.get_spare_ratio(costs[peer]),
+                )
+                peer.les_api.flow_control.spend(costs[peer])
+                return peer
+
+            wait = min(
+                peer.les_api.flow_control.seconds_until_affordable(costs[peer])
+                for peer in candidates
+            )
+            if wait == float('inf'):
+                raise NoEligiblePeers("No peer can ever afford to serve the request")
+
+            self.logger.debug("All peers' flow control buffers are depleted, waiting %.3fs", wait)
+            await asyncio.sleep(wait)
+
+    async def _retry_on_bad_response(
+            self,
+            make_request_to_peer: Callable[[LESPeer], Any],
+            *requests: Tuple[Type[CommandAPI[Any]], int]) -> Any:
         """
         Make a call to a peer. If it behaves badly, drop it and retry with a different peer.
 
         :param make_request_to_peer: an abstract call to a peer that may raise a BadLESResponse
+        :param requests: the requests made by the call, see :meth:`_select_peer`
 
         :raise NoEligiblePeers: if no peers are available to fulfill the request
         :raise asyncio.TimeoutError: if an individual request or the overall process times out
         """
         for _ in range(MAX_REQUEST_ATTEMPTS):
-            try:
-                peer = cast(LESPeer, self.peer_pool.highest_td_peer)
-            except NoConnectedPeers as exc:
-                raise NoEligiblePeers() from exc
+            peer = await self._select_peer(*requests)
 
             try:
                 return await make_request_to_peer(peer)